@@ -1,4 +1,5 @@
 import argparse
+import re
 from binascii import Error
 
 from eth_account import Account
@@ -80,3 +81,34 @@ def check_keccak256_hash(hex_str: str) -> HexBytes:
             f"{hex_str} is not a valid keccak256 hash hexadecimal string"
         )
     return hex_str_bytes
+
+
+def check_hex_pattern(pattern: str) -> str:
+    """
+    Hexadecimal pattern validator for Argparse. Odd length is allowed
+
+    :param pattern:
+    :return: Lowercase pattern without `0x`
+    """
+    pattern = pattern.lower().removeprefix("0x")
+    if not re.fullmatch("[0-9a-f]{0,40}", pattern):
+        raise argparse.ArgumentTypeError(
+            f"{pattern} is not a valid hexadecimal address pattern"
+        )
+    return pattern
+
+
+def check_regex(regex: str) -> str:
+    """
+    Regular expression validator for Argparse
+
+    :param regex:
+    :return: Regular expression
+    """
+    try:
+        re.compile(regex)
+    except re.error as e:
+        raise argparse.ArgumentTypeError(
+            f"{regex} is not a valid regular expression: {e}"
+        ) from None
+    return regex
@@ -0,0 +1,124 @@
+"""
+Retrieve transactions from the Safe Transaction Service with `aiohttp`, so several of
+them are requested concurrently on one keep-alive session. Requests use the
+configuration of the wrapped `TransactionServiceApi`, and responses are parsed like
+the synchronous requests of `tx_service_http`.
+"""
+
+import asyncio
+from collections.abc import Sequence
+from typing import Any
+
+import aiohttp
+from hexbytes import HexBytes
+from safe_eth.safe import SafeTx
+from safe_eth.safe.api import SafeAPIException, TransactionServiceApi
+from safe_eth.util.http import build_full_url
+from safe_eth.util.util import to_0x_hex_str
+
+from .safe_tx_fetcher import collect_safe_tx_results
+from .tx_service_http import build_safe_tx, get_tx_service_headers
+
+ASYNC_TX_SERVICE_MAX_CONCURRENCY = 10  # Requests in flight at the same time
+
+
+class AsyncTransactionServiceApi:
+    def __init__(
+        self,
+        transaction_service_api: TransactionServiceApi,
+        max_concurrency: int = ASYNC_TX_SERVICE_MAX_CONCURRENCY,
+    ):
+        """
+        :param transaction_service_api: Client with the configuration of the requests
+        :param max_concurrency: Requests in flight at the same time
+        """
+        self.transaction_service_api = transaction_service_api
+        self.max_concurrency = max_concurrency
+        self._session: aiohttp.ClientSession | None = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        # Session must be created inside the event loop using it
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=get_tx_service_headers(self.transaction_service_api),
+                timeout=aiohttp.ClientTimeout(
+                    total=self.transaction_service_api.request_timeout
+                ),
+            )
+        return self._session
+
+    async def _get_request(self, url: str) -> tuple[int, Any]:
+        """
+        :param url: Path of the endpoint
+        :return: Status code and JSON body (raw text if it is not JSON)
+        """
+        session = await self._get_session()
+        async with session.get(
+            build_full_url(self.transaction_service_api.base_url, url)
+        ) as response:
+            try:
+                return response.status, await response.json()
+            except (aiohttp.ContentTypeError, ValueError):
+                return response.status, await response.text()
+
+    async def get_safe_transaction(
+        self, safe_tx_hash: bytes | str
+    ) -> tuple[SafeTx, HexBytes | None]:
+        """
+        :param safe_tx_hash:
+        :return: SafeTx and `tx-hash` if transaction was executed
+        :raises: SafeAPIException
+        """
+        safe_tx_hash_str = to_0x_hex_str(HexBytes(safe_tx_hash))
+        try:
+            status, result = await self._get_request(
+                f"/api/v2/multisig-transactions/{safe_tx_hash_str}/"
+            )
+        except (TimeoutError, aiohttp.ClientError) as e:
+            raise SafeAPIException(
+                f"Cannot get transaction with safe-tx-hash={safe_tx_hash_str}: {e}"
+            ) from e
+        if status != 200:
+            raise SafeAPIException(
+                f"Cannot get transaction with safe-tx-hash={safe_tx_hash_str}: {result!r}"
+            )
+        safe_tx = build_safe_tx(
+            self.transaction_service_api.ethereum_client,
+            self.transaction_service_api.network.value,
+            safe_tx_hash,
+            result,
+        )
+        tx_hash = result["transactionHash"]
+        return safe_tx, HexBytes(tx_hash) if tx_hash else None
+
+    async def get_safe_transactions(
+        self, safe_tx_hashes: Sequence[bytes | str]
+    ) -> list[tuple[SafeTx, HexBytes | None]]:
+        """
+        Retrieve all the transactions concurrently, up to `max_concurrency` at once
+
+        :param safe_tx_hashes:
+        :return: SafeTx and `tx-hash` for every `safe_tx_hash`, in the same order
+        :raises: SafeTxFetchException with every `safe-tx-hash` that failed
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def get_safe_transaction(safe_tx_hash: bytes | str):
+            async with semaphore:
+                return await self.get_safe_transaction(safe_tx_hash)
+
+        return collect_safe_tx_results(
+            safe_tx_hashes,
+            await asyncio.gather(
+                *(
+                    get_safe_transaction(safe_tx_hash)
+                    for safe_tx_hash in safe_tx_hashes
+                ),
+                return_exceptions=True,
+            ),
+        )
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
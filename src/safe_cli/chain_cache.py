@@ -0,0 +1,266 @@
+"""
+Persistent cache for facts that never change for a chain, like the resolved addresses of
+the Safe contracts, the version of a master copy or the proxy creation code of a Proxy
+Factory, so they are not requested to the node on every run.
+
+Cache is stored as a JSON file on `$SAFE_CLI_CACHE_DIR` if defined, otherwise on
+`$XDG_CACHE_HOME/safe-cli` (`~/.cache/safe-cli` by default). Node urls usually contain
+api keys, so only their hashes are stored.
+"""
+
+import hashlib
+import json
+import os
+from abc import ABC, abstractmethod
+from functools import cache
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlparse
+from weakref import WeakKeyDictionary
+
+from eth_typing import ChecksumAddress
+from hexbytes import HexBytes
+from safe_eth.eth import EthereumClient, EthereumNetwork
+from safe_eth.safe import ProxyFactory, Safe
+from safe_eth.util.util import to_0x_hex_str
+
+CACHE_VERSION = 2
+CACHE_FILE_NAME = "chain_cache.json"
+# Development nodes (ganache, hardhat, anvil) are restarted with different contracts
+# and reuse the same urls, so nothing is cached for them
+NOT_CACHED_CHAIN_IDS = frozenset({1337, 31337})
+NOT_CACHED_HOSTS = frozenset({"localhost", "127.0.0.1", "0.0.0.0", "::1"})
+
+# Chain id of every `EthereumClient`, so it is requested only once for every client
+_client_chain_ids: WeakKeyDictionary[EthereumClient, int] = WeakKeyDictionary()
+
+
+def get_cache_dir() -> Path:
+    if cache_dir := os.environ.get("SAFE_CLI_CACHE_DIR"):
+        return Path(cache_dir)
+    xdg_cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(xdg_cache_home) / "safe-cli"
+
+
+class JsonFileCache(ABC):
+    """
+    Cache stored as a JSON file. Cache is ignored if it was written by a different
+    version, defined by the `version` of `_empty`
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._data = self._load()
+
+    @abstractmethod
+    def _empty(self) -> dict[str, Any]:
+        """
+        :return: Data for an empty cache, including its `version`
+        """
+
+    def _load(self) -> dict[str, Any]:
+        empty = self._empty()
+        try:
+            with open(self.path) as cache_file:
+                data = json.load(cache_file)
+        except (OSError, ValueError):
+            return empty
+        if not isinstance(data, dict) or data.get("version") != empty["version"]:
+            return empty
+        return data
+
+    def _save(self) -> None:
+        """
+        Write the cache atomically. Cache is optional, so errors are ignored
+        """
+        tmp_path = self.path.with_suffix(".tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w") as cache_file:
+                json.dump(self._data, cache_file, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass
+
+
+class ChainCache(JsonFileCache):
+    """
+    Contract addresses, master copy versions and proxy creation codes keyed by chain id,
+    and chain id keyed by node url. Cache is ignored if it was written by a different
+    `CACHE_VERSION`.
+    """
+
+    def _empty(self) -> dict[str, Any]:
+        return {"version": CACHE_VERSION, "node_urls": {}, "chains": {}}
+
+    def _get_chain(self, chain_id: int) -> dict[str, dict[str, str]]:
+        return self._data["chains"].setdefault(
+            str(chain_id), {"addresses": {}, "master_copy_versions": {}}
+        )
+
+    @staticmethod
+    def is_cacheable_chain(chain_id: int) -> bool:
+        return chain_id not in NOT_CACHED_CHAIN_IDS
+
+    @staticmethod
+    def is_cacheable_node_url(node_url: str) -> bool:
+        return urlparse(node_url).hostname not in NOT_CACHED_HOSTS
+
+    @staticmethod
+    def _get_node_url_key(node_url: str) -> str:
+        return hashlib.sha256(node_url.encode()).hexdigest()
+
+    def get_chain_id(self, node_url: str) -> int | None:
+        if not self.is_cacheable_node_url(node_url):
+            return None
+        return self._data["node_urls"].get(self._get_node_url_key(node_url))
+
+    def set_chain_id(self, node_url: str, chain_id: int) -> None:
+        node_url_key = self._get_node_url_key(node_url)
+        if (
+            self.is_cacheable_node_url(node_url)
+            and self.is_cacheable_chain(chain_id)
+            and self._data["node_urls"].get(node_url_key) != chain_id
+        ):
+            self._data["node_urls"][node_url_key] = chain_id
+            self._save()
+
+    def get_address(self, chain_id: int, name: str) -> ChecksumAddress | None:
+        if not self.is_cacheable_chain(chain_id):
+            return None
+        return self._get_chain(chain_id)["addresses"].get(name)
+
+    def set_address(self, chain_id: int, name: str, address: ChecksumAddress) -> None:
+        if self.is_cacheable_chain(chain_id):
+            self._get_chain(chain_id)["addresses"][name] = address
+            self._save()
+
+    def get_master_copy_version(
+        self, chain_id: int, address: ChecksumAddress
+    ) -> str | None:
+        if not self.is_cacheable_chain(chain_id):
+            return None
+        return self._get_chain(chain_id)["master_copy_versions"].get(address)
+
+    def set_master_copy_version(
+        self, chain_id: int, address: ChecksumAddress, version: str
+    ) -> None:
+        if self.is_cacheable_chain(chain_id):
+            self._get_chain(chain_id)["master_copy_versions"][address] = version
+            self._save()
+
+    def get_proxy_creation_code(
+        self, chain_id: int, proxy_factory_address: ChecksumAddress
+    ) -> str | None:
+        if not self.is_cacheable_chain(chain_id):
+            return None
+        return (
+            self._get_chain(chain_id)
+            .get("proxy_creation_codes", {})
+            .get(proxy_factory_address)
+        )
+
+    def set_proxy_creation_code(
+        self, chain_id: int, proxy_factory_address: ChecksumAddress, code: str
+    ) -> None:
+        if self.is_cacheable_chain(chain_id):
+            self._get_chain(chain_id).setdefault("proxy_creation_codes", {})[
+                proxy_factory_address
+            ] = code
+            self._save()
+
+    def invalidate(self, chain_id: int | None = None) -> None:
+        """
+        :param chain_id: Only remove the entries for this chain. If not provided, the
+            whole cache is removed
+        """
+        if chain_id is None:
+            self._data = self._empty()
+        else:
+            self._data["chains"].pop(str(chain_id), None)
+            self._data["node_urls"] = {
+                node_url_key: node_chain_id
+                for node_url_key, node_chain_id in self._data["node_urls"].items()
+                if node_chain_id != chain_id
+            }
+        self._save()
+
+
+@cache
+def get_chain_cache() -> ChainCache:
+    return ChainCache(get_cache_dir() / CACHE_FILE_NAME)
+
+
+def set_chain_id(ethereum_client: EthereumClient, chain_id: int) -> None:
+    """
+    Store a chain id retrieved by other means, e.g. on a JSON-RPC batch request
+
+    :param ethereum_client:
+    :param chain_id:
+    """
+    _client_chain_ids[ethereum_client] = chain_id
+    get_chain_cache().set_chain_id(ethereum_client.w3.provider.endpoint_uri, chain_id)
+
+
+def get_chain_id(ethereum_client: EthereumClient) -> int:
+    """
+    :param ethereum_client:
+    :return: Chain id for the node, using the cache if the node url was seen before.
+        Chain id is only requested once for every `EthereumClient`
+    """
+    if (chain_id := _client_chain_ids.get(ethereum_client)) is None:
+        chain_id = (
+            get_chain_cache().get_chain_id(ethereum_client.w3.provider.endpoint_uri)
+            or ethereum_client.get_chain_id()
+        )
+        set_chain_id(ethereum_client, chain_id)
+    return chain_id
+
+
+def get_network(ethereum_client: EthereumClient) -> EthereumNetwork:
+    """
+    :param ethereum_client:
+    :return: Network for the chain id returned by `get_chain_id`
+    """
+    return EthereumNetwork(get_chain_id(ethereum_client))
+
+
+def get_master_copy_version(
+    ethereum_client: EthereumClient, master_copy_address: ChecksumAddress
+) -> str:
+    """
+    :param ethereum_client:
+    :param master_copy_address:
+    :return: Version of the master copy, using the cache if it was retrieved before
+    :raises BadFunctionCallOutput: If master copy is not deployed
+    """
+    chain_cache = get_chain_cache()
+    chain_id = get_chain_id(ethereum_client)
+    version = chain_cache.get_master_copy_version(chain_id, master_copy_address)
+    if not version:
+        version = Safe(master_copy_address, ethereum_client).retrieve_version()
+        chain_cache.set_master_copy_version(chain_id, master_copy_address, version)
+    return version
+
+
+def get_proxy_creation_code(
+    ethereum_client: EthereumClient, proxy_factory_address: ChecksumAddress
+) -> bytes:
+    """
+    :param ethereum_client:
+    :param proxy_factory_address:
+    :return: `proxyCreationCode()` of the Proxy Factory, using the cache if it was
+        retrieved before
+    :raises BadFunctionCallOutput: If Proxy Factory is not deployed
+    """
+    chain_cache = get_chain_cache()
+    chain_id = get_chain_id(ethereum_client)
+    code = chain_cache.get_proxy_creation_code(chain_id, proxy_factory_address)
+    if not code:
+        code = to_0x_hex_str(
+            ProxyFactory(
+                proxy_factory_address, ethereum_client
+            ).get_proxy_creation_code()
+        )
+        chain_cache.set_proxy_creation_code(chain_id, proxy_factory_address, code)
+    return bytes(HexBytes(code))
@@ -0,0 +1,308 @@
+"""
+Predict the `CREATE2` address of Safes deployed by the Proxy Factory without calling the
+node, and search salt nonces leading to vanity addresses. Addresses are calculated
+locally, so thousands of salt nonces can be checked every second.
+"""
+
+import re
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from os import cpu_count
+
+from eth_hash.auto import keccak
+from eth_typing import ChecksumAddress
+from eth_utils import to_checksum_address
+from hexbytes import HexBytes
+from safe_eth.eth import EthereumClient
+from safe_eth.eth.constants import NULL_ADDRESS
+from safe_eth.eth.contracts import get_safe_V1_4_1_contract
+from web3 import Web3
+
+from safe_cli.chain_cache import get_proxy_creation_code
+from safe_cli.safe_addresses import (
+    get_default_fallback_handler_address,
+    get_proxy_factory_address,
+    get_safe_l2_contract_address,
+)
+
+MAX_SALT_NONCE = 2**256
+VANITY_CHUNK_SIZE = 20_000
+
+
+def get_proxy_init_code_hash(
+    proxy_creation_code: bytes, master_copy: ChecksumAddress
+) -> bytes:
+    """
+    :param proxy_creation_code: `proxyCreationCode()` of the Proxy Factory
+    :param master_copy: Singleton used by the proxy
+    :return: Keccak of the init code used by the Proxy Factory for `CREATE2`
+    """
+    return keccak(
+        bytes(proxy_creation_code) + bytes(HexBytes(master_copy)).rjust(32, b"\0")
+    )
+
+
+def get_proxy_salt(initializer: bytes, salt_nonce: int) -> bytes:
+    """
+    :param initializer: Data used to call the proxy after deployment (Safe `setup`)
+    :param salt_nonce:
+    :return: Salt used by `createProxyWithNonce` for `CREATE2`
+    """
+    return keccak(keccak(bytes(initializer)) + salt_nonce.to_bytes(32, "big"))
+
+
+def calculate_create2_address(
+    deployer: ChecksumAddress, salt: bytes, init_code_hash: bytes
+) -> ChecksumAddress:
+    """
+    :param deployer: Contract calling `CREATE2`
+    :param salt:
+    :param init_code_hash: Keccak of the init code
+    :return: Address of the contract deployed using `CREATE2`
+    """
+    return to_checksum_address(
+        keccak(b"\xff" + bytes(HexBytes(deployer)) + salt + init_code_hash)[12:]
+    )
+
+
+class SafeAddressPredictor:
+    """
+    Predict the address of Safes deployed with `createProxyWithNonce` without calling
+    the node. Proxy init code hash is calculated only once, so it is cheap to predict
+    thousands of addresses for counterfactual deployments
+    """
+
+    def __init__(
+        self,
+        proxy_factory_address: ChecksumAddress,
+        proxy_creation_code: bytes,
+        master_copy: ChecksumAddress,
+        fallback_handler: ChecksumAddress = NULL_ADDRESS,
+    ):
+        """
+        :param proxy_factory_address:
+        :param proxy_creation_code: `proxyCreationCode()` of the Proxy Factory
+        :param master_copy: Safe singleton
+        :param fallback_handler: Fallback handler configured on `setup`
+        """
+        self.proxy_factory_address = proxy_factory_address
+        self.master_copy = master_copy
+        self.fallback_handler = fallback_handler
+        self.init_code_hash = get_proxy_init_code_hash(proxy_creation_code, master_copy)
+        self._safe_contract = get_safe_V1_4_1_contract(Web3())
+
+    @classmethod
+    def from_ethereum_client(
+        cls,
+        ethereum_client: EthereumClient,
+        proxy_factory_address: ChecksumAddress | None = None,
+        master_copy: ChecksumAddress | None = None,
+        fallback_handler: ChecksumAddress | None = None,
+    ) -> "SafeAddressPredictor":
+        """
+        Contracts not provided are resolved like in the rest of the cli. Addresses and
+        proxy creation code are stored on the chain cache, so the node is only queried
+        the first time for every chain
+
+        :return: Predictor for the chain of the `ethereum_client`
+        """
+        proxy_factory_address = proxy_factory_address or get_proxy_factory_address(
+            ethereum_client
+        )
+        return cls(
+            proxy_factory_address,
+            get_proxy_creation_code(ethereum_client, proxy_factory_address),
+            master_copy or get_safe_l2_contract_address(ethereum_client),
+            fallback_handler or get_default_fallback_handler_address(ethereum_client),
+        )
+
+    def get_initializer(self, owners: list[ChecksumAddress], threshold: int) -> bytes:
+        """
+        :return: Safe `setup` data without modules and payment
+        """
+        return bytes(
+            HexBytes(
+                self._safe_contract.encode_abi(
+                    "setup",
+                    args=[
+                        owners,
+                        threshold,
+                        NULL_ADDRESS,
+                        b"",
+                        self.fallback_handler,
+                        NULL_ADDRESS,
+                        0,
+                        NULL_ADDRESS,
+                    ],
+                )
+            )
+        )
+
+    def predict(
+        self, owners: list[ChecksumAddress], threshold: int, salt_nonce: int
+    ) -> ChecksumAddress:
+        """
+        :return: Address of the Safe deployed with `owners`, `threshold` and `salt_nonce`
+        """
+        return calculate_create2_address(
+            self.proxy_factory_address,
+            get_proxy_salt(self.get_initializer(owners, threshold), salt_nonce),
+            self.init_code_hash,
+        )
+
+
+def predict_safe_address(
+    ethereum_client: EthereumClient,
+    owners: list[ChecksumAddress],
+    threshold: int,
+    salt_nonce: int,
+) -> ChecksumAddress:
+    """
+    Predict the address of a Safe deployed with the default contracts of the chain.
+    Use `SafeAddressPredictor` to predict many addresses or to use custom contracts
+
+    :return: Address of the Safe deployed with `owners`, `threshold` and `salt_nonce`
+    """
+    return SafeAddressPredictor.from_ethereum_client(ethereum_client).predict(
+        owners, threshold, salt_nonce
+    )
+
+
+class VanityPattern:
+    """
+    Pattern for the vanity addresses. Every condition is checked case-insensitively
+    against the hexadecimal address without the `0x`
+    """
+
+    def __init__(
+        self, prefix: str = "", suffix: str = "", regex: str | None = None
+    ) -> None:
+        """
+        :param prefix: Hexadecimal prefix for the address, `0x` is optional
+        :param suffix: Hexadecimal suffix for the address
+        :param regex: Regular expression the address must match
+        """
+        self.prefix = prefix.lower().removeprefix("0x")
+        self.suffix = suffix.lower()
+        self.regex = regex
+
+    def get_matcher(self) -> Callable[[str], bool]:
+        """
+        :return: Function returning `True` when a lowercase hex address matches
+        """
+        prefix, suffix = self.prefix, self.suffix
+        search = re.compile(self.regex, re.IGNORECASE).search if self.regex else None
+
+        def matches(address: str) -> bool:
+            return (
+                address.startswith(prefix)
+                and address.endswith(suffix)
+                and (search is None or search(address) is not None)
+            )
+
+        return matches
+
+
+def _search_vanity_chunk(
+    deployer: bytes,
+    initializer_hash: bytes,
+    init_code_hash: bytes,
+    pattern: VanityPattern,
+    start: int,
+    size: int,
+) -> list[tuple[ChecksumAddress, int]]:
+    """
+    Hot loop of the vanity search. Constant prefix of the address preimage is built
+    once for the whole chunk
+
+    :return: List of `(address, salt nonce)` matching the `pattern`
+    """
+    matches = pattern.get_matcher()
+    address_prefix = b"\xff" + deployer
+    found = []
+    for salt_nonce in range(start, start + size):
+        salt_nonce %= MAX_SALT_NONCE
+        salt = keccak(initializer_hash + salt_nonce.to_bytes(32, "big"))
+        address_hex = keccak(address_prefix + salt + init_code_hash).hex()[24:]
+        if matches(address_hex):
+            found.append((to_checksum_address(address_hex), salt_nonce))
+    return found
+
+
+def search_vanity_addresses(
+    deployer: ChecksumAddress,
+    initializer: bytes,
+    init_code_hash: bytes,
+    pattern: VanityPattern,
+    start_salt_nonce: int = 0,
+    max_matches: int = 1,
+    max_workers: int | None = None,
+    chunk_size: int = VANITY_CHUNK_SIZE,
+    on_progress: Callable[[int, float], None] | None = None,
+) -> Iterator[tuple[ChecksumAddress, int]]:
+    """
+    Search salt nonces for `createProxyWithNonce` leading to an address matching the
+    `pattern`. Addresses are calculated locally, consecutive salt nonces are split in
+    chunks searched in parallel on a process pool
+
+    :param deployer: Proxy Factory address
+    :param initializer: Data used to call the proxy after deployment (Safe `setup`)
+    :param init_code_hash: Use `get_proxy_init_code_hash`
+    :param pattern:
+    :param start_salt_nonce: First salt nonce to check
+    :param max_matches: Stop after this number of addresses are found
+    :param max_workers: Number of processes. If `1`, search is done on the current
+        process. Number of CPUs is used by default
+    :param chunk_size: Number of salt nonces checked on every task
+    :param on_progress: Called after every chunk with the number of hashes checked
+        and the elapsed seconds
+    :return: Iterator of `(address, salt nonce)` found. On parallel searches
+        addresses are not returned in salt nonce order
+    """
+    args = (
+        bytes(HexBytes(deployer)),
+        keccak(bytes(initializer)),
+        init_code_hash,
+        pattern,
+    )
+    started = time.monotonic()
+    hashes = 0
+    found = 0
+
+    def report(chunk_matches: list[tuple[ChecksumAddress, int]]):
+        nonlocal hashes
+        hashes += chunk_size
+        if on_progress:
+            on_progress(hashes, time.monotonic() - started)
+        return chunk_matches[: max_matches - found]
+
+    next_start = start_salt_nonce
+    if max_workers == 1:
+        while found < max_matches:
+            for match in report(_search_vanity_chunk(*args, next_start, chunk_size)):
+                found += 1
+                yield match
+            next_start += chunk_size
+        return
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures: set[Future] = set()
+        try:
+            while found < max_matches:
+                # Keep every worker busy while results are processed
+                while len(futures) < 2 * (max_workers or cpu_count() or 1):
+                    futures.add(
+                        executor.submit(
+                            _search_vanity_chunk, *args, next_start, chunk_size
+                        )
+                    )
+                    next_start += chunk_size
+                done, futures = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    for match in report(future.result()):
+                        found += 1
+                        yield match
+        finally:
+            for future in futures:
+                future.cancel()
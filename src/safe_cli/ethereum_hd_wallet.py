@@ -1,9 +1,334 @@
+import hashlib
+import hmac
+from collections.abc import Collection, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
 from eth_account import Account
+from eth_account.hdaccount import seed_from_mnemonic
 from eth_account.signers.local import LocalAccount
+from eth_keys import keys
+from eth_keys.constants import SECPK1_N, SECPK1_P
 from eth_typing import ChecksumAddress
+from eth_utils import ValidationError
 
 ETHEREUM_DEFAULT_PATH = "m/44'/60'/0'/0/0"
 ETHEREUM_BASE_PATH = "m/44'/60'/0'/0"
+DEFAULT_GAP_LIMIT = 100
+# Derivation templates used by the wallets, `{i}` is replaced by the index
+BIP44_TEMPLATE = "m/44'/60'/0'/0/{i}"  # Metamask, Trezor
+LEDGER_LIVE_TEMPLATE = "m/44'/60'/{i}'/0/0"
+LEGACY_LEDGER_TEMPLATE = "m/44'/60'/0'/{i}"
+DISCOVERY_TEMPLATES = (BIP44_TEMPLATE, LEDGER_LIVE_TEMPLATE, LEGACY_LEDGER_TEMPLATE)
+DISCOVERY_CHUNK_SIZE = 50
+HARDENED_OFFSET = 2**31
+
+ExtendedKey = tuple[bytes, bytes]  # (private key, chain code)
+
+
+def _hmac_sha512(key: bytes, data: bytes) -> bytes:
+    return hmac.new(key, data, hashlib.sha512).digest()
+
+
+def parse_hd_path(hd_path: str) -> tuple[int, ...]:
+    """
+    :param hd_path: BIP32 Path, e.g. `m/44'/60'/0'`. Hardened indexes end with `'` or `H`
+    :return: Child indexes of the path, with `HARDENED_OFFSET` added for hardened ones
+    :raises: eth_utils.ValidationError
+    """
+    root, *nodes = hd_path.split("/")
+    if root not in ("m", "M"):
+        raise ValidationError(f'Path is not valid: "{hd_path}". Must start with "m"')
+    indexes = []
+    for node in nodes:
+        hardened = node.endswith(("'", "H"))
+        index = node[:-1] if hardened else node
+        if not index.isdigit() or int(index) >= HARDENED_OFFSET:
+            raise ValidationError(f'Path "{hd_path}" is not valid on node "{node}"')
+        indexes.append(int(index) + HARDENED_OFFSET * hardened)
+    return tuple(indexes)
+
+
+class EthereumHdWallet:
+    """
+    Hierarchical Deterministic Wallet (BIP32) from mnemonic words (BIP39).
+
+    The BIP39 seed (2048 rounds of PBKDF2) is computed only once, and the extended keys
+    of the parent paths are cached, so deriving many accounts for the same parent only
+    requires one derivation step per account instead of the whole path from the root.
+    """
+
+    def __init__(self, words: str, passphrase: str = ""):
+        """
+        :param words: Mnemonic words(BIP39)
+        :param passphrase: Optional BIP39 passphrase
+        :raises: eth_utils.ValidationError
+        """
+        self.seed = seed_from_mnemonic(words, passphrase)
+        self._set_master_key()
+
+    @classmethod
+    def from_seed(cls, seed: bytes) -> "EthereumHdWallet":
+        """
+        :param seed: BIP39 seed
+        :return: Wallet without stretching the mnemonic again
+        """
+        hd_wallet = cls.__new__(cls)
+        hd_wallet.seed = seed
+        hd_wallet._set_master_key()
+        return hd_wallet
+
+    def _set_master_key(self):
+        master_node = _hmac_sha512(b"Bitcoin seed", self.seed)
+        self._extended_keys: dict[tuple[int, ...], ExtendedKey] = {
+            (): (master_node[:32], master_node[32:])
+        }
+        # Compressed public keys of the parents, required to derive soft children
+        self._public_keys: dict[tuple[int, ...], bytes] = {}
+
+    def _derive_child(self, parent: tuple[int, ...], index: int) -> ExtendedKey:
+        """
+        BIP32 `CKDpriv`. Parent public key is reused for every soft child
+
+        :param parent: Path of the parent
+        :param index: Child index, hardened if `>= HARDENED_OFFSET`
+        :return: Extended key for the child
+        """
+        parent_key, parent_chain_code = self._extended_keys[parent]
+        if index >= HARDENED_OFFSET:
+            data = b"\x00" + parent_key
+        else:
+            if parent not in self._public_keys:
+                self._public_keys[parent] = keys.PrivateKey(
+                    parent_key
+                ).public_key.to_compressed_bytes()
+            data = self._public_keys[parent]
+        child = _hmac_sha512(parent_chain_code, data + index.to_bytes(4, "big"))
+        child_key = (
+            int.from_bytes(child[:32], "big") + int.from_bytes(parent_key, "big")
+        ) % SECPK1_N
+        if int.from_bytes(child[:32], "big") >= SECPK1_N or not child_key:
+            # Invalid key, BIP32 says to use the next index (< 2**-127 probability)
+            return self._derive_child(parent, index + 1)
+        return child_key.to_bytes(32, "big"), child[32:]
+
+    def _get_extended_key(self, path: tuple[int, ...]) -> ExtendedKey:
+        """
+        :param path: Indexes of a parent path
+        :return: Extended key for the path. It's cached, as it will be used to derive
+            several children
+        """
+        if path not in self._extended_keys:
+            self._get_extended_key(path[:-1])
+            self._extended_keys[path] = self._derive_child(path[:-1], path[-1])
+        return self._extended_keys[path]
+
+    def get_extended_key(self, hd_path: str) -> ExtendedKey:
+        """
+        :param hd_path: BIP32 Path, e.g. `m/44'/60'/0'`
+        :return: Tuple of private key and chain code for the path
+        :raises: eth_utils.ValidationError
+        """
+        return self._get_extended_key(parse_hd_path(hd_path))
+
+    def get_private_key(self, hd_path: str) -> bytes:
+        """
+        :param hd_path: BIP44 Path, e.g. `m/44'/60'/0'/0/0`
+        :return: Private key for the path
+        :raises: eth_utils.ValidationError
+        """
+        indexes = parse_hd_path(hd_path)
+        if not indexes:
+            return self._extended_keys[()][0]
+        self._get_extended_key(indexes[:-1])
+        return self._derive_child(indexes[:-1], indexes[-1])[0]
+
+    def get_account(self, hd_path: str = ETHEREUM_DEFAULT_PATH) -> LocalAccount:
+        """
+        :param hd_path: BIP44 Path. By default Ethereum with 0 index is used
+        :return: Ethereum Account
+        :raises: eth_utils.ValidationError
+        """
+        return Account.from_key(self.get_private_key(hd_path))
+
+    def iter_addresses(
+        self, base_path: str = ETHEREUM_BASE_PATH, start: int = 0
+    ) -> Iterator[tuple[int, ChecksumAddress, bytes]]:
+        """
+        :param base_path: Parent path, children `{base_path}/{index}` are derived
+        :param start: First index
+        :return: Iterator of `(index, address, private_key)` for every child
+        """
+        index = start
+        while True:
+            private_key = self.get_private_key(f"{base_path}/{index}")
+            address = keys.PrivateKey(private_key).public_key.to_checksum_address()
+            yield index, address, private_key
+            index += 1
+
+    def find_accounts(
+        self,
+        addresses: Collection[ChecksumAddress],
+        gap_limit: int = DEFAULT_GAP_LIMIT,
+        base_path: str = ETHEREUM_BASE_PATH,
+    ) -> list[LocalAccount]:
+        """
+        Derive accounts for `base_path` until every address is found or `gap_limit`
+        consecutive indexes do not match any address
+
+        :param addresses: Addresses to look for, e.g. the owners of a Safe
+        :param gap_limit: Max number of consecutive indexes without a match
+        :param base_path: Parent path, children `{base_path}/{index}` are derived
+        :return: Accounts found, in index order
+        """
+        pending = set(addresses)
+        accounts = []
+        last_found_index = -1
+        for index, address, private_key in self.iter_addresses(base_path):
+            if address in pending:
+                pending.remove(address)
+                accounts.append(Account.from_key(private_key))
+                last_found_index = index
+            if not pending or index - last_found_index >= gap_limit:
+                break
+        return accounts
+
+    def discover_accounts(
+        self,
+        addresses: Collection[ChecksumAddress],
+        templates: Sequence[str] = DISCOVERY_TEMPLATES,
+        indexes: range = range(DEFAULT_GAP_LIMIT),
+        max_workers: int | None = None,
+    ) -> list[tuple[str, LocalAccount]]:
+        """
+        Search the `addresses` on every derivation template and index, splitting the
+        candidates in chunks processed in parallel on a process pool. Search finishes
+        when every address is found or every candidate was derived
+
+        :param addresses: Addresses to look for, e.g. the owners of a Safe
+        :param templates: Derivation paths with `{i}` placeholder for the index
+        :param indexes: Indexes to derive for every template
+        :param max_workers: Number of processes. If `1`, search is done on the current
+            process. Number of CPUs is used by default
+        :return: List of `(derivation path, account)` found, sorted by template and index
+        """
+        pending = frozenset(addresses)
+        chunks = [
+            (template, indexes[start : start + DISCOVERY_CHUNK_SIZE])
+            for template in templates
+            for start in range(0, len(indexes), DISCOVERY_CHUNK_SIZE)
+        ]
+        found: dict[str, ChecksumAddress] = {}
+        if max_workers == 1:
+            for template, chunk_indexes in chunks:
+                found.update(_discover_paths(self, template, chunk_indexes, pending))
+                if pending.issubset(found.values()):
+                    break
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(
+                        _discover_paths, self.seed, template, chunk_indexes, pending
+                    )
+                    for template, chunk_indexes in chunks
+                }
+                while futures and not pending.issubset(found.values()):
+                    done, futures = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        found.update(future.result())
+                for future in futures:
+                    future.cancel()
+
+        path_order = {
+            template.format(i=index): (position, index)
+            for position, template in enumerate(templates)
+            for index in indexes
+        }
+        return [
+            (path, self.get_account(path))
+            for path in sorted(found, key=path_order.__getitem__)
+        ]
+
+
+def _discover_paths(
+    hd_wallet: EthereumHdWallet | bytes,
+    template: str,
+    indexes: range,
+    addresses: frozenset[ChecksumAddress],
+) -> dict[str, ChecksumAddress]:
+    """
+    :param hd_wallet: Wallet, or its seed when running on a worker process
+    :param template: Derivation path with `{i}` placeholder for the index
+    :param indexes:
+    :param addresses: Addresses to look for
+    :return: Derivation paths of the `addresses` found
+    """
+    if isinstance(hd_wallet, bytes):
+        hd_wallet = EthereumHdWallet.from_seed(hd_wallet)
+    found = {}
+    for index in indexes:
+        path = template.format(i=index)
+        private_key = hd_wallet.get_private_key(path)
+        address = keys.PrivateKey(private_key).public_key.to_checksum_address()
+        if address in addresses:
+            found[path] = address
+    return found
+
+
+def derive_public_child(
+    public_key: keys.PublicKey, chain_code: bytes, index: int
+) -> tuple[keys.PublicKey, bytes]:
+    """
+    BIP32 `CKDpub`, derive a non hardened child from an extended public key, so
+    children addresses can be enumerated without the private key (e.g. from the
+    extended public key of a hardware wallet)
+
+    :param public_key: Parent public key
+    :param chain_code: Parent chain code
+    :param index: Child index, must be non hardened
+    :return: Tuple of child public key and chain code
+    :raises: eth_utils.ValidationError if the index is hardened
+    """
+    if not 0 <= index < HARDENED_OFFSET:
+        raise ValidationError(f"Cannot derive hardened child {index} from public key")
+    child = _hmac_sha512(
+        chain_code, public_key.to_compressed_bytes() + index.to_bytes(4, "big")
+    )
+    child_tweak = int.from_bytes(child[:32], "big")
+    if child_tweak >= SECPK1_N or not child_tweak:
+        # Invalid key, BIP32 says to use the next index (< 2**-127 probability)
+        return derive_public_child(public_key, chain_code, index + 1)
+    x, y = _add_points(
+        _to_point(keys.PrivateKey(child[:32]).public_key), _to_point(public_key)
+    )
+    return keys.PublicKey(x.to_bytes(32, "big") + y.to_bytes(32, "big")), child[32:]
+
+
+def _add_points(p: tuple[int, int], q: tuple[int, int]) -> tuple[int, int]:
+    """
+    Add two secp256k1 points in affine coordinates. Sum cannot be the point at
+    infinity, as `CKDpub` fails for that key (< 2**-127 probability)
+
+    :param p:
+    :param q:
+    :return: `p + q`
+    :raises: eth_utils.ValidationError if the sum is the point at infinity
+    """
+    if p[0] == q[0] and (p[1] + q[1]) % SECPK1_P == 0:
+        raise ValidationError("Sum of the points is the point at infinity")
+    if p == q:
+        slope = 3 * p[0] * p[0] * pow(2 * p[1], -1, SECPK1_P)
+    else:
+        slope = (q[1] - p[1]) * pow(q[0] - p[0], -1, SECPK1_P)
+    x = (slope * slope - p[0] - q[0]) % SECPK1_P
+    return x, (slope * (p[0] - x) - p[1]) % SECPK1_P
+
+
+def _to_point(public_key: keys.PublicKey) -> tuple[int, int]:
+    public_key_bytes = public_key.to_bytes()
+    return (
+        int.from_bytes(public_key_bytes[:32], "big"),
+        int.from_bytes(public_key_bytes[32:], "big"),
+    )
 
 
 def get_account_from_words(
@@ -16,12 +341,11 @@ def get_account_from_words(
     :return: Ethereum Account
     :raises: eth_utils.ValidationError
     """
-    Account.enable_unaudited_hdwallet_features()
     # Derive from the base path by index only when the caller did not
     # supply a custom hd_path; otherwise honor the provided hd_path
     if index and hd_path == ETHEREUM_DEFAULT_PATH:
         hd_path = f"{ETHEREUM_BASE_PATH}/{index}"
-    return Account.from_mnemonic(words, account_path=hd_path)
+    return EthereumHdWallet(words).get_account(hd_path)
 
 
 def get_address_from_words(
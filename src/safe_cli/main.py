@@ -15,10 +15,14 @@ from web3 import Web3
 
 from . import VERSION
 from .argparse_validators import check_hex_str
-from .operators import SafeOperator
+from .chain_cache import get_chain_cache
+from .operators import AsyncSafeOperator, SafeOperator, is_async_operator_enabled
 from .safe_cli import SafeCli
+from .safe_event_index import get_safe_event_index
+from .token_index import get_token_index
 from .tx_builder.exceptions import SoliditySyntaxError, TxBuilderEncodingError
 from .tx_builder.tx_builder_file_decoder import convert_to_proposed_transactions
+from .tx_service_mirror import get_tx_service_mirror
 from .typer_validators import (
     ChecksumAddressParser,
     HexBytesParser,
@@ -36,7 +40,9 @@ def _build_safe_operator_and_load_keys(
     private_keys: list[str],
     interactive: bool,
 ) -> SafeOperator:
-    safe_operator = SafeOperator(safe_address, node_url, interactive=interactive)
+    safe_operator = (
+        AsyncSafeOperator if is_async_operator_enabled() else SafeOperator
+    )(safe_address, node_url, interactive=interactive)
     safe_operator.load_cli_owners(private_keys)
     return safe_operator
 
@@ -310,9 +316,9 @@ def tx_builder(
     if len(safe_txs) == 1:
         safe_operator.execute_safe_transaction(safe_txs[0])
     else:
-        multisend_tx = safe_operator.batch_safe_txs(safe_operator.get_nonce(), safe_txs)
-        if multisend_tx is not None:
-            safe_operator.execute_safe_transaction(multisend_tx)
+        safe_operator.execute_safe_transactions(
+            safe_operator.batch_safe_txs(safe_operator.get_nonce(), safe_txs)
+        )
 
 
 @app.command()
@@ -320,6 +326,29 @@ def version():
     print(f"Safe Cli v{VERSION}")
 
 
+@app.command()
+def invalidate_cache(
+    chain_id: Annotated[
+        int,
+        typer.Option(
+            help="Only invalidate the cache for this chain id. By default, the whole cache is invalidated",
+            rich_help_panel="Optional Arguments",
+            show_default=False,
+        ),
+    ] = None,
+):
+    get_chain_cache().invalidate(chain_id)
+    get_token_index().invalidate(chain_id)
+    get_safe_event_index().invalidate(chain_id)
+    get_tx_service_mirror().invalidate(chain_id)
+    print_formatted_text(
+        HTML(
+            f"<ansigreen>Cache for {f'chain-id={chain_id}' if chain_id else 'every chain'} "
+            f"was invalidated</ansigreen>"
+        )
+    )
+
+
 @app.command(
     hidden=True,
     name="attended-mode",
@@ -0,0 +1,228 @@
+"""
+Find which inner transaction makes a MultiSend batch fail. MultiSend reverts without
+data when one of the transactions fails, so prefixes of the batch are simulated with
+`eth_call` from the Safe, replacing the Safe code with the MultiSend code using a state
+override. Failing transaction is bisected in `O(log n)` calls.
+
+Transactions calling the Safe itself cannot be simulated this way, as the Safe code is
+replaced, so only the transactions before the first one are diagnosed.
+"""
+
+import dataclasses
+from collections.abc import Sequence
+
+from eth_typing import BlockIdentifier, ChecksumAddress
+from eth_utils import function_signature_to_4byte_selector
+from hexbytes import HexBytes
+from requests import RequestException
+from safe_eth.eth import EthereumClient
+from safe_eth.safe.multi_send import MultiSend, MultiSendOperation, MultiSendTx
+from safe_eth.util.util import to_0x_hex_str
+from web3.exceptions import ContractLogicError, Web3Exception
+
+from safe_cli.rpc_batch import batch_rpc_request, decode_call_result
+
+# Prefixes simulated on every JSON-RPC batch. Every round splits the transactions
+# that can be failing in `MULTISEND_DIAGNOSIS_PROBES + 1` parts
+MULTISEND_DIAGNOSIS_PROBES = 4
+ERROR_SELECTOR = function_signature_to_4byte_selector("Error(string)")
+
+
+@dataclasses.dataclass
+class MultiSendFailure:
+    index: int  # Position of the transaction on the batch
+    multisend_tx: MultiSendTx
+    revert_reason: str | None  # `None` if it cannot be retrieved
+    # Transactions before this Safe self call succeed, failing transaction is this one
+    # or a later one but they cannot be simulated
+    self_call: bool = False
+
+
+def _build_call_tx(
+    multisend: MultiSend,
+    safe_address: ChecksumAddress,
+    multisend_txs: Sequence[MultiSendTx],
+) -> dict[str, str]:
+    return {
+        "from": safe_address,
+        "to": safe_address,
+        "data": to_0x_hex_str(multisend.build_tx_data(list(multisend_txs))),
+    }
+
+
+def simulate_multisend_prefixes(
+    ethereum_client: EthereumClient,
+    safe_address: ChecksumAddress,
+    multisend_address: ChecksumAddress,
+    multisend_code: bytes,
+    multisend_txs: Sequence[MultiSendTx],
+    lengths: Sequence[int],
+    block_identifier: BlockIdentifier = "latest",
+) -> list[bool]:
+    """
+    Simulate the first `length` transactions of the batch as if they were executed by
+    the Safe, for every length on `lengths`. A JSON-RPC batch is used if supported by
+    the node
+
+    :param ethereum_client:
+    :param safe_address:
+    :param multisend_address: MultiSend contract the batch is delegated to
+    :param multisend_code: Runtime code of the MultiSend contract
+    :param multisend_txs:
+    :param lengths: Number of transactions of every prefix to simulate
+    :param block_identifier:
+    :return: If every prefix succeeded, in the same order as `lengths`
+    """
+    multisend = MultiSend(ethereum_client, multisend_address)
+    state_override = {safe_address: {"code": to_0x_hex_str(multisend_code)}}
+    try:
+        results = batch_rpc_request(
+            ethereum_client,
+            [
+                (
+                    "eth_call",
+                    [
+                        _build_call_tx(multisend, safe_address, multisend_txs[:length]),
+                        block_identifier
+                        if isinstance(block_identifier, str)
+                        else hex(block_identifier),
+                        state_override,
+                    ],
+                )
+                for length in lengths
+            ],
+        )
+        return [result is not None for result in results]
+    except (RequestException, ValueError):  # Node does not support batch requests
+        pass
+
+    succeeded = []
+    for length in lengths:
+        try:
+            ethereum_client.w3.eth.call(
+                _build_call_tx(multisend, safe_address, multisend_txs[:length]),
+                block_identifier,
+                state_override,
+            )
+            succeeded.append(True)
+        except (Web3Exception, ValueError):
+            succeeded.append(False)
+    return succeeded
+
+
+def get_revert_reason(
+    ethereum_client: EthereumClient,
+    safe_address: ChecksumAddress,
+    multisend_tx: MultiSendTx,
+    block_identifier: BlockIdentifier = "latest",
+) -> str | None:
+    """
+    :return: Revert reason of the transaction called alone from the Safe. `None` if it
+        does not fail alone (e.g. it depends on a previous transaction of the batch) or
+        if it is a `DELEGATE_CALL`, as it cannot be simulated without the Safe context
+    """
+    if multisend_tx.operation != MultiSendOperation.CALL:
+        return None
+    try:
+        ethereum_client.w3.eth.call(
+            {
+                "from": safe_address,
+                "to": multisend_tx.to,
+                "value": multisend_tx.value,
+                "data": to_0x_hex_str(multisend_tx.data),
+            },
+            block_identifier,
+        )
+    except ContractLogicError as e:
+        data = HexBytes(e.data) if isinstance(e.data, str | bytes) else b""
+        if data[:4] == ERROR_SELECTOR and (
+            reason := decode_call_result(["string"], data[4:])
+        ):
+            return reason
+        return e.message or "execution reverted"
+    except (Web3Exception, ValueError) as e:
+        return str(e)
+    return None
+
+
+def find_failing_multisend_tx(
+    ethereum_client: EthereumClient,
+    safe_address: ChecksumAddress,
+    multisend_address: ChecksumAddress,
+    multisend_txs: Sequence[MultiSendTx],
+    block_identifier: BlockIdentifier = "latest",
+    probes: int = MULTISEND_DIAGNOSIS_PROBES,
+) -> MultiSendFailure | None:
+    """
+    Bisect the batch to find the first failing transaction. Every round simulates
+    `probes` prefixes on one JSON-RPC batch, so it takes
+    `log(len(multisend_txs), probes + 1)` rounds
+
+    :param ethereum_client:
+    :param safe_address: Safe executing the batch
+    :param multisend_address: MultiSend contract the batch is delegated to
+    :param multisend_txs: Transactions of the batch
+    :param block_identifier: Block to simulate the batch on
+    :param probes: Prefixes simulated on every round. Use `1` for a plain bisection
+    :return: First failing transaction. `None` if the whole batch succeeds or if the
+        node does not support state overrides. If transactions before the first one
+        calling the Safe succeed, that one is returned with `self_call=True`, as the
+        rest of the batch cannot be diagnosed
+    """
+    multisend_code = ethereum_client.w3.eth.get_code(multisend_address)
+
+    def simulate(lengths: Sequence[int]) -> list[bool]:
+        return simulate_multisend_prefixes(
+            ethereum_client,
+            safe_address,
+            multisend_address,
+            multisend_code,
+            multisend_txs,
+            lengths,
+            block_identifier,
+        )
+
+    # Prefixes with a transaction calling the Safe would call the MultiSend code
+    simulable = next(
+        (
+            index
+            for index, multisend_tx in enumerate(multisend_txs)
+            if multisend_tx.to == safe_address
+        ),
+        len(multisend_txs),
+    )
+
+    # Empty prefix must succeed, otherwise state override is not supported
+    empty_succeeds, batch_succeeds = simulate([0, simulable])
+    if not empty_succeeds:
+        return None
+    if batch_succeeds:
+        if simulable == len(multisend_txs):
+            return None
+        return MultiSendFailure(
+            simulable, multisend_txs[simulable], None, self_call=True
+        )
+
+    # Prefix with `succeeding` transactions succeeds and with `failing` fails
+    succeeding, failing = 0, simulable
+    while failing - succeeding > 1:
+        step = (failing - succeeding) / (probes + 1)
+        lengths = sorted(
+            {succeeding + max(round(step * i), 1) for i in range(1, probes + 1)}
+            - {failing}
+        )
+        for length, succeeded in zip(lengths, simulate(lengths), strict=True):
+            if succeeded:
+                succeeding = length
+            else:
+                failing = length
+                break
+
+    multisend_tx = multisend_txs[failing - 1]
+    return MultiSendFailure(
+        failing - 1,
+        multisend_tx,
+        get_revert_reason(
+            ethereum_client, safe_address, multisend_tx, block_identifier
+        ),
+    )
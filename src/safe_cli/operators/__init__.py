@@ -1,9 +1,17 @@
+from .async_safe_operator import (
+    AsyncSafeOperator,
+    AsyncSafeTxServiceOperator,
+    is_async_operator_enabled,
+)
 from .enums import SafeOperatorMode
 from .exceptions import SafeCliTerminationException, SafeServiceNotAvailable
 from .safe_operator import SafeOperator
 from .safe_tx_service_operator import SafeTxServiceOperator
 
 __all__ = [
+    "AsyncSafeOperator",
+    "AsyncSafeTxServiceOperator",
+    "is_async_operator_enabled",
     "SafeOperator",
     "SafeOperatorMode",
     "SafeServiceNotAvailable",
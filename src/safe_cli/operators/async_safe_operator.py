@@ -0,0 +1,166 @@
+import asyncio
+import atexit
+import os
+from collections.abc import Sequence
+from functools import cached_property
+
+from eth_typing import BlockIdentifier, ChecksumAddress
+from hexbytes import HexBytes
+from safe_eth.safe import SafeTx
+from web3 import AsyncHTTPProvider, AsyncWeb3
+
+from ..async_tx_service import AsyncTransactionServiceApi
+from ..rpc_batch import encode_call_data
+from .safe_operator import (
+    SAFE_INFO_CALLS,
+    SAFE_INFO_STORAGE_SLOTS,
+    SafeCliInfo,
+    SafeOperator,
+)
+from .safe_tx_service_operator import SafeTxServiceOperator
+
+
+def is_async_operator_enabled() -> bool:
+    """
+    :return: `True` if `SAFE_CLI_ASYNC` environment variable enables the async operators
+    """
+    return os.getenv("SAFE_CLI_ASYNC", "").lower() in ("true", "1", "yes")
+
+
+class AsyncSafeOperator(SafeOperator):
+    """
+    `SafeOperator` running independent reads of a command concurrently with `AsyncWeb3`.
+    Public methods are the same and synchronous, so the prompt loop and the typer
+    commands drive it the same way. Every coroutine runs on one event loop owned by the
+    operator, so the http sessions are kept alive between commands. Coroutines are
+    also available as `async_*` methods
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._loop = asyncio.new_event_loop()
+        super().__init__(*args, **kwargs)
+        self.async_w3 = AsyncWeb3(AsyncHTTPProvider(self.node_url))
+        atexit.register(self.close)
+
+    def run(self, coroutine):
+        """
+        :return: Result of the coroutine, run on the operator event loop
+        """
+        return self._loop.run_until_complete(coroutine)
+
+    async def async_close(self) -> None:
+        await self.async_w3.provider.disconnect()
+
+    def close(self) -> None:
+        """
+        Close the http sessions and the event loop
+        """
+        atexit.unregister(self.close)
+        super().close()
+        if not self._loop.is_closed():
+            self.run(self.async_close())
+            self._loop.close()
+
+    async def async_get_balances_of(
+        self, addresses: Sequence[ChecksumAddress]
+    ) -> list[int]:
+        return list(
+            await asyncio.gather(
+                *(self.async_w3.eth.get_balance(address) for address in addresses)
+            )
+        )
+
+    def _get_balances_of(self, addresses: Sequence[ChecksumAddress]) -> list[int]:
+        return self.run(self.async_get_balances_of(addresses))
+
+    async def async_get_safe_cli_info(
+        self, block_identifier: BlockIdentifier = "latest"
+    ) -> SafeCliInfo:
+        """
+        Request balance, storage slots and Safe getters concurrently. A block tag is
+        resolved first, so every field is retrieved on the same block
+
+        :param block_identifier:
+        :return: `SafeCliInfo`. If a field cannot be retrieved (e.g. `getStorageAt` is
+            not available for Safes < v1.3.0) the synchronous path is used instead
+        """
+        eth = self.async_w3.eth
+        if isinstance(block_identifier, str) and not block_identifier.startswith("0x"):
+            block_identifier = (await eth.get_block(block_identifier))["number"]
+
+        balance, *results = await asyncio.gather(
+            eth.get_balance(self.address, block_identifier),
+            *(
+                eth.get_storage_at(self.address, slot, block_identifier)
+                for slot in SAFE_INFO_STORAGE_SLOTS
+            ),
+            *(
+                eth.call(
+                    {
+                        "to": self.address,
+                        "data": encode_call_data(signature, types, args),
+                    },
+                    block_identifier,
+                )
+                for signature, types, args, _ in SAFE_INFO_CALLS
+            ),
+            return_exceptions=True,
+        )
+        balance, *results = (
+            None if isinstance(result, Exception) else result
+            for result in (balance, *results)
+        )
+        safe_cli_info = await asyncio.to_thread(
+            self._build_safe_cli_info,
+            balance,
+            results[: len(SAFE_INFO_STORAGE_SLOTS)],
+            results[len(SAFE_INFO_STORAGE_SLOTS) :],
+            block_identifier,
+        )
+        if safe_cli_info:
+            return safe_cli_info
+        return await asyncio.to_thread(super().get_safe_cli_info, block_identifier)
+
+    def get_safe_cli_info(
+        self, block_identifier: BlockIdentifier = "latest"
+    ) -> SafeCliInfo:
+        return self.run(self.async_get_safe_cli_info(block_identifier))
+
+    async def async_print_info(self) -> None:
+        """
+        Retrieve everything `print_info` shows concurrently, then print it
+        """
+        reads = [
+            asyncio.to_thread(getattr, self, name)
+            for name in ("ens_domain", "etherscan", "last_safe_contract_address")
+        ]
+        if not self._safe_cli_info:
+            reads.append(self.async_get_safe_cli_info())
+        results = await asyncio.gather(*reads)
+        if not self._safe_cli_info:
+            self._safe_cli_info = results[-1]
+        super().print_info()
+
+    def print_info(self):
+        self.run(self.async_print_info())
+
+
+class AsyncSafeTxServiceOperator(AsyncSafeOperator, SafeTxServiceOperator):
+    """
+    `SafeTxServiceOperator` retrieving transactions from the tx service concurrently
+    """
+
+    @cached_property
+    def async_safe_tx_service(self) -> AsyncTransactionServiceApi:
+        return AsyncTransactionServiceApi(self.safe_tx_service)
+
+    async def async_close(self) -> None:
+        await self.async_safe_tx_service.close()
+        await super().async_close()
+
+    def _fetch_safe_transactions(
+        self, safe_tx_hashes: Sequence[bytes]
+    ) -> list[tuple[SafeTx, HexBytes | None]]:
+        return self.run(
+            self.async_safe_tx_service.get_safe_transactions(safe_tx_hashes)
+        )
@@ -1,6 +1,7 @@
 import re
 from abc import ABC, abstractmethod
 
+from eth_keys import keys
 from web3.types import TxParams
 
 from .constants import BIP32_ETH_PATTERN, BIP32_LEGACY_LEDGER_PATTERN
@@ -26,6 +27,17 @@ class HwWallet(ABC):
         :return:
         """
 
+    @staticmethod
+    @abstractmethod
+    def get_extended_public_key(derivation_path: str) -> tuple[keys.PublicKey, bytes]:
+        """
+        Request the extended public key to the device, so non hardened children can be
+        derived without asking the device again
+
+        :param derivation_path:
+        :return: Tuple of public key and chain code for the derivation path
+        """
+
     def _is_valid_derivation_path(self, derivation_path: str):
         """
         Detect if a string is a valid derivation path
@@ -1,7 +1,10 @@
+from collections.abc import Sequence
 from enum import Enum
 from functools import cache
 
+from eth_keys import keys
 from eth_typing import ChecksumAddress
+from eth_utils import keccak
 from hexbytes import HexBytes
 from prompt_toolkit import HTML, print_formatted_text
 from safe_eth.eth import TxSpeed
@@ -13,8 +16,12 @@ from safe_eth.safe.safe_signature import (
     SafeSignatureEthSign,
 )
 from safe_eth.util.util import to_0x_hex_str
+from tabulate import tabulate
 from web3.types import TxParams, Wei
 
+from safe_cli.chain_cache import get_chain_id
+from safe_cli.ethereum_hd_wallet import derive_public_child
+
 from .hw_wallet import HwWallet
 
 
@@ -61,17 +68,35 @@ class HwWalletManager:
         number_accounts: int | None = 5,
     ) -> list[tuple[ChecksumAddress, str]]:
         """
+        Extended public key is requested to the device only once for every hardened
+        parent, non hardened children are derived locally. So listing accounts for
+        `44'/60'/0'/0/{i}` only requires one request to the device, independently of
+        the number of accounts
 
         :param hw_wallet: Trezor or Ledger
         :param template_derivation_path: formatted string to indicate which path iterate
         :param number_accounts:  number of accounts requested to ledger
         :return: a list of tuples with address and derivation path
         """
-        accounts = []
         hw_wallet = self.get_hw_wallet(hw_wallet_type)
+        extended_public_keys: dict[str, tuple[keys.PublicKey, bytes]] = {}
+
+        def get_extended_public_key(path: str) -> tuple[keys.PublicKey, bytes]:
+            if path not in extended_public_keys:
+                parent_path, _, node = path.rpartition("/")
+                if not parent_path or node.endswith("'"):
+                    extended_public_keys[path] = hw_wallet.get_extended_public_key(path)
+                else:
+                    extended_public_keys[path] = derive_public_child(
+                        *get_extended_public_key(parent_path), int(node)
+                    )
+            return extended_public_keys[path]
+
+        accounts = []
         for i in range(number_accounts):
             path_string = template_derivation_path.format(i=i)
-            accounts.append((hw_wallet(path_string).address, path_string))
+            public_key, _ = get_extended_public_key(path_string.replace("m/", ""))
+            accounts.append((public_key.to_checksum_address(), path_string))
         return accounts
 
     def add_account(
@@ -155,15 +180,64 @@ class HwWalletManager:
         :param wallets:
         :return: SafeTx with signature.
         """
-        hw_wallet_signatures = self.sign_eip712(safe_tx.eip712_structured_data, wallets)
-        # Update signatures
-        signatures = (
-            SafeSignature.parse_signature(safe_tx.signatures, safe_tx.safe_tx_hash)
-            + hw_wallet_signatures
+        return self.sign_safe_txs([safe_tx], wallets)[0]
+
+    def sign_safe_txs(
+        self, safe_txs: Sequence[SafeTx], wallets: list[HwWallet]
+    ) -> list[SafeTx]:
+        """
+        Sign several safe transactions with the provided hardware wallets. Every hash is
+        calculated and shown in one table before signing, and then every wallet signs
+        all the transactions in a row using the already open connection with the device
+
+        :param safe_txs:
+        :param wallets:
+        :return: SafeTxs with signatures, in the same order
+        """
+        eip712_hashes: list[tuple[bytes, bytes, bytes]] = []
+        for safe_tx in safe_txs:
+            _, domain_hash, message_hash = eip712_encode(safe_tx.eip712_structured_data)
+            safe_tx_hash = keccak(b"\x19\x01" + domain_hash + message_hash)
+            eip712_hashes.append((domain_hash, message_hash, safe_tx_hash))
+
+        print_formatted_text(
+            HTML(
+                "<ansired>Make sure before signing in your devices that the domain_hash and "
+                "message_hash of every transaction are correct</ansired>"
+            )
+        )
+        print(
+            tabulate(
+                [
+                    [safe_tx.safe_nonce]
+                    + [to_0x_hex_str(eip712_hash) for eip712_hash in hashes]
+                    for safe_tx, hashes in zip(safe_txs, eip712_hashes, strict=True)
+                ],
+                headers=["nonce", "domain_hash", "message_hash", "safe_tx_hash"],
+            )
         )
 
-        safe_tx.signatures = SafeSignature.export_signatures(signatures)
-        return safe_tx
+        hw_wallet_signatures: list[list[SafeSignature]] = [[] for _ in safe_txs]
+        for wallet in wallets:
+            print_formatted_text(
+                HTML(f"Signing <b>{len(safe_txs)}</b> transactions with your {wallet}")
+            )
+            for safe_tx_signatures, (domain_hash, message_hash, safe_tx_hash) in zip(
+                hw_wallet_signatures, eip712_hashes, strict=True
+            ):
+                signature = wallet.sign_typed_hash(domain_hash, message_hash)
+                safe_tx_signatures.append(SafeSignatureEOA(signature, safe_tx_hash))
+
+        for safe_tx, safe_tx_signatures, (_, _, safe_tx_hash) in zip(
+            safe_txs, hw_wallet_signatures, eip712_hashes, strict=True
+        ):
+            # Update signatures
+            signatures = (
+                SafeSignature.parse_signature(safe_tx.signatures, safe_tx_hash)
+                + safe_tx_signatures
+            )
+            safe_tx.signatures = SafeSignature.export_signatures(signatures)
+        return list(safe_txs)
 
     def execute_safe_tx(
         self,
@@ -211,7 +285,7 @@ class HwWalletManager:
             tx_gas or (max(safe_tx.tx["gas"] + 75000, safe_tx.recommended_gas()))
         )
         signed_raw_transaction = self.sender.get_signed_raw_transaction(
-            safe_tx.tx, safe_tx.ethereum_client.get_chain_id()
+            safe_tx.tx, get_chain_id(safe_tx.ethereum_client)
         )  # sign with ledger
         safe_tx.tx_hash = safe_tx.ethereum_client.w3.eth.send_raw_transaction(
             signed_raw_transaction
@@ -1,9 +1,13 @@
+from eth_keys import keys
 from eth_typing import ChecksumAddress
 from hexbytes import HexBytes
+from ledgerblue.commException import CommException
 from ledgerblue.Dongle import Dongle
 from ledgereth import create_transaction, sign_message, sign_typed_data_draft
 from ledgereth.accounts import get_account_by_path
 from ledgereth.comms import init_dongle
+from ledgereth.exceptions import LedgerError
+from ledgereth.utils import parse_bip32_path
 from safe_eth.safe.signatures import signature_to_bytes
 from web3.types import TxParams
 
@@ -35,6 +39,33 @@ class LedgerWallet(HwWallet):
         account = get_account_by_path(self.derivation_path)
         return account.address
 
+    @staticmethod
+    @raise_ledger_exception_as_hw_wallet_exception
+    def get_extended_public_key(derivation_path: str) -> tuple[keys.PublicKey, bytes]:
+        """
+        :param derivation_path:
+        :return: Tuple of public key and chain code for the derivation path
+        """
+        path = parse_bip32_path(derivation_path.replace("m/", ""))
+        data = (len(path) // 4).to_bytes(1, "big") + path
+        # GET_ETH_PUBLIC_ADDRESS without confirmation (P1=0x00) returning the chain code (P2=0x01)
+        apdu = b"\xe0\x02\x00\x01" + len(data).to_bytes(1, "big") + data
+        dongle = init_dongle()
+        try:
+            response = dongle.exchange(apdu)
+        except CommException as e:
+            raise LedgerError.transalate_comm_exception(e) from e
+        finally:
+            dongle.close()
+        # Response: public key length, uncompressed public key, address length,
+        # address as ascii hex and chain code
+        public_key_length = response[0]
+        public_key = response[2 : 1 + public_key_length]  # Skip 0x04 prefix
+        address_offset = 1 + public_key_length
+        chain_code_offset = address_offset + 1 + response[address_offset]
+        chain_code = bytes(response[chain_code_offset : chain_code_offset + 32])
+        return keys.PublicKey(bytes(public_key)), chain_code
+
     @raise_ledger_exception_as_hw_wallet_exception
     def sign_typed_hash(self, domain_hash: bytes, message_hash: bytes) -> bytes:
         """
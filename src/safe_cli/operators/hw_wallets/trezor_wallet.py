@@ -1,6 +1,7 @@
 from functools import cache
 
 import rlp
+from eth_keys import keys
 from eth_typing import ChecksumAddress
 from hexbytes import HexBytes
 from safe_eth.safe.signatures import signature_split, signature_to_bytes
@@ -8,6 +9,7 @@ from trezorlib import tools
 from trezorlib.client import TrezorClient, get_default_client
 from trezorlib.ethereum import (
     get_address,
+    get_public_node,
     sign_message,
     sign_tx,
     sign_tx_eip1559,
@@ -46,6 +48,18 @@ class TrezorWallet(HwWallet):
         """
         return get_address(client=self.client, n=self.address_n)
 
+    @staticmethod
+    @raise_trezor_exception_as_hw_wallet_exception
+    def get_extended_public_key(derivation_path: str) -> tuple[keys.PublicKey, bytes]:
+        """
+        :param derivation_path:
+        :return: Tuple of public key and chain code for the derivation path
+        """
+        node = get_public_node(
+            get_trezor_client(), tools.parse_path(derivation_path)
+        ).node
+        return keys.PublicKey.from_compressed_bytes(node.public_key), node.chain_code
+
     @raise_trezor_exception_as_hw_wallet_exception
     def sign_typed_hash(self, domain_hash: bytes, message_hash: bytes) -> bytes:
         """
@@ -1,17 +1,23 @@
 import dataclasses
+import html
 import json
 import os
-from collections.abc import Sequence
+import threading
+from collections.abc import Iterator, Sequence
 from functools import cached_property, wraps
+from itertools import islice
+from typing import Any
 
+from colorama import Fore, Style
 from ens import ENS
 from eth_account import Account
 from eth_account.signers.local import LocalAccount
-from eth_typing import ChecksumAddress
+from eth_typing import BlockIdentifier, ChecksumAddress
 from eth_utils import ValidationError
 from hexbytes import HexBytes
 from packaging import version as semantic_version
 from prompt_toolkit import HTML, print_formatted_text
+from requests import RequestException
 from safe_eth.eth import (
     EthereumClient,
     EthereumNetwork,
@@ -34,11 +40,20 @@ from safe_eth.safe.api import TransactionServiceApi
 from safe_eth.safe.multi_send import MultiSend, MultiSendOperation, MultiSendTx
 from safe_eth.safe.safe_deployments import safe_deployments
 from safe_eth.util.util import to_0x_hex_str
+from tabulate import tabulate
 from web3 import Web3
 from web3.contract import Contract
-from web3.exceptions import BadFunctionCallOutput
-
-from safe_cli.ethereum_hd_wallet import get_account_from_words
+from web3.exceptions import BadFunctionCallOutput, Web3Exception
+
+from safe_cli.chain_cache import (
+    get_chain_cache,
+    get_chain_id,
+    get_master_copy_version,
+    get_network,
+    set_chain_id,
+)
+from safe_cli.ethereum_hd_wallet import DEFAULT_GAP_LIMIT, EthereumHdWallet
+from safe_cli.multisend_diagnosis import MultiSendFailure, find_failing_multisend_tx
 from safe_cli.operators.exceptions import (
     AccountNotLoadedException,
     ExistingOwnerException,
@@ -66,15 +81,34 @@ from safe_cli.operators.exceptions import (
     ThresholdLimitException,
     UpdateAddressesNotValid,
 )
+from safe_cli.receipt_tracker import ReceiptTracker
+from safe_cli.rpc_batch import (
+    batch_rpc_request,
+    decode_call_result,
+    decode_storage_address,
+    encode_call_data,
+    eth_call_request,
+    multicall3_aggregate3,
+)
 from safe_cli.safe_addresses import (
     get_default_fallback_handler_address,
     get_last_sign_message_lib_address,
     get_safe_contract_address,
     get_safe_l2_contract_address,
 )
+from safe_cli.safe_event_index import (
+    SAFE_EXECUTION_EVENTS,
+    SafeEvent,
+    SafeEventIndex,
+    get_safe_event_index,
+)
+from safe_cli.safe_event_watcher import SafeEventWatcher
+from safe_cli.token_balances import get_token_balances
+from safe_cli.token_index import get_safe_tokens, get_token_index
+from safe_cli.tx_history import TX_HISTORY_PAGE_SIZE
+from safe_cli.tx_pipeline import PipelinedSafeTx, SafeTxPipeline
 from safe_cli.utils import (
     choose_option_from_list,
-    get_erc_20_list,
     get_input,
     yes_or_no_question,
 )
@@ -106,6 +140,40 @@ class SafeCliInfo:
         )
 
 
+BALANCES_TABLE_HEADERS = ["name", "balance", "symbol", "decimals", "tokenAddress"]
+
+# Gas ceiling for every MultiSend transaction, `$SAFE_CLI_MULTISEND_GAS_LIMIT` if defined
+MULTISEND_GAS_LIMIT = 10_000_000
+# Gas used by `execTransaction` (signatures check, nonce, events) on every Safe transaction
+SAFE_TX_BASE_GAS = 100_000
+# Gas used by MultiSend to decode and dispatch every inner transaction
+MULTISEND_TX_BASE_GAS = 10_000
+# Gas assumed for inner transactions that cannot be estimated, e.g. if they depend on a
+# previous transaction of the batch
+MULTISEND_TX_DEFAULT_GAS = 500_000
+
+# Storage slots for master copy, fallback handler, guard and module guard
+SAFE_INFO_STORAGE_SLOTS = (
+    0,
+    Safe.FALLBACK_HANDLER_STORAGE_SLOT,
+    Safe.TRANSACTION_GUARD_STORAGE_SLOT,
+    Safe.MODULE_GUARD_STORAGE_SLOT,
+)
+# Safe getters for `SafeCliInfo`: signature, argument types, arguments and output types
+SAFE_INFO_CALLS = (
+    ("VERSION()", (), (), ("string",)),
+    ("nonce()", (), (), ("uint256",)),
+    ("getOwners()", (), (), ("address[]",)),
+    ("getThreshold()", (), (), ("uint256",)),
+    (
+        "getModulesPaginated(address,uint256)",
+        ("address", "uint256"),
+        (SENTINEL_ADDRESS, 20),
+        ("address[]", "address"),
+    ),
+)
+
+
 def require_tx_service(f):
     @wraps(f)
     def decorated(self, *args, **kwargs):
@@ -158,16 +226,31 @@ class SafeOperator:
     interactive: bool
 
     def __init__(
-        self, address: ChecksumAddress, node_url: str, interactive: bool = True
+        self,
+        address: ChecksumAddress,
+        node_url: str,
+        interactive: bool = True,
+        batch_startup: bool = True,
     ):
+        """
+        :param address: Safe address
+        :param node_url: Ethereum RPC url
+        :param interactive: Disable prompt dialogs if `False`
+        :param batch_startup: Retrieve chain id and Safe information using a single
+            JSON-RPC batch request. Falls back to individual requests if the node
+            does not support batching
+        """
         self.address = address
         self.node_url = node_url
         self.ethereum_client = EthereumClient(self.node_url)
         self.ens = ENS.from_web3(self.ethereum_client.w3)
-        self.network: EthereumNetwork = self.ethereum_client.get_network()
+        prefetched_safe_cli_info, prefetched_block_number = (
+            self._prefetch_safe_cli_info() if batch_startup else None
+        ) or (None, None)
+        self.network: EthereumNetwork = get_network(self.ethereum_client)
         try:
-            self.safe_tx_service = TransactionServiceApi.from_ethereum_client(
-                self.ethereum_client
+            self.safe_tx_service = TransactionServiceApi(
+                self.network, ethereum_client=self.ethereum_client
             )
             if not self.safe_tx_service.api_key:
                 print_formatted_text(
@@ -180,7 +263,13 @@ class SafeOperator:
         except EthereumNetworkNotSupported:
             self.safe_tx_service = None
 
-        self.safe = Safe(address, self.ethereum_client)
+        self.safe = Safe(
+            address,
+            self.ethereum_client,
+            version=(
+                prefetched_safe_cli_info.version if prefetched_safe_cli_info else None
+            ),
+        )
         self.safe_contract = self.safe.contract
         self.safe_contract_1_1_0 = get_safe_V1_1_1_contract(
             self.ethereum_client.w3, address=self.address
@@ -188,13 +277,145 @@ class SafeOperator:
         self.accounts: set[LocalAccount] = set()
         self.default_sender: LocalAccount | None = None
         self.executed_transactions: list[str] = []
-        self._safe_cli_info: SafeCliInfo | None = None  # Cache for SafeCliInfo
+        self._safe_cli_info: SafeCliInfo | None = (
+            prefetched_safe_cli_info  # Cache for SafeCliInfo
+        )
+        if prefetched_safe_cli_info:
+            # Events of the next blocks are applied by `update_safe_cli_info`
+            self.safe_event_watcher.reset(prefetched_block_number)
+        self._safe_cli_info_lock = threading.RLock()
         self.require_all_signatures = (
             True  # Require all signatures to be present to send a tx
         )
         self.hw_wallet_manager = get_hw_wallet_manager()
         self.interactive = interactive  # Disable prompt dialogs
 
+    def _prefetch_safe_cli_info(self) -> tuple[SafeCliInfo, int] | None:
+        """
+        Request chain id, block number, balance, storage slots and Safe getters as one
+        JSON-RPC batch, so starting the cli against a remote node only pays the latency
+        of one request. Chain id is stored using `set_chain_id`, so `get_network` does
+        not need to query the node again.
+
+        :return: `SafeCliInfo` and the block number requested before it, so events are
+            watched from there. `None` if the node does not support batching or the
+            Safe cannot be detected, so the regular path is used instead
+        """
+        requests = [
+            ("eth_chainId", []),
+            ("eth_blockNumber", []),
+            ("eth_getBalance", [self.address, "latest"]),
+        ]
+        requests.extend(
+            ("eth_getStorageAt", [self.address, hex(slot), "latest"])
+            for slot in SAFE_INFO_STORAGE_SLOTS
+        )
+        requests.extend(
+            eth_call_request(self.address, encode_call_data(signature, types, args))
+            for signature, types, args, _ in SAFE_INFO_CALLS
+        )
+        try:
+            results = batch_rpc_request(self.ethereum_client, requests)
+        except (RequestException, ValueError):
+            return None
+
+        chain_id, block_number, balance, *results = results
+        if chain_id:
+            set_chain_id(self.ethereum_client, int(chain_id, 16))
+        if not block_number:
+            return None
+
+        safe_cli_info = self._build_safe_cli_info(
+            int(balance, 16) if balance else None,
+            results[: len(SAFE_INFO_STORAGE_SLOTS)],
+            results[len(SAFE_INFO_STORAGE_SLOTS) :],
+        )
+        return (safe_cli_info, int(block_number, 16)) if safe_cli_info else None
+
+    def _build_safe_cli_info(
+        self,
+        balance: int | None,
+        storage_results: Sequence[str | bytes | None],
+        call_results: Sequence[str | bytes | None],
+        block_identifier: BlockIdentifier = "latest",
+    ) -> SafeCliInfo | None:
+        """
+        :param balance: Safe balance in wei
+        :param storage_results: Content of `SAFE_INFO_STORAGE_SLOTS`
+        :param call_results: Return data of `SAFE_INFO_CALLS`
+        :param block_identifier: Block the results were retrieved on
+        :return: `SafeCliInfo` or `None` if a value is missing or the address is not
+            a Safe
+        """
+        master_copy, fallback_handler, guard, module_guard = (
+            decode_storage_address(result) for result in storage_results
+        )
+        version, nonce, owners, threshold, modules_response = (
+            decode_call_result(output_types, result)
+            for (*_, output_types), result in zip(
+                SAFE_INFO_CALLS, call_results, strict=True
+            )
+        )
+        if (
+            balance is None
+            or master_copy in (None, NULL_ADDRESS)
+            or None in (version, nonce, owners, threshold)
+        ):
+            return None
+
+        return SafeCliInfo(
+            self.address,
+            nonce,
+            threshold,
+            [Web3.to_checksum_address(owner) for owner in owners],
+            master_copy,
+            self._get_modules_from_response(
+                Safe(self.address, self.ethereum_client, version=version),
+                modules_response,
+                block_identifier,
+            ),
+            fallback_handler,
+            guard,
+            module_guard,
+            Web3.from_wei(balance, "ether"),
+            version,
+        )
+
+    def _get_modules_from_response(
+        self,
+        safe: Safe,
+        modules_response: tuple[list[str], str] | None,
+        block_identifier: BlockIdentifier = "latest",
+    ) -> list[ChecksumAddress]:
+        """
+        :param safe:
+        :param modules_response: Decoded `getModulesPaginated` response
+        :param block_identifier:
+        :return: Modules enabled for the Safe. If there are more modules than the ones
+            returned or `getModulesPaginated` is not supported (Safes < v1.1.1) they are
+            retrieved using `Safe.retrieve_modules`
+        """
+        if modules_response:
+            modules, next_module = modules_response
+            if Web3.to_checksum_address(next_module) == SENTINEL_ADDRESS:
+                return [Web3.to_checksum_address(module) for module in modules]
+        return safe.retrieve_modules(block_identifier=block_identifier)
+
+    @cached_property
+    def receipt_tracker(self) -> ReceiptTracker:
+        """
+        :return: Tracker shared by every receipt wait of the operator
+        """
+        return ReceiptTracker(self.ethereum_client)
+
+    @cached_property
+    def safe_event_watcher(self) -> SafeEventWatcher:
+        return SafeEventWatcher(self.ethereum_client, self.address)
+
+    @cached_property
+    def safe_event_index(self) -> SafeEventIndex:
+        return get_safe_event_index()
+
     @cached_property
     def etherscan(self) -> EtherscanClientV2 | None:
         if EtherscanClientV2.is_supported_network(self.network):
@@ -231,8 +452,121 @@ class SafeOperator:
         return self._safe_cli_info
 
     def refresh_safe_cli_info(self) -> SafeCliInfo:
-        self._safe_cli_info = self.get_safe_cli_info()
-        return self._safe_cli_info
+        with self._safe_cli_info_lock:
+            block_number = self.ethereum_client.current_block_number
+            self._safe_cli_info = self.get_safe_cli_info(block_number)
+            # Events of the next blocks are applied by `update_safe_cli_info`
+            self.safe_event_watcher.reset(block_number)
+            return self._safe_cli_info
+
+    def update_safe_cli_info(self) -> SafeCliInfo:
+        """
+        Apply the events emitted by the Safe since `SafeCliInfo` was retrieved, instead
+        of retrieving every field again. Nonce and balance are not part of the events,
+        so they are only retrieved if a transaction was executed
+
+        :return: Updated `SafeCliInfo`
+        """
+        with self._safe_cli_info_lock:
+            if not self._safe_cli_info or self.safe_event_watcher.last_block is None:
+                return self.refresh_safe_cli_info()
+            return self._apply_watched_events()
+
+    def _apply_watched_events(self) -> SafeCliInfo:
+        """
+        Poll the watcher and apply the events to the cached `SafeCliInfo`, that must
+        be set
+        """
+        with self._safe_cli_info_lock:
+            events, block_number = self.safe_event_watcher.poll()
+            if events:
+                self._safe_cli_info = self._apply_safe_events(
+                    self._safe_cli_info, events, block_number
+                )
+            return self._safe_cli_info
+
+    def _poll_safe_cli_info(self) -> None:
+        """
+        Called from the watcher thread. A missing `SafeCliInfo` is not retrieved here,
+        as async operators retrieve it on the event loop of the main thread, so it is
+        left for the next `update_safe_cli_info`
+        """
+        with self._safe_cli_info_lock:
+            if self._safe_cli_info and self.safe_event_watcher.last_block is not None:
+                self._apply_watched_events()
+
+    def _apply_safe_events(
+        self,
+        safe_cli_info: SafeCliInfo,
+        events: Sequence[SafeEvent],
+        block_number: int,
+    ) -> SafeCliInfo:
+        """
+        :param safe_cli_info:
+        :param events: Events in block order
+        :param block_number: Last block of the events
+        :return: A copy of `safe_cli_info` with the events applied, so readers on other
+            threads never see a partial update
+        """
+        modules = list(safe_cli_info.modules)
+        changes = {}
+        owners_changed = executed = False
+        for event in events:
+            if event.name in ("AddedOwner", "RemovedOwner"):
+                owners_changed = True
+            elif event.name == "ChangedThreshold":
+                changes["threshold"] = event.args["threshold"]
+            elif event.name == "EnabledModule":
+                # New modules are the first ones of the Safe linked list
+                if event.args["module"] not in modules:
+                    modules.insert(0, event.args["module"])
+            elif event.name == "DisabledModule":
+                if event.args["module"] in modules:
+                    modules.remove(event.args["module"])
+            elif event.name == "ChangedFallbackHandler":
+                changes["fallback_handler"] = event.args["handler"]
+            elif event.name == "ChangedGuard":
+                changes["guard"] = event.args["guard"]
+            elif event.name == "ChangedModuleGuard":
+                changes["module_guard"] = event.args["moduleGuard"]
+            elif event.name in SAFE_EXECUTION_EVENTS:
+                executed = True
+        if owners_changed:
+            # Owners are retrieved again, as their order is needed to build `prev_owner`
+            # and `swapOwner` keeps the position of the removed owner
+            changes["owners"] = self.safe.retrieve_owners(block_number)
+        if executed:
+            changes["nonce"] = self.safe.retrieve_nonce(block_number)
+            changes["balance_ether"] = Web3.from_wei(
+                self.ethereum_client.get_balance(self.address, block_number), "ether"
+            )
+        return dataclasses.replace(safe_cli_info, modules=modules, **changes)
+
+    def _set_safe_cli_nonce(self, nonce: int) -> None:
+        """
+        Replace the cached `SafeCliInfo` instead of updating it, as the watcher thread
+        may be reading it
+
+        :param nonce: Nonce after executing a transaction
+        """
+        with self._safe_cli_info_lock:
+            self._safe_cli_info = dataclasses.replace(self.safe_cli_info, nonce=nonce)
+
+    def start_safe_cli_info_watcher(self) -> None:
+        """
+        Keep `SafeCliInfo` updated on a background thread applying the events of the
+        Safe, so prompt and toolbar are current without a `refresh`
+        """
+        self.safe_event_watcher.start(self._poll_safe_cli_info)
+
+    def stop_safe_cli_info_watcher(self) -> None:
+        self.safe_event_watcher.stop()
+
+    def close(self) -> None:
+        """
+        Stop the background work of the operator when it is not used anymore
+        """
+        self.stop_safe_cli_info_watcher()
 
     def is_version_updated(self) -> bool:
         """
@@ -244,9 +578,9 @@ class SafeOperator:
             return True
         else:  # Check versions, maybe safe-cli addresses were not updated
             try:
-                safe_contract_version = Safe(
-                    last_safe_contract_address, self.ethereum_client
-                ).retrieve_version()
+                safe_contract_version = get_master_copy_version(
+                    self.ethereum_client, last_safe_contract_address
+                )
             except (
                 BadFunctionCallOutput
             ):  # Safe master copy is not deployed or errored, maybe custom network
@@ -256,7 +590,44 @@ class SafeOperator:
                 self.safe_cli_info.version
             ) >= semantic_version.parse(safe_contract_version)
 
-    def load_cli_owners_from_words(self, words: list[str]):
+    def invalidate_chain_cache(self):
+        """
+        Remove cached contract addresses, master copy versions, indexed tokens and
+        indexed events of the Safe for the current chain, so they are retrieved again
+        from the node
+        """
+        get_chain_cache().invalidate(get_chain_id(self.ethereum_client))
+        get_token_index().invalidate(get_chain_id(self.ethereum_client))
+        self.safe_event_index.invalidate(
+            get_chain_id(self.ethereum_client), self.address
+        )
+        for cached_property_name in (
+            "last_default_fallback_handler_address",
+            "last_safe_contract_address",
+        ):
+            self.__dict__.pop(cached_property_name, None)
+        print_formatted_text(
+            HTML(
+                f"<ansigreen>Cache for chain-id={get_chain_id(self.ethereum_client)} "
+                f"was invalidated</ansigreen>"
+            )
+        )
+
+    def load_cli_owners_from_words(
+        self,
+        words: list[str],
+        gap_limit: int = DEFAULT_GAP_LIMIT,
+        all_derivation_paths: bool = False,
+    ):
+        """
+        Load the owners of the Safe derived from the seed phrase. Accounts are derived
+        until every owner is found or `gap_limit` consecutive accounts are not owners
+
+        :param words: Mnemonic words, or the name of an environment variable with them
+        :param gap_limit: Max number of consecutive accounts to derive without an owner
+        :param all_derivation_paths: Also search the first `gap_limit` indexes of the
+            Ledger Live and legacy Ledger derivation paths, in parallel
+        """
         if len(words) == 1:  # Reading seed from Environment Variable
             words = os.environ.get(words[0], default="").strip().split(" ")
         parsed_words = " ".join(words).strip()
@@ -269,13 +640,25 @@ class SafeOperator:
             )
             return
         try:
-            accounts = []
-            for index in range(100):  # Try first 100 accounts of seed phrase
-                account = get_account_from_words(parsed_words, index=index)
-                if account.address in self.safe_cli_info.owners:
-                    self.load_cli_owners([to_0x_hex_str(account.key)])
+            hd_wallet = EthereumHdWallet(parsed_words)
+            if all_derivation_paths:
+                accounts = []
+                for path, account in hd_wallet.discover_accounts(
+                    self.safe_cli_info.owners, indexes=range(gap_limit)
+                ):
+                    print_formatted_text(
+                        HTML(f"Found owner <b>{account.address}</b> on path {path}")
+                    )
                     accounts.append(account)
-            if not accounts:
+            else:
+                accounts = hd_wallet.find_accounts(
+                    self.safe_cli_info.owners, gap_limit=gap_limit
+                )
+            if accounts:
+                self.load_cli_owners(
+                    [to_0x_hex_str(account.key) for account in accounts]
+                )
+            else:
                 print_formatted_text(
                     HTML(
                         "<ansired>Cannot generate any valid owner for this Safe</ansired>"
@@ -287,46 +670,64 @@ class SafeOperator:
             )
 
     def load_cli_owners(self, keys: list[str]):
+        accounts = self._parse_cli_owners(keys)
+        self._add_cli_owners(
+            accounts, self._get_balances_of([account.address for account in accounts])
+        )
+
+    def _parse_cli_owners(self, keys: list[str]) -> list[LocalAccount]:
+        accounts = []
         for key in keys:
             try:
-                account = Account.from_key(
-                    os.environ.get(key, default=key)
+                accounts.append(
+                    Account.from_key(os.environ.get(key, default=key))
                 )  # Try to get key from `environ`
-                self.accounts.add(account)
-                balance = self.ethereum_client.get_balance(account.address)
-                print_formatted_text(
-                    HTML(
-                        f"Loaded account <b>{account.address}</b> "
-                        f"with balance={Web3.from_wei(balance, 'ether')} ether"
-                    )
-                )
-                if (
-                    not self.default_sender
-                    and not self.hw_wallet_manager.sender
-                    and balance > 0
-                ):
-                    print_formatted_text(
-                        HTML(
-                            f"Set account <b>{account.address}</b> as default sender of txs"
-                        )
-                    )
-                    self.default_sender = account
             except ValueError:
                 if not self.interactive:
                     raise SafeOperatorException(f"Cannot load key={key}") from None
                 print_formatted_text(HTML(f"<ansired>Cannot load key={key}</ansired>"))
+        return accounts
+
+    def _get_balances_of(self, addresses: Sequence[ChecksumAddress]) -> list[int]:
+        return [self.ethereum_client.get_balance(address) for address in addresses]
+
+    def _add_cli_owners(
+        self, accounts: Sequence[LocalAccount], balances: Sequence[int]
+    ) -> None:
+        for account, balance in zip(accounts, balances, strict=True):
+            self.accounts.add(account)
+            print_formatted_text(
+                HTML(
+                    f"Loaded account <b>{account.address}</b> "
+                    f"with balance={Web3.from_wei(balance, 'ether')} ether"
+                )
+            )
+            if (
+                not self.default_sender
+                and not self.hw_wallet_manager.sender
+                and balance > 0
+            ):
+                print_formatted_text(
+                    HTML(
+                        f"Set account <b>{account.address}</b> as default sender of txs"
+                    )
+                )
+                self.default_sender = account
 
     def load_hw_wallet(
         self,
         hw_wallet_type: HwWalletType,
         derivation_path: str,
         template_derivation_path: str,
+        number_accounts: int = 5,
     ):
         if not self.hw_wallet_manager.is_supported_hw_wallet(hw_wallet_type):
             return None
         if derivation_path is None:
             ledger_accounts = self.hw_wallet_manager.get_accounts(
-                hw_wallet_type, template_derivation_path
+                hw_wallet_type,
+                template_derivation_path,
+                number_accounts=number_accounts,
             )
             if len(ledger_accounts) == 0:
                 return None
@@ -358,24 +759,36 @@ class SafeOperator:
             print_formatted_text(HTML(f"HwDevice {address} wasn't added as sender"))
 
     def load_ledger_cli_owners(
-        self, derivation_path: str = None, legacy_account: bool = False
+        self,
+        derivation_path: str = None,
+        legacy_account: bool = False,
+        number_accounts: int = 5,
     ):
-        if legacy_account:
-            self.load_hw_wallet(HwWalletType.LEDGER, derivation_path, "44'/60'/0'/{i}")
-        else:
-            self.load_hw_wallet(
-                HwWalletType.LEDGER, derivation_path, "44'/60'/{i}'/0/0"
-            )
+        template_derivation_path = (
+            "44'/60'/0'/{i}" if legacy_account else "44'/60'/{i}'/0/0"
+        )
+        self.load_hw_wallet(
+            HwWalletType.LEDGER,
+            derivation_path,
+            template_derivation_path,
+            number_accounts=number_accounts,
+        )
 
     def load_trezor_cli_owners(
-        self, derivation_path: str = None, legacy_account: bool = False
+        self,
+        derivation_path: str = None,
+        legacy_account: bool = False,
+        number_accounts: int = 5,
     ):
-        if legacy_account:
-            self.load_hw_wallet(HwWalletType.TREZOR, derivation_path, "44'/60'/0'/{i}")
-        else:
-            self.load_hw_wallet(
-                HwWalletType.TREZOR, derivation_path, "44'/60'/0'/0/{i}"
-            )
+        template_derivation_path = (
+            "44'/60'/0'/{i}" if legacy_account else "44'/60'/0'/0/{i}"
+        )
+        self.load_hw_wallet(
+            HwWalletType.TREZOR,
+            derivation_path,
+            template_derivation_path,
+            number_accounts=number_accounts,
+        )
 
     def unload_cli_owners(self, owners: list[str]):
         accounts_to_remove: set[Account] = set()
@@ -470,7 +883,7 @@ class SafeOperator:
                     f"{sender_account_address}, waiting for receipt</ansigreen>"
                 )
             )
-            if self.ethereum_client.get_transaction_receipt(tx_hash, timeout=120):
+            if self.receipt_tracker.wait(tx_hash, timeout=120):
                 return True
             else:
                 print_formatted_text(
@@ -535,8 +948,7 @@ class SafeOperator:
                 new_owner, threshold
             ).build_transaction({"from": self.address, "gas": 0, "gasPrice": 0})
             if self.execute_safe_internal_transaction(transaction["data"]):
-                self.safe_cli_info.owners = self.safe.retrieve_owners()
-                self.safe_cli_info.threshold = self.safe.retrieve_threshold()
+                self.update_safe_cli_info()
                 return True
             return False
 
@@ -557,8 +969,7 @@ class SafeOperator:
                 prev_owner, owner_to_remove, threshold
             ).build_transaction({"from": self.address, "gas": 0, "gasPrice": 0})
             if self.execute_safe_internal_transaction(transaction["data"]):
-                self.safe_cli_info.owners = self.safe.retrieve_owners()
-                self.safe_cli_info.threshold = self.safe.retrieve_threshold()
+                self.update_safe_cli_info()
                 return True
             return False
 
@@ -623,8 +1034,7 @@ class SafeOperator:
                 new_fallback_handler
             ).build_transaction({"from": self.address, "gas": 0, "gasPrice": 0})
             if self.execute_safe_internal_transaction(transaction["data"]):
-                self.safe_cli_info.fallback_handler = new_fallback_handler
-                self.safe_cli_info.version = self.safe.retrieve_version()
+                self.update_safe_cli_info()
                 return True
             return False
 
@@ -644,8 +1054,7 @@ class SafeOperator:
                 guard
             ).build_transaction({"from": self.address, "gas": 0, "gasPrice": 0})
             if self.execute_safe_internal_transaction(transaction["data"]):
-                self.safe_cli_info.guard = guard
-                self.safe_cli_info.version = self.safe.retrieve_version()
+                self.update_safe_cli_info()
                 return True
             return False
 
@@ -672,8 +1081,7 @@ class SafeOperator:
                 module_guard
             ).build_transaction({"from": self.address, "gas": 0, "gasPrice": 0})
             if self.execute_safe_internal_transaction(transaction["data"]):
-                self.safe_cli_info.module_guard = module_guard
-                self.safe_cli_info.version = self.safe.retrieve_version()
+                self.update_safe_cli_info()
                 return True
             return False
 
@@ -688,7 +1096,7 @@ class SafeOperator:
                 )
 
             try:
-                Safe(new_master_copy, self.ethereum_client).retrieve_version()
+                get_master_copy_version(self.ethereum_client, new_master_copy)
             except BadFunctionCallOutput:
                 raise InvalidMasterCopyException(new_master_copy) from None
 
@@ -696,8 +1104,7 @@ class SafeOperator:
                 new_master_copy
             ).build_transaction({"from": self.address, "gas": 0, "gasPrice": 0})
             if self.execute_safe_internal_transaction(transaction["data"]):
-                self.safe_cli_info.master_copy = new_master_copy
-                self.safe_cli_info.version = self.safe.retrieve_version()
+                self.refresh_safe_cli_info()
                 return True
             return False
 
@@ -750,11 +1157,7 @@ class SafeOperator:
             multisend_data,
             operation=SafeOperationEnum.DELEGATE_CALL,
         ):
-            self.safe_cli_info.master_copy = self.last_safe_contract_address
-            self.safe_cli_info.fallback_handler = (
-                self.last_default_fallback_handler_address
-            )
-            self.safe_cli_info.version = self.safe.retrieve_version()
+            self.refresh_safe_cli_info()
             return True
         return False
 
@@ -775,7 +1178,7 @@ class SafeOperator:
             )
 
         safe_version = self.safe.retrieve_version()
-        chain_id = self.ethereum_client.get_chain_id()
+        chain_id = get_chain_id(self.ethereum_client)
 
         if self.safe.retrieve_nonce() > 0:
             raise InvalidNonceException("Nonce must be 0 for non L2 to L2 migration")
@@ -794,19 +1197,15 @@ class SafeOperator:
                     safe_l2_singleton[0], fallback_handler[0]
                 ).build_transaction(get_empty_tx_params())["data"]
             )
-            safe_l2_singleton = safe_l2_singleton[0]
-            fallback_handler = fallback_handler[0]
         elif safe_version in ("1.3.0", "1.4.1"):
             safe_l2_singleton = safe_deployments[safe_version]["GnosisSafeL2"][
                 str(chain_id)
             ]
-            fallback_handler = self.safe_cli_info.fallback_handler
             data = HexBytes(
                 l2_migration_contract.functions.migrateToL2(
                     safe_l2_singleton[0]
                 ).build_transaction(get_empty_tx_params())["data"]
             )
-            safe_l2_singleton = safe_l2_singleton[0]
         else:
             raise InvalidMasterCopyException(
                 "Current version is not supported to migrate to L2"
@@ -818,9 +1217,7 @@ class SafeOperator:
             data,
             operation=SafeOperationEnum.DELEGATE_CALL,
         ):
-            self.safe_cli_info.master_copy = safe_l2_singleton
-            self.safe_cli_info.fallback_handler = fallback_handler
-            self.safe_cli_info.version = self.safe.retrieve_version()
+            self.refresh_safe_cli_info()
             return True
         return False
 
@@ -846,7 +1243,7 @@ class SafeOperator:
             ).build_transaction({"from": self.address, "gas": 0, "gasPrice": 0})
 
             if self.execute_safe_internal_transaction(transaction["data"]):
-                self.safe_cli_info.threshold = self.safe.retrieve_threshold()
+                self.update_safe_cli_info()
 
     def enable_module(self, module_address: str):
         if module_address in self.safe_cli_info.modules:
@@ -858,7 +1255,7 @@ class SafeOperator:
                 module_address
             ).build_transaction({"from": self.address, "gas": 0, "gasPrice": 0})
             if self.execute_safe_internal_transaction(transaction["data"]):
-                self.safe_cli_info.modules = self.safe.retrieve_modules()
+                self.update_safe_cli_info()
 
     def disable_module(self, module_address: str):
         if module_address not in self.safe_cli_info.modules:
@@ -875,7 +1272,7 @@ class SafeOperator:
                 previous_address, module_address
             ).build_transaction({"from": self.address, "gas": 0, "gasPrice": 0})
             if self.execute_safe_internal_transaction(transaction["data"]):
-                self.safe_cli_info.modules = self.safe.retrieve_modules()
+                self.update_safe_cli_info()
 
     def print_info(self):
         for key, value in dataclasses.asdict(self.safe_cli_info).items():
@@ -948,12 +1345,23 @@ class SafeOperator:
                 )
             )
 
-    def get_safe_cli_info(self) -> SafeCliInfo:
+    def get_safe_cli_info(
+        self, block_identifier: BlockIdentifier = "latest"
+    ) -> SafeCliInfo:
+        """
+        :param block_identifier:
+        :return: `SafeCliInfo` with every field retrieved on the same block. Multicall3
+            is used if available, otherwise fields are retrieved using regular calls
+        """
+        safe_cli_info = self._get_safe_cli_info_using_multicall(block_identifier)
+        if safe_cli_info:
+            return safe_cli_info
+
         safe = self.safe
         balance_ether = Web3.from_wei(
-            self.ethereum_client.get_balance(self.address), "ether"
+            self.ethereum_client.get_balance(self.address, block_identifier), "ether"
         )
-        safe_info = safe.retrieve_all_info()
+        safe_info = safe.retrieve_all_info(block_identifier)
         return SafeCliInfo(
             self.address,
             safe_info.nonce,
@@ -968,6 +1376,104 @@ class SafeOperator:
             safe_info.version,
         )
 
+    def _get_safe_cli_info_using_multicall(
+        self, block_identifier: BlockIdentifier = "latest"
+    ) -> SafeCliInfo | None:
+        """
+        Retrieve every `SafeCliInfo` field in one Multicall3 `aggregate3` call. Block
+        number is also returned by Multicall3, so fields that cannot be retrieved that
+        way (e.g. `getStorageAt` is not available for Safes < v1.3.0) are requested
+        individually for the same block.
+
+        :param block_identifier:
+        :return: `SafeCliInfo` or `None` if Multicall3 is not available or the Safe
+            cannot be detected
+        """
+        multicall = self.ethereum_client.multicall
+        if not multicall:
+            return None
+
+        calls = [
+            (multicall.address, encode_call_data("getBlockNumber()")),
+            (
+                multicall.address,
+                encode_call_data("getEthBalance(address)", ["address"], [self.address]),
+            ),
+        ]
+        calls.extend(
+            (
+                self.address,
+                encode_call_data(
+                    "getStorageAt(uint256,uint256)", ["uint256", "uint256"], [slot, 1]
+                ),
+            )
+            for slot in SAFE_INFO_STORAGE_SLOTS
+        )
+        calls.extend(
+            (self.address, encode_call_data(signature, types, args))
+            for signature, types, args, _ in SAFE_INFO_CALLS
+        )
+        try:
+            results = multicall3_aggregate3(
+                self.ethereum_client, multicall.address, calls, block_identifier
+            )
+        except (Web3Exception, ValueError):
+            return None
+
+        block_number, balance = (
+            decode_call_result(["uint256"], result) for result in results[:2]
+        )
+        if block_number is None:
+            return None
+
+        number_storage_slots = len(SAFE_INFO_STORAGE_SLOTS)
+        master_copy, fallback_handler, guard, module_guard = (
+            decode_storage_address(decode_call_result(["bytes"], result))
+            for result in results[2 : 2 + number_storage_slots]
+        )
+        version, nonce, owners, threshold, modules_response = (
+            decode_call_result(output_types, result)
+            for (*_, output_types), result in zip(
+                SAFE_INFO_CALLS, results[2 + number_storage_slots :], strict=True
+            )
+        )
+
+        safe = self.safe
+        if master_copy in (None, NULL_ADDRESS):  # Maybe not a `SafeProxy`
+            master_copy = safe.retrieve_master_copy_address(block_number)
+            if master_copy == NULL_ADDRESS:
+                return None
+        if fallback_handler is None:
+            fallback_handler = safe.retrieve_fallback_handler(block_number)
+        if guard is None:
+            guard = safe.retrieve_transaction_guard(block_number)
+        if module_guard is None:
+            module_guard = safe.retrieve_module_guard(block_number)
+        if balance is None:
+            balance = self.ethereum_client.get_balance(self.address, block_number)
+        if version is None:
+            version = safe.retrieve_version(block_number)
+        if nonce is None:
+            nonce = safe.retrieve_nonce(block_number)
+        if owners is None:
+            owners = safe.retrieve_owners(block_number)
+        if threshold is None:
+            threshold = safe.retrieve_threshold(block_number)
+
+        return SafeCliInfo(
+            self.address,
+            nonce,
+            threshold,
+            [Web3.to_checksum_address(owner) for owner in owners],
+            master_copy,
+            self._get_modules_from_response(safe, modules_response, block_number),
+            fallback_handler,
+            guard,
+            module_guard,
+            Web3.from_wei(balance, "ether"),
+            version,
+        )
+
     def get_threshold(self) -> int:
         threshold = self.safe.retrieve_threshold()
         print_formatted_text(threshold)
@@ -1053,9 +1559,7 @@ class SafeOperator:
                         f"and safe-nonce {safe_tx.safe_nonce}, waiting for receipt</ansigreen>"
                     )
                 )
-                tx_receipt = self.ethereum_client.get_transaction_receipt(
-                    tx_hash, timeout=120
-                )
+                tx_receipt = self.receipt_tracker.wait(tx_hash, timeout=120)
                 if tx_receipt:
                     fees = self.ethereum_client.w3.from_wei(
                         tx_receipt["gasUsed"]
@@ -1068,7 +1572,7 @@ class SafeOperator:
                             f"deducted={fees}</ansigreen>"
                         )
                     )
-                    self.safe_cli_info.nonce = safe_tx.safe_nonce + 1
+                    self._set_safe_cli_nonce(safe_tx.safe_nonce + 1)
                     return True
                 else:
                     print_formatted_text(
@@ -1080,17 +1584,238 @@ class SafeOperator:
             print_formatted_text(
                 HTML(f"Result: <ansired>InvalidTx - {invalid_internal_tx}</ansired>")
             )
+            self.diagnose_multisend_tx(safe_tx)
         return False
 
+    def _send_safe_tx(
+        self, safe_tx: SafeTx, gas: int, gas_price: int, nonce: int
+    ) -> HexBytes:
+        if self.default_sender:
+            tx_hash, _ = safe_tx.execute(
+                self.default_sender.key,
+                tx_gas=gas,
+                tx_gas_price=gas_price,
+                tx_nonce=nonce,
+            )
+        else:
+            tx_hash, _ = self.hw_wallet_manager.execute_safe_tx(
+                safe_tx, tx_gas=gas, tx_gas_price=gas_price, tx_nonce=nonce
+            )
+        return tx_hash
+
+    @require_default_sender  # Throws Exception if default sender not found
+    def execute_safe_transactions(self, safe_txs: Sequence[SafeTx]) -> bool:
+        """
+        Execute transactions with consecutive Safe nonces. Transactions are sent
+        without waiting for the previous ones to be mined, and stuck transactions are
+        replaced with a higher gas price
+
+        :param safe_txs: Signed transactions, sorted by Safe nonce
+        :return: `True` if every transaction was executed
+        """
+        if len(safe_txs) <= 1:
+            return all(self.execute_safe_transaction(safe_tx) for safe_tx in safe_txs)
+
+        try:
+            # Next transactions can only be simulated after the previous ones are mined
+            call_result = safe_txs[0].call(
+                (self.default_sender or self.hw_wallet_manager.sender).address
+            )
+            print_formatted_text(HTML(f"Result: <ansigreen>{call_result}</ansigreen>"))
+        except InvalidInternalTx as invalid_internal_tx:
+            print_formatted_text(
+                HTML(f"Result: <ansired>InvalidTx - {invalid_internal_tx}</ansired>")
+            )
+            self.diagnose_multisend_tx(safe_txs[0])
+            return False
+
+        if self.interactive and not yes_or_no_question(
+            f"Do you want to execute {len(safe_txs)} txs with safe-nonces "
+            f"{safe_txs[0].safe_nonce} to {safe_txs[-1].safe_nonce}"
+        ):
+            return False
+
+        def print_pipelined_tx(pipelined_tx: PipelinedSafeTx):
+            tx_hash = to_0x_hex_str(pipelined_tx.tx_hash or b"")
+            safe_nonce = pipelined_tx.safe_tx.safe_nonce
+            if pipelined_tx.error:
+                message = f"<ansired>Tx with safe-nonce {safe_nonce} failed: {html.escape(pipelined_tx.error)}</ansired>"
+            elif pipelined_tx.receipt:
+                message = (
+                    f"<ansigreen>Tx with safe-nonce {safe_nonce} was executed on "
+                    f"block-number={pipelined_tx.receipt['blockNumber']}</ansigreen>"
+                )
+            else:
+                message = (
+                    f"<ansigreen>Sent tx with tx-hash {tx_hash} and safe-nonce "
+                    f"{safe_nonce} (sender nonce {pipelined_tx.nonce}, gas-price "
+                    f"{pipelined_tx.gas_price})</ansigreen>"
+                )
+            print_formatted_text(HTML(message))
+
+        pipeline = SafeTxPipeline(
+            self.ethereum_client,
+            (self.default_sender or self.hw_wallet_manager.sender).address,
+            self._send_safe_tx,
+            receipt_tracker=self.receipt_tracker,
+        )
+        pipelined_txs = pipeline.execute(safe_txs, on_update=print_pipelined_tx)
+        for pipelined_tx in pipelined_txs:
+            if pipelined_tx.tx_hash:
+                self.executed_transactions.append(to_0x_hex_str(pipelined_tx.tx_hash))
+            if pipelined_tx.receipt:
+                self._set_safe_cli_nonce(pipelined_tx.safe_tx.safe_nonce + 1)
+        return all(pipelined_tx.succeeded for pipelined_tx in pipelined_txs)
+
+    def diagnose_multisend_tx(self, safe_tx: SafeTx) -> MultiSendFailure | None:
+        """
+        Look for the inner transaction making a MultiSend batch fail and print it
+
+        :param safe_tx: Failing transaction
+        :return: First failing inner transaction. `None` if `safe_tx` is not a
+            MultiSend batch or inner transactions do not fail
+        """
+        if safe_tx.operation != SafeOperationEnum.DELEGATE_CALL.value:
+            return None
+        multisend_txs = MultiSend.from_transaction_data(safe_tx.data)
+        if not multisend_txs:
+            return None
+
+        print_formatted_text(
+            HTML(
+                f"Simulating the {len(multisend_txs)} transactions of the batch "
+                f"to find the failing one"
+            )
+        )
+        failure = find_failing_multisend_tx(
+            self.ethereum_client, self.address, safe_tx.to, multisend_txs
+        )
+        if failure and failure.self_call:
+            print_formatted_text(
+                HTML(
+                    f"<ansiyellow>Transactions before index={failure.index} succeed. "
+                    f"Transaction with index={failure.index} calls the Safe, so it "
+                    f"and the next ones cannot be diagnosed</ansiyellow>"
+                )
+            )
+        elif failure:
+            print_formatted_text(
+                HTML(
+                    f"<ansired>Transaction with index={failure.index} "
+                    f"to={failure.multisend_tx.to} value={failure.multisend_tx.value} "
+                    f"operation={failure.multisend_tx.operation.name} failed"
+                    f"{': ' + html.escape(failure.revert_reason) if failure.revert_reason else ''}"
+                    f"</ansired>"
+                )
+            )
+        else:
+            print_formatted_text(
+                HTML(
+                    "<ansiyellow>No failing transaction found on the batch, or node "
+                    "does not support state overrides</ansiyellow>"
+                )
+            )
+        return failure
+
+    def get_multisend_gas_limit(self) -> int:
+        """
+        :return: Gas ceiling for every MultiSend transaction, never over the block gas limit
+        """
+        gas_limit = int(
+            os.environ.get("SAFE_CLI_MULTISEND_GAS_LIMIT", MULTISEND_GAS_LIMIT)
+        )
+        try:
+            block_gas_limit = self.ethereum_client.w3.eth.get_block("latest")[
+                "gasLimit"
+            ]
+        except (Web3Exception, ValueError, RequestException):
+            return gas_limit
+        return min(gas_limit, block_gas_limit)
+
+    def estimate_multisend_txs_gas(
+        self, multisend_txs: Sequence[MultiSendTx]
+    ) -> list[int]:
+        """
+        Estimate every inner transaction as a call from the Safe, using one JSON-RPC batch
+        of `eth_estimateGas`. Calldata and MultiSend dispatch overhead are included
+
+        :param multisend_txs:
+        :return: Gas for every transaction, in the same order
+        """
+        requests = [
+            (
+                "eth_estimateGas",
+                [
+                    {
+                        "from": self.address,
+                        "to": multisend_tx.to,
+                        "value": hex(multisend_tx.value),
+                        "data": to_0x_hex_str(HexBytes(multisend_tx.data)),
+                    }
+                ],
+            )
+            for multisend_tx in multisend_txs
+        ]
+        try:
+            estimations = batch_rpc_request(self.ethereum_client, requests)
+        except (ValueError, RequestException):
+            estimations = [None] * len(requests)
+
+        gas = []
+        for multisend_tx, estimation in zip(multisend_txs, estimations, strict=True):
+            if estimation is None:
+                tx_gas = MULTISEND_TX_DEFAULT_GAS
+            else:
+                # Intrinsic gas is not paid by inner transactions
+                tx_gas = max(int(estimation, 16) - 21_000, 0)
+            gas.append(
+                tx_gas + MULTISEND_TX_BASE_GAS + 16 * len(multisend_tx.encoded_data)
+            )
+        return gas
+
+    def plan_multisend_chunks(
+        self, multisend_txs: Sequence[MultiSendTx], gas_limit: int
+    ) -> list[list[MultiSendTx]]:
+        """
+        Split the transactions, keeping the order, in the fewest chunks using less gas
+        than `gas_limit`. Transactions over the `gas_limit` are sent on their own chunk
+
+        :param multisend_txs:
+        :param gas_limit: Gas ceiling for every chunk
+        :return: Chunks of transactions
+        """
+        chunks: list[list[MultiSendTx]] = []
+        chunk_gas = 0
+        for multisend_tx, tx_gas in zip(
+            multisend_txs, self.estimate_multisend_txs_gas(multisend_txs), strict=True
+        ):
+            if not chunks or chunk_gas + tx_gas > gas_limit:
+                chunks.append([])
+                chunk_gas = SAFE_TX_BASE_GAS
+            chunks[-1].append(multisend_tx)
+            chunk_gas += tx_gas
+        return chunks
+
     # Batch_transactions multisend
     def batch_safe_txs(
-        self, safe_nonce: int, safe_txs: Sequence[SafeTx]
-    ) -> SafeTx | None:
+        self,
+        safe_nonce: int,
+        safe_txs: Sequence[SafeTx],
+        gas_limit: int | None = None,
+    ) -> list[SafeTx]:
         """
-        Submit signatures to the tx service. It's recommended to be on Safe v1.3.0 to prevent issues
+        Batch the transactions using MultiSend. If they do not fit in one transaction
+        under the `gas_limit`, they are split in the fewest MultiSend transactions
+        possible, keeping the order, with consecutive nonces. Every transaction is
+        signed in one pass. It's recommended to be on Safe v1.3.0 to prevent issues
         with `safeTxGas` and gas estimation.
 
-        :return:
+        :param safe_nonce: Nonce for the first transaction
+        :param safe_txs:
+        :param gas_limit: Gas ceiling for every transaction. `get_multisend_gas_limit`
+            by default
+        :return: Signed transactions to execute in order. Empty if transactions cannot
+            be batched or signed
         """
 
         try:
@@ -1127,33 +1852,64 @@ class SafeOperator:
             safe_tx.gas_price = 0
             safe_tx.signatures = b""
             safe_tx.safe_nonce = safe_nonce  # Resend single transaction
+            batched_txs = [safe_tx]
         elif multisend:
-            safe_tx = SafeTx(
-                self.ethereum_client,
-                self.address,
-                multisend.address,
-                0,
-                multisend.build_tx_data(multisend_txs),
-                SafeOperationEnum.DELEGATE_CALL.value,
-                0,
-                0,
-                0,
-                None,
-                None,
-                safe_nonce=safe_nonce,
+            chunks = self.plan_multisend_chunks(
+                multisend_txs, gas_limit or self.get_multisend_gas_limit()
             )
+            batched_txs = []
+            for nonce, chunk in enumerate(chunks, start=safe_nonce):
+                if len(chunk) == 1 and chunk[0].operation == MultiSendOperation.CALL:
+                    to, value, data, operation = (
+                        chunk[0].to,
+                        chunk[0].value,
+                        chunk[0].data,
+                        SafeOperationEnum.CALL,
+                    )
+                else:
+                    to, value, data, operation = (
+                        multisend.address,
+                        0,
+                        multisend.build_tx_data(chunk),
+                        SafeOperationEnum.DELEGATE_CALL,
+                    )
+                batched_txs.append(
+                    SafeTx(
+                        self.ethereum_client,
+                        self.address,
+                        to,
+                        value,
+                        data,
+                        operation.value,
+                        0,
+                        0,
+                        0,
+                        None,
+                        None,
+                        safe_nonce=nonce,
+                    )
+                )
+            if len(batched_txs) > 1:
+                print_formatted_text(
+                    HTML(
+                        f"<ansiyellow>Transactions were split in {len(batched_txs)} "
+                        f"Safe transactions with nonces {safe_nonce} to "
+                        f"{safe_nonce + len(batched_txs) - 1} to fit under the gas "
+                        f"limit</ansiyellow>"
+                    )
+                )
         else:
             # Multisend not defined
-            return None
+            return []
 
-        safe_tx = self.sign_transaction(safe_tx)
-        if not safe_tx.signatures:
+        batched_txs = self.sign_transactions(batched_txs)
+        if not all(safe_tx.signatures for safe_tx in batched_txs):
             print_formatted_text(
                 HTML("<ansired>At least one owner must be loaded</ansired>")
             )
-            return None
+            return []
         else:
-            return safe_tx
+            return batched_txs
 
     def get_signers(self) -> tuple[list[LocalAccount], list[HwWallet]]:
         """
@@ -1199,6 +1955,22 @@ class SafeOperator:
 
         return safe_tx
 
+    def sign_transactions(self, safe_txs: Sequence[SafeTx]) -> list[SafeTx]:
+        """
+        Sign several transactions. Hardware wallets sign all of them in one session
+
+        :param safe_txs:
+        :return: Signed transactions, in the same order
+        """
+        eoa_signers, hw_wallets_signers = self.get_signers()
+        for safe_tx in safe_txs:
+            for selected_account in eoa_signers:
+                safe_tx.sign(selected_account.key)
+
+        if len(hw_wallets_signers):
+            return self.hw_wallet_manager.sign_safe_txs(safe_txs, hw_wallets_signers)
+        return list(safe_txs)
+
     @require_tx_service
     def _require_tx_service_mode(self):
         print_formatted_text(
@@ -1219,11 +1991,158 @@ class SafeOperator:
     def submit_signatures(self, safe_tx_hash: bytes) -> bool:
         return self._require_tx_service_mode()
 
-    def get_balances(self):
+    def submit_signatures_batch(self, safe_tx_hashes: Sequence[bytes]) -> bool:
         return self._require_tx_service_mode()
 
-    def get_transaction_history(self):
-        return self._require_tx_service_mode()
+    @staticmethod
+    def _get_balance_row(
+        name: str | None,
+        balance: int,
+        symbol: str | None,
+        decimals: int | None,
+        token_address: ChecksumAddress | None,
+    ) -> list:
+        """
+        :return: Row for the `balances` table
+        """
+        return [
+            name,
+            f"{balance / 10 ** int(decimals or 0):.5f}",
+            symbol,
+            decimals,
+            token_address or "",
+        ]
+
+    @staticmethod
+    def _print_token_balances_error(error: Exception) -> None:
+        print_formatted_text(
+            HTML(
+                "<ansired>Cannot retrieve token balances from the node, "
+                f"try again later: {html.escape(str(error))}</ansired>"
+            )
+        )
+
+    def get_balances(self):
+        """
+        Print the balance of Ether and every ERC20 token the Safe interacted with,
+        without requiring the tx service. Tokens are found using the token index, and
+        balances are retrieved using Multicall3
+
+        :return: Rows of the balances table
+        """
+        token_addresses = get_safe_tokens(self.ethereum_client, self.address)
+        try:
+            token_balances = get_token_balances(
+                self.ethereum_client, self.address, sorted(token_addresses)
+            )
+        except (Web3Exception, ValueError, RequestException) as e:
+            self._print_token_balances_error(e)
+            return []
+        rows = [
+            self._get_balance_row(
+                token_balance.name,
+                token_balance.balance,
+                token_balance.symbol,
+                token_balance.decimals,
+                token_balance.token_address,
+            )
+            for token_balance in token_balances
+            if token_balance.balance or not token_balance.token_address
+        ]
+        print(tabulate(rows, headers=BALANCES_TABLE_HEADERS))
+        return rows
+
+    def iter_transaction_history(
+        self, limit: int | None = None, since_nonce: int | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """
+        :param limit: Maximum number of transactions
+        :param since_nonce: Only transactions with this nonce or higher
+        :return: Executed transactions indexed from the events of the Safe, newest
+            first. Index is updated with the blocks not indexed before
+        """
+        self.safe_event_index.update(self.ethereum_client, self.address)
+        return self.safe_event_index.iter_executions(
+            get_chain_id(self.ethereum_client), self.address, since_nonce, limit
+        )
+
+    def get_transaction_decoded_text(self, transaction: dict[str, Any]) -> str | None:
+        """
+        :return: Text for the `dataDecoded` column of the history
+        """
+        return (
+            "\n".join(
+                event["event"]
+                + "("
+                + ", ".join(f"{key}={value}" for key, value in event["args"].items())
+                + ")"
+                for event in transaction.get("events", [])
+            )
+            or None
+        )
+
+    def iter_transaction_history_rows(
+        self, limit: int | None = None, since_nonce: int | None = None
+    ) -> Iterator[list[str]]:
+        """
+        :return: Colorized table rows for `iter_transaction_history`
+        """
+        headers = ["nonce", "to", "value", "transactionHash", "safeTxHash"]
+        last_executed_tx = False
+        for transaction in self.iter_transaction_history(limit, since_nonce):
+            row = [transaction[header] for header in headers]
+            if decoded_text := self.get_transaction_decoded_text(transaction):
+                row.append(decoded_text)
+            if transaction["transactionHash"]:
+                if not transaction["isSuccessful"]:
+                    # Transaction failed
+                    row[0] = Fore.RED + str(row[0])
+                else:
+                    row[0] = Fore.GREEN + str(
+                        row[0]
+                    )  # For executed transactions we use green
+                    if not last_executed_tx:
+                        row[0] = Style.BRIGHT + row[0]
+                        last_executed_tx = True
+            else:
+                row[0] = Fore.YELLOW + str(
+                    row[0]
+                )  # For non executed transactions we use yellow
+
+            row[0] = Style.RESET_ALL + row[0]  # Reset all just in case
+            yield row
+
+    def get_transaction_history(
+        self,
+        limit: int | None = None,
+        since_nonce: int | None = None,
+        output_format: str = "table",
+    ) -> int:
+        """
+        Print the transaction history page by page, as it is retrieved
+
+        :param limit: Maximum number of transactions
+        :param since_nonce: Only transactions with this nonce or higher
+        :param output_format: `table`, or `jsonl` to print every transaction as a JSON
+            line
+        :return: Number of transactions printed
+        """
+        printed = 0
+        if output_format == "jsonl":
+            for transaction in self.iter_transaction_history(limit, since_nonce):
+                print(json.dumps(transaction), flush=True)
+                printed += 1
+            return printed
+
+        headers = ["nonce", "to", "value", "transactionHash", "safeTxHash"]
+        headers.append("dataDecoded")
+        headers[0] = Style.BRIGHT + headers[0]
+        rows = self.iter_transaction_history_rows(limit, since_nonce)
+        while page := list(islice(rows, TX_HISTORY_PAGE_SIZE)):
+            # Only first page has headers, column widths are computed for every page
+            print(tabulate(page, headers=headers if not printed else ()), flush=True)
+            printed += len(page)
+        return printed
 
     def batch_txs(self, safe_nonce: int, safe_tx_hashes: Sequence[bytes]) -> bool:
         return self._require_tx_service_mode()
@@ -1239,22 +2158,30 @@ class SafeOperator:
 
     def drain(self, to: str):
         # Getting all events related with ERC20 transfers
-        last = self.ethereum_client.get_block("latest")["number"]
-        token_addresses = get_erc_20_list(self.ethereum_client, self.address, 1, last)
-        safe_txs = []
-        for token_address in token_addresses:
-            balance = self.ethereum_client.erc20.get_balance(
-                self.address, token_address
+        token_addresses = get_safe_tokens(self.ethereum_client, self.address)
+        try:
+            token_balances = get_token_balances(
+                self.ethereum_client,
+                self.address,
+                sorted(token_addresses),
+                include_native_balance=False,
             )
-            if balance > 0:
+        except (Web3Exception, ValueError, RequestException) as e:
+            self._print_token_balances_error(e)
+            return None
+        safe_txs = []
+        for token_balance in token_balances:
+            if token_balance.balance > 0:
                 transaction = (
-                    get_erc20_contract(self.ethereum_client.w3, token_address)
-                    .functions.transfer(to, balance)
+                    get_erc20_contract(
+                        self.ethereum_client.w3, token_balance.token_address
+                    )
+                    .functions.transfer(to, token_balance.balance)
                     .build_transaction({"from": self.address, "gas": 0, "gasPrice": 0})
                 )
 
                 safe_tx = self.prepare_safe_transaction(
-                    token_address,
+                    token_balance.token_address,
                     0,
                     HexBytes(transaction["data"]),
                     SafeOperationEnum.CALL,
@@ -1275,14 +2202,13 @@ class SafeOperator:
             safe_txs.append(safe_tx)
 
         if safe_txs:
-            multisend_tx = self.batch_safe_txs(self.safe.retrieve_nonce(), safe_txs)
-            if multisend_tx is not None:
-                if self.execute_safe_transaction(multisend_tx):
-                    print_formatted_text(
-                        HTML(
-                            "<ansigreen>Transaction to drain account correctly executed</ansigreen>"
-                        )
+            batched_txs = self.batch_safe_txs(self.safe.retrieve_nonce(), safe_txs)
+            if batched_txs and self.execute_safe_transactions(batched_txs):
+                print_formatted_text(
+                    HTML(
+                        "<ansigreen>Transaction to drain account correctly executed</ansigreen>"
                     )
+                )
         else:
             print_formatted_text(
                 HTML("<ansigreen>Safe account is currently empty</ansigreen>")
@@ -1291,6 +2217,9 @@ class SafeOperator:
     def remove_proposed_transaction(self, safe_tx_hash: bytes):
         return self._require_tx_service_mode()
 
+    def sync_tx_service(self) -> bool:
+        return self._require_tx_service_mode()
+
     def process_command(self, first_command: str, rest_command: list[str]) -> bool:
         if first_command == "help":
             print_formatted_text("I still cannot help you")
@@ -1,13 +1,16 @@
+import html
 import json
-from collections.abc import Sequence
+import time
+from collections.abc import Iterator, Sequence
+from itertools import islice
 from typing import Any
 
-from colorama import Fore, Style
 from eth_account.messages import defunct_hash_message
 from eth_account.signers.local import LocalAccount
 from eth_typing import ChecksumAddress
 from hexbytes import HexBytes
 from prompt_toolkit import HTML, print_formatted_text
+from requests import RequestException
 from safe_eth.eth.contracts import get_erc20_contract
 from safe_eth.eth.eip712 import eip712_encode_hash
 from safe_eth.safe import SafeOperationEnum, SafeTx
@@ -21,10 +24,18 @@ from safe_eth.safe.signatures import signature_to_bytes
 from safe_eth.util.util import to_0x_hex_str
 from tabulate import tabulate
 
+from ..chain_cache import get_chain_id
+from ..safe_tx_fetcher import fetch_safe_transactions
+from ..ttl_cache import TtlCache
+from ..tx_history import TX_HISTORY_PAGE_SIZE, iter_multisig_transactions
+from ..tx_service_mirror import TX_SERVICE_MIRROR_MAX_AGE, get_tx_service_mirror
 from ..utils import get_input, yes_or_no_question
-from . import SafeServiceNotAvailable
-from .exceptions import AccountNotLoadedException, NonExistingOwnerException
-from .safe_operator import SafeOperator
+from .exceptions import (
+    AccountNotLoadedException,
+    NonExistingOwnerException,
+    SafeServiceNotAvailable,
+)
+from .safe_operator import BALANCES_TABLE_HEADERS, SafeOperator
 
 
 class SafeTxServiceOperator(SafeOperator):
@@ -37,6 +48,104 @@ class SafeTxServiceOperator(SafeOperator):
         self.require_all_signatures = (
             False  # It doesn't require all signatures to be present to send a tx
         )
+        self.tx_service_cache = TtlCache()  # Slow changing tx service reads
+        self.tx_service_mirror = get_tx_service_mirror()
+
+    def is_tx_service_mirror_synced(self) -> bool:
+        """
+        :return: `True` if the Safe was synced to the local mirror, so read-only
+            commands are served from it
+        """
+        return bool(
+            self.tx_service_mirror.get_synced_at(
+                self.safe_tx_service.network.value, self.address
+            )
+        )
+
+    def use_tx_service_mirror(self) -> bool:
+        """
+        Mirror is synced again if it is older than `TX_SERVICE_MIRROR_MAX_AGE`. If
+        tx service cannot be reached, the stored data is used
+
+        :return: `True` if read-only commands must be served from the local mirror
+        """
+        synced_at = self.tx_service_mirror.get_synced_at(
+            self.safe_tx_service.network.value, self.address
+        )
+        if not synced_at:
+            return False
+        if time.time() - synced_at > TX_SERVICE_MIRROR_MAX_AGE:
+            try:
+                self.tx_service_mirror.sync(self.safe_tx_service, self.address)
+            except (SafeAPIException, RequestException) as e:
+                print_formatted_text(
+                    HTML(
+                        "<ansiyellow>Cannot sync with tx service, showing data of the "
+                        f"last sync: {html.escape(str(e))}</ansiyellow>"
+                    )
+                )
+        return True
+
+    def refresh_tx_service_mirror_transaction(self, safe_tx_hash: bytes) -> None:
+        """
+        Update the mirrored transaction after the cli changed it on the tx service.
+        If it cannot be retrieved, it is removed, and next sync stores it again
+        """
+        try:
+            self.tx_service_mirror.refresh_multisig_transaction(
+                self.safe_tx_service, self.address, safe_tx_hash
+            )
+        except (SafeAPIException, RequestException):
+            self.tx_service_mirror.delete_multisig_transaction(
+                self.safe_tx_service.network.value, safe_tx_hash
+            )
+            self.tx_service_mirror.expire(
+                self.safe_tx_service.network.value, self.address
+            )
+
+    def sync_tx_service(self) -> bool:
+        """
+        Mirror transactions, confirmations, messages and delegates of the Safe to a
+        local database. Only changes since the previous sync are retrieved
+
+        :return: `True` if sync succeeded
+        """
+        try:
+            result = self.tx_service_mirror.sync(self.safe_tx_service, self.address)
+        except (SafeAPIException, RequestException) as e:
+            print_formatted_text(
+                HTML(
+                    f"<ansired>Cannot sync with tx service: {html.escape(str(e))}</ansired>"
+                )
+            )
+            return False
+        self.tx_service_cache.invalidate("delegates")
+        print_formatted_text(
+            HTML(
+                f"<ansigreen>Synced {result.transactions} new or modified transactions, "
+                f"{result.messages} messages and {result.delegates} delegates"
+                "</ansigreen>"
+            )
+        )
+        return True
+
+    def get_cached_delegates(self, refresh: bool = False) -> list[dict[str, Any]]:
+        """
+        :param refresh: Retrieve the delegates from the tx service even if cached
+        :return: Delegates of the Safe, cached for `TX_SERVICE_CACHE_TTL` seconds
+        """
+        if refresh:
+            self.tx_service_cache.invalidate("delegates")
+        return self.tx_service_cache.get_or_set(
+            "delegates", lambda: self.safe_tx_service.get_delegates(self.address)
+        )
+
+    def invalidate_chain_cache(self):
+        self.tx_service_cache.invalidate()
+        self.tx_service_mirror.invalidate(
+            self.safe_tx_service.network.value, self.address
+        )
+        super().invalidate_chain_cache()
 
     def approve_hash(self, hash_to_approve: HexBytes, sender: str) -> bool:
         raise NotImplementedError("Not supported when using tx service")
@@ -80,6 +189,9 @@ class SafeTxServiceOperator(SafeOperator):
             return False
 
         if self.safe_tx_service.post_message(self.address, message, signature):
+            self.tx_service_mirror.expire(
+                self.safe_tx_service.network.value, self.address
+            )
             print_formatted_text(
                 HTML(
                     f"<ansigreen>Message  with safe-message-hash {to_0x_hex_str(safe_message_hash)} was correctly created on Safe Transaction Service</ansigreen>"
@@ -131,6 +243,10 @@ class SafeTxServiceOperator(SafeOperator):
                 HTML(f"<ansired>Message wasn't confirmed due an error: {e}</ansired>")
             )
             return False
+        self.tx_service_mirror.delete_message(
+            self.safe_tx_service.network.value, safe_message_hash
+        )
+        self.tx_service_mirror.expire(self.safe_tx_service.network.value, self.address)
         print_formatted_text(
             HTML(
                 f"<ansigreen>Message with safe-message-hash {to_0x_hex_str(safe_message_hash)} was correctly confirmed on Safe Transaction Service</ansigreen>"
@@ -139,7 +255,12 @@ class SafeTxServiceOperator(SafeOperator):
         return True
 
     def get_delegates(self):
-        delegates = self.safe_tx_service.get_delegates(self.address)
+        if self.use_tx_service_mirror():
+            delegates = self.tx_service_mirror.get_delegates(
+                self.safe_tx_service.network.value, self.address
+            )
+        else:
+            delegates = self.get_cached_delegates(refresh=True)
         headers = ["delegate", "delegator", "label"]
         rows = []
         for delegate in delegates:
@@ -167,6 +288,18 @@ class SafeTxServiceOperator(SafeOperator):
                     signature.signature,
                     safe_address=self.address,
                 )
+                delegate = {
+                    "safe": self.address,
+                    "delegate": delegate_address,
+                    "delegator": signer_account.address,
+                    "label": label,
+                }
+                self.tx_service_cache.update(
+                    "delegates", lambda delegates: [*delegates, delegate]
+                )
+                self.tx_service_mirror.store_delegate(
+                    self.safe_tx_service.network.value, self.address, delegate
+                )
                 return True
             except SafeAPIException:
                 return False
@@ -189,10 +322,53 @@ class SafeTxServiceOperator(SafeOperator):
                     signature.signature,
                     safe_address=self.address,
                 )
+                self.tx_service_cache.update(
+                    "delegates",
+                    lambda delegates: [
+                        delegate
+                        for delegate in delegates
+                        if (delegate["delegate"], delegate["delegator"])
+                        != (delegate_address, signer_account.address)
+                    ],
+                )
+                self.tx_service_mirror.delete_delegate(
+                    self.safe_tx_service.network.value,
+                    self.address,
+                    delegate_address,
+                    signer_account.address,
+                )
                 return True
             except SafeAPIException:
                 return False
 
+    def get_safe_transactions(
+        self, safe_tx_hashes: Sequence[bytes]
+    ) -> list[tuple[SafeTx, HexBytes | None]]:
+        """
+        Retrieve the transactions concurrently from the tx service. Local mirror is not
+        used, as they are retrieved to be signed or executed
+
+        :param safe_tx_hashes:
+        :return: `SafeTx` and `tx-hash` (if executed) for every `safe_tx_hash`, in the
+            same order
+        :raises: SafeTxFetchException with every `safe-tx-hash` that failed
+        """
+        return self._fetch_safe_transactions(safe_tx_hashes)
+
+    def _fetch_safe_transactions(
+        self, safe_tx_hashes: Sequence[bytes]
+    ) -> list[tuple[SafeTx, HexBytes | None]]:
+        return fetch_safe_transactions(self.safe_tx_service, safe_tx_hashes)
+
+    def get_safe_transaction(
+        self, safe_tx_hash: bytes
+    ) -> tuple[SafeTx, HexBytes | None]:
+        """
+        :return: `SafeTx` and `tx-hash` if executed
+        :raises: SafeTxFetchException
+        """
+        return self.get_safe_transactions([safe_tx_hash])[0]
+
     def submit_signatures(self, safe_tx_hash: bytes) -> bool:
         """
         Submit signatures to the tx service
@@ -200,7 +376,7 @@ class SafeTxServiceOperator(SafeOperator):
         :return:
         """
 
-        safe_tx, tx_hash = self.safe_tx_service.get_safe_transaction(safe_tx_hash)
+        safe_tx, tx_hash = self.get_safe_transaction(safe_tx_hash)
         safe_tx.signatures = b""  # Don't post again existing signatures
         if tx_hash:
             print_formatted_text(
@@ -213,6 +389,7 @@ class SafeTxServiceOperator(SafeOperator):
             safe_tx = self.sign_transaction(safe_tx)
             if safe_tx.signers:
                 self.safe_tx_service.post_signatures(safe_tx_hash, safe_tx.signatures)
+                self.refresh_tx_service_mirror_transaction(safe_tx_hash)
                 print_formatted_text(
                     HTML(
                         f"<ansigreen>{len(safe_tx.signers)} signatures were submitted to the tx service</ansigreen>"
@@ -227,6 +404,54 @@ class SafeTxServiceOperator(SafeOperator):
                 )
         return False
 
+    def submit_signatures_batch(self, safe_tx_hashes: Sequence[bytes]) -> bool:
+        """
+        Sign several transactions and submit the signatures to the tx service. Hardware
+        wallets sign all the transactions in one session
+
+        :return: `True` if signatures were submitted for every transaction
+        """
+        safe_txs = []
+        for safe_tx_hash, (safe_tx, tx_hash) in zip(
+            safe_tx_hashes, self.get_safe_transactions(safe_tx_hashes), strict=True
+        ):
+            if tx_hash:
+                print_formatted_text(
+                    HTML(
+                        f"<ansired>Tx with safe-tx-hash {to_0x_hex_str(safe_tx_hash)} "
+                        f"has already been executed on {to_0x_hex_str(tx_hash)}</ansired>"
+                    )
+                )
+            else:
+                safe_tx.signatures = b""  # Don't post again existing signatures
+                safe_txs.append(safe_tx)
+
+        if not safe_txs:
+            return False
+
+        submitted = 0
+        for safe_tx in self.sign_transactions(safe_txs):
+            if safe_tx.signers:
+                self.safe_tx_service.post_signatures(
+                    safe_tx.safe_tx_hash, safe_tx.signatures
+                )
+                self.refresh_tx_service_mirror_transaction(safe_tx.safe_tx_hash)
+                submitted += 1
+
+        if not submitted:
+            print_formatted_text(
+                HTML(
+                    "<ansired>Cannot generate signatures as there were no suitable signers</ansired>"
+                )
+            )
+            return False
+        print_formatted_text(
+            HTML(
+                f"<ansigreen>Signatures for {submitted} transactions were submitted to the tx service</ansigreen>"
+            )
+        )
+        return submitted == len(safe_tx_hashes)
+
     def batch_txs(self, safe_nonce: int, safe_tx_hashes: Sequence[bytes]) -> bool:
         """
         Submit signatures to the tx service. It's recommended to be on Safe v1.3.0 to prevent issues
@@ -247,8 +472,7 @@ class SafeTxServiceOperator(SafeOperator):
             return False
 
         multisend_txs = []
-        for safe_tx_hash in safe_tx_hashes:
-            safe_tx, _ = self.safe_tx_service.get_safe_transaction(safe_tx_hash)
+        for safe_tx, _ in self.get_safe_transactions(safe_tx_hashes):
             # Check if call is already a Multisend call
             inner_txs = MultiSend.from_transaction_data(safe_tx.data)
             if inner_txs:
@@ -296,7 +520,7 @@ class SafeTxServiceOperator(SafeOperator):
 
         :return:
         """
-        safe_tx, tx_hash = self.safe_tx_service.get_safe_transaction(safe_tx_hash)
+        safe_tx, tx_hash = self.get_safe_transaction(safe_tx_hash)
         if tx_hash:
             print_formatted_text(
                 HTML(
@@ -316,66 +540,63 @@ class SafeTxServiceOperator(SafeOperator):
         else:
             if executed := self.execute_safe_transaction(safe_tx):
                 self.refresh_safe_cli_info()
+                # Executed transaction is stored again when tx service indexes it
+                self.tx_service_mirror.delete_multisig_transaction(
+                    self.safe_tx_service.network.value, safe_tx_hash
+                )
+                self.tx_service_mirror.expire(
+                    self.safe_tx_service.network.value, self.address
+                )
             return executed
 
     def get_balances(self):
         balances = self.safe_tx_service.get_balances(self.address)
-        headers = ["name", "balance", "symbol", "decimals", "tokenAddress"]
         rows = []
         for balance in balances:
             if balance["tokenAddress"]:  # Token
-                row = [
+                row = self._get_balance_row(
                     balance["token"]["name"],
-                    f"{int(balance['balance']) / 10 ** int(balance['token']['decimals']):.5f}",
+                    int(balance["balance"]),
                     balance["token"]["symbol"],
                     balance["token"]["decimals"],
                     balance["tokenAddress"],
-                ]
+                )
             else:  # Ether
-                row = [
-                    "ETHER",
-                    f"{int(balance['balance']) / 10**18:.5f}",
-                    "Ξ",
-                    18,
-                    "",
-                ]
+                row = self._get_balance_row(
+                    "ETHER", int(balance["balance"]), "Ξ", 18, None
+                )
             rows.append(row)
-        print(tabulate(rows, headers=headers))
+        print(tabulate(rows, headers=BALANCES_TABLE_HEADERS))
         return rows
 
-    def get_transaction_history(self):
-        transactions = self.safe_tx_service.get_transactions(self.address)
-        headers = ["nonce", "to", "value", "transactionHash", "safeTxHash"]
-        rows = []
-        last_executed_tx = False
-        for transaction in transactions:
-            row = [transaction[header] for header in headers]
-            data_decoded: dict[str, Any] = transaction.get("dataDecoded")
-            if data_decoded:
-                row.append(self.safe_tx_service.data_decoded_to_text(data_decoded))
-            if transaction["transactionHash"]:
-                if not transaction["isSuccessful"]:
-                    # Transaction failed
-                    row[0] = Fore.RED + str(row[0])
-                else:
-                    row[0] = Fore.GREEN + str(
-                        row[0]
-                    )  # For executed transactions we use green
-                    if not last_executed_tx:
-                        row[0] = Style.BRIGHT + row[0]
-                        last_executed_tx = True
-            else:
-                row[0] = Fore.YELLOW + str(
-                    row[0]
-                )  # For non executed transactions we use yellow
-
-            row[0] = Style.RESET_ALL + row[0]  # Reset all just in case
-            rows.append(row)
+    def iter_transaction_history(
+        self, limit: int | None = None, since_nonce: int | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """
+        :param limit: Maximum number of transactions
+        :param since_nonce: Only transactions with this nonce or higher
+        :return: Transactions from the tx service, newest nonce first. Pages are
+            requested while the iterator is consumed. Local mirror is used if the Safe
+            was synced
+        """
+        if self.use_tx_service_mirror():
+            return self.tx_service_mirror.iter_multisig_transactions(
+                self.safe_tx_service.network.value, self.address, since_nonce, limit
+            )
+        return islice(
+            iter_multisig_transactions(
+                self.safe_tx_service,
+                self.address,
+                since_nonce=since_nonce,
+                page_size=min(limit or TX_HISTORY_PAGE_SIZE, TX_HISTORY_PAGE_SIZE),
+            ),
+            limit,
+        )
 
-        headers.append("dataDecoded")
-        headers[0] = Style.BRIGHT + headers[0]
-        print(tabulate(rows, headers=headers))
-        return rows
+    def get_transaction_decoded_text(self, transaction: dict[str, Any]) -> str | None:
+        if data_decoded := transaction.get("dataDecoded"):
+            return self.safe_tx_service.data_decoded_to_text(data_decoded)
+        return None
 
     def prepare_and_execute_safe_transaction(
         self,
@@ -398,6 +619,7 @@ class SafeTxServiceOperator(SafeOperator):
             return False
 
         self.safe_tx_service.post_transaction(safe_tx)
+        self.tx_service_mirror.expire(self.safe_tx_service.network.value, self.address)
         print_formatted_text(
             HTML(
                 f"<ansigreen>Tx with safe-tx-hash={to_0x_hex_str(safe_tx.safe_tx_hash)} was sent to Safe Transaction service</ansigreen>"
@@ -410,12 +632,7 @@ class SafeTxServiceOperator(SafeOperator):
         :return: Owners and delegates, as they also can sign a transaction for the tx service
         """
         owners = super().get_permitted_signers()
-        owners.update(
-            [
-                row["delegate"]
-                for row in self.safe_tx_service.get_delegates(self.address)
-            ]
-        )
+        owners.update([row["delegate"] for row in self.get_cached_delegates()])
         return owners
 
     # Function that sends all assets to an account (to)
@@ -449,9 +666,10 @@ class SafeTxServiceOperator(SafeOperator):
                 )
             safe_txs.append(safe_tx)
         if len(safe_txs) > 0:
-            multisend_tx = self.batch_safe_txs(safe_txs[0].safe_nonce, safe_txs)
-            if multisend_tx is not None:
-                self.post_transaction_to_tx_service(multisend_tx)
+            batched_txs = self.batch_safe_txs(safe_txs[0].safe_nonce, safe_txs)
+            if batched_txs:
+                for batched_tx in batched_txs:
+                    self.post_transaction_to_tx_service(batched_tx)
                 print_formatted_text(
                     HTML(
                         "<ansigreen>Transaction to drain account correctly created</ansigreen>"
@@ -464,11 +682,11 @@ class SafeTxServiceOperator(SafeOperator):
 
     def remove_proposed_transaction(self, safe_tx_hash: bytes):
         eip712_message = get_remove_transaction_message(
-            self.address, safe_tx_hash, self.ethereum_client.get_chain_id()
+            self.address, safe_tx_hash, get_chain_id(self.ethereum_client)
         )
         message_hash = eip712_encode_hash(eip712_message)
         try:
-            safe_tx, _ = self.safe_tx_service.get_safe_transaction(safe_tx_hash)
+            safe_tx, _ = self.get_safe_transaction(safe_tx_hash)
             signer = self.search_account(safe_tx.proposer)
             if not signer:
                 print_formatted_text(
@@ -503,6 +721,9 @@ class SafeTxServiceOperator(SafeOperator):
             self.safe_tx_service.delete_transaction(
                 to_0x_hex_str(safe_tx_hash), to_0x_hex_str(signature)
             )
+            self.tx_service_mirror.delete_multisig_transaction(
+                self.safe_tx_service.network.value, safe_tx_hash
+            )
             print_formatted_text(
                 HTML(
                     f"<ansigreen>Transaction {to_0x_hex_str(safe_tx_hash)} was removed correctly</ansigreen>"
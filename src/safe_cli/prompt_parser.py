@@ -11,7 +11,9 @@ from .argparse_validators import (
     check_ethereum_address,
     check_hex_str,
     check_keccak256_hash,
+    check_positive_integer,
 )
+from .ethereum_hd_wallet import DEFAULT_GAP_LIMIT
 from .operators import SafeServiceNotAvailable
 from .operators.exceptions import (
     AccountNotLoadedException,
@@ -37,6 +39,7 @@ from .operators.exceptions import (
 )
 from .operators.safe_operator import SafeOperator
 from .safe_completer_constants import meta, safe_commands_arguments
+from .tx_history import TX_HISTORY_FORMATS
 
 
 def safe_exception(function):
@@ -174,7 +177,11 @@ def build_prompt_parser(safe_operator: SafeOperator) -> argparse.ArgumentParser:
 
     @safe_exception
     def load_cli_owners_from_words(args):
-        safe_operator.load_cli_owners_from_words(args.words)
+        safe_operator.load_cli_owners_from_words(
+            args.words,
+            gap_limit=args.gap_limit,
+            all_derivation_paths=args.all_derivation_paths,
+        )
 
     @safe_exception
     def load_cli_owners(args):
@@ -183,13 +190,17 @@ def build_prompt_parser(safe_operator: SafeOperator) -> argparse.ArgumentParser:
     @safe_exception
     def load_ledger_cli_owners(args):
         safe_operator.load_ledger_cli_owners(
-            derivation_path=args.derivation_path, legacy_account=args.legacy_accounts
+            derivation_path=args.derivation_path,
+            legacy_account=args.legacy_accounts,
+            number_accounts=args.number_accounts,
         )
 
     @safe_exception
     def load_trezor_cli_owners(args):
         safe_operator.load_trezor_cli_owners(
-            derivation_path=args.derivation_path, legacy_account=args.legacy_accounts
+            derivation_path=args.derivation_path,
+            legacy_account=args.legacy_accounts,
+            number_accounts=args.number_accounts,
         )
 
     @safe_exception
@@ -302,18 +313,32 @@ def build_prompt_parser(safe_operator: SafeOperator) -> argparse.ArgumentParser:
     def get_refresh(args):
         safe_operator.refresh_safe_cli_info()
 
+    @safe_exception
+    def invalidate_cache(args):
+        safe_operator.invalidate_chain_cache()
+
     @safe_exception
     def get_balances(args):
         safe_operator.get_balances()
 
     @safe_exception
     def get_history(args):
-        safe_operator.get_transaction_history()
+        safe_operator.get_transaction_history(
+            limit=args.limit, since_nonce=args.since_nonce, output_format=args.format
+        )
+
+    @safe_exception
+    def sync_tx_service(args):
+        safe_operator.sync_tx_service()
 
     @safe_exception
     def sign_tx(args):
         safe_operator.submit_signatures(args.safe_tx_hash)
 
+    @safe_exception
+    def sign_txs(args):
+        safe_operator.submit_signatures_batch(args.safe_tx_hashes)
+
     @safe_exception
     def batch_txs(args):
         safe_operator.batch_txs(args.safe_nonce, args.safe_tx_hashes)
@@ -364,6 +389,12 @@ def build_prompt_parser(safe_operator: SafeOperator) -> argparse.ArgumentParser:
         "load_cli_owners_from_words"
     )
     parser_load_cli_owners_from_words.add_argument("words", type=str, nargs="+")
+    parser_load_cli_owners_from_words.add_argument(
+        "--gap-limit", type=check_positive_integer, default=DEFAULT_GAP_LIMIT
+    )
+    parser_load_cli_owners_from_words.add_argument(
+        "--all-derivation-paths", action="store_true", default=False
+    )
     parser_load_cli_owners_from_words.set_defaults(func=load_cli_owners_from_words)
 
     parser_load_cli_owners = subparsers.add_parser("load_cli_owners")
@@ -381,6 +412,12 @@ def build_prompt_parser(safe_operator: SafeOperator) -> argparse.ArgumentParser:
         action="store_true",
         help="Search for legacy accounts",
     )
+    parser_load_ledger_cli_owners.add_argument(
+        "--number-accounts",
+        type=int,
+        default=5,
+        help="Number of accounts to list",
+    )
     parser_load_ledger_cli_owners.set_defaults(func=load_ledger_cli_owners)
 
     parser_load_trezor_cli_owners = subparsers.add_parser("load_trezor_cli_owners")
@@ -394,6 +431,12 @@ def build_prompt_parser(safe_operator: SafeOperator) -> argparse.ArgumentParser:
         action="store_true",
         help="Search for legacy accounts",
     )
+    parser_load_trezor_cli_owners.add_argument(
+        "--number-accounts",
+        type=int,
+        default=5,
+        help="Number of accounts to list",
+    )
     parser_load_trezor_cli_owners.set_defaults(func=load_trezor_cli_owners)
 
     parser_unload_cli_owners = subparsers.add_parser("unload_cli_owners")
@@ -541,6 +584,9 @@ def build_prompt_parser(safe_operator: SafeOperator) -> argparse.ArgumentParser:
     parser_refresh = subparsers.add_parser("refresh")
     parser_refresh.set_defaults(func=get_refresh)
 
+    parser_invalidate_cache = subparsers.add_parser("invalidate_cache")
+    parser_invalidate_cache.set_defaults(func=invalidate_cache)
+
     # Tx-Service
     # TODO Use subcommands
     parser_tx_service = subparsers.add_parser("balances")
@@ -548,11 +594,25 @@ def build_prompt_parser(safe_operator: SafeOperator) -> argparse.ArgumentParser:
 
     parser_tx_service = subparsers.add_parser("history")
     parser_tx_service.set_defaults(func=get_history)
+    parser_tx_service.add_argument("--limit", type=check_positive_integer)
+    parser_tx_service.add_argument("--since-nonce", type=int)
+    parser_tx_service.add_argument(
+        "--format", choices=TX_HISTORY_FORMATS, default="table"
+    )
+
+    parser_tx_service = subparsers.add_parser("sync")
+    parser_tx_service.set_defaults(func=sync_tx_service)
 
     parser_tx_service = subparsers.add_parser("sign-tx")
     parser_tx_service.set_defaults(func=sign_tx)
     parser_tx_service.add_argument("safe_tx_hash", type=check_keccak256_hash)
 
+    parser_tx_service = subparsers.add_parser("sign-txs")
+    parser_tx_service.set_defaults(func=sign_txs)
+    parser_tx_service.add_argument(
+        "safe_tx_hashes", type=check_keccak256_hash, nargs="+"
+    )
+
     parser_tx_service = subparsers.add_parser("batch-txs")
     parser_tx_service.set_defaults(func=batch_txs)
     parser_tx_service.add_argument("safe_nonce", type=int)
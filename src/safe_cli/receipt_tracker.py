@@ -0,0 +1,158 @@
+"""
+Wait for many transaction receipts with one poller. New blocks are watched with a single
+`eth_blockNumber` poll, and receipts of every pending transaction are retrieved with one
+JSON-RPC batch when there is a new block, instead of polling every transaction apart.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import (
+    Future,
+    InvalidStateError,
+    TimeoutError as FutureTimeoutError,
+)
+
+from hexbytes import HexBytes
+from requests import RequestException
+from safe_eth.eth import EthereumClient
+from web3.exceptions import Web3Exception
+from web3.types import TxReceipt
+
+RECEIPT_TRACKER_POLL_INTERVAL = 1  # Seconds between `eth_blockNumber` polls
+
+
+class ReceiptTracker:
+    """
+    Track transactions until they are mined. Polling runs on a background thread that
+    is only alive while there are transactions pending. Every caller of `track` gets
+    its own future, so callers tracking the same transaction do not affect each other
+    """
+
+    def __init__(
+        self,
+        ethereum_client: EthereumClient,
+        poll_interval: float = RECEIPT_TRACKER_POLL_INTERVAL,
+    ):
+        """
+        :param ethereum_client:
+        :param poll_interval: Seconds between `eth_blockNumber` polls
+        """
+        self.ethereum_client = ethereum_client
+        self.poll_interval = poll_interval
+        self._pending: dict[HexBytes, list[Future]] = {}
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._last_block_number: int | None = None
+
+    @property
+    def pending(self) -> list[HexBytes]:
+        """
+        :return: Hashes of the transactions not mined yet
+        """
+        with self._lock:
+            return list(self._pending)
+
+    def track(
+        self,
+        tx_hash: bytes | str,
+        callback: Callable[[TxReceipt], None] | None = None,
+    ) -> Future:
+        """
+        :param tx_hash:
+        :param callback: Called from the polling thread with the receipt when the
+            transaction is mined
+        :return: Future resolved with the receipt when the transaction is mined
+        """
+        tx_hash = HexBytes(tx_hash)
+        future = Future()
+        with self._lock:
+            self._pending.setdefault(tx_hash, []).append(future)
+            # Check receipts on next poll even without a new block, as the
+            # transaction could be already mined
+            self._last_block_number = None
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="ReceiptTracker", daemon=True
+                )
+                self._thread.start()
+        if callback:
+            future.add_done_callback(
+                lambda done: None if done.cancelled() else callback(done.result())
+            )
+        return future
+
+    def untrack(self, future: Future) -> None:
+        """
+        Stop tracking the transaction for the caller that got `future` from `track`, and
+        cancel it. Transaction is polled until every caller untracks it or it is mined
+        """
+        with self._lock:
+            for tx_hash, futures in self._pending.items():
+                if future in futures:
+                    futures.remove(future)
+                    if not futures:
+                        del self._pending[tx_hash]
+                    break
+        future.cancel()
+
+    def wait(
+        self, tx_hash: bytes | str, timeout: float | None = None
+    ) -> TxReceipt | None:
+        """
+        :param tx_hash:
+        :param timeout: Seconds to wait
+        :return: Receipt of the transaction. `None` if it is not mined in `timeout`
+        """
+        future = self.track(tx_hash)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            self.untrack(future)
+            return None
+
+    def poll(self) -> None:
+        """
+        Retrieve the receipts of every pending transaction if there is a new block
+        """
+        block_number = self.ethereum_client.current_block_number
+        with self._lock:
+            if block_number == self._last_block_number:
+                return
+            self._last_block_number = block_number
+            tx_hashes = list(self._pending)
+        if not tx_hashes:
+            return
+
+        receipts = self.ethereum_client.get_transaction_receipts(tx_hashes)
+        for tx_hash, receipt in zip(tx_hashes, receipts, strict=True):
+            if receipt and receipt["blockNumber"] is not None:
+                with self._lock:
+                    futures = self._pending.pop(tx_hash, [])
+                for future in futures:
+                    try:
+                        future.set_result(receipt)
+                    except InvalidStateError:  # Cancelled meanwhile
+                        pass
+
+    def _run(self) -> None:
+        try:
+            while True:
+                with self._lock:
+                    if not self._pending:
+                        # Cleared with the lock held, so a `track` from now on
+                        # starts a new poller
+                        self._thread = None
+                        return
+                try:
+                    self.poll()
+                except (Web3Exception, ValueError, RequestException):
+                    with self._lock:
+                        self._last_block_number = None  # Try again on next poll
+                time.sleep(self.poll_interval)
+        except BaseException:
+            # Next `track` starts a new poller if this one failed
+            with self._lock:
+                if self._thread is threading.current_thread():
+                    self._thread = None
+            raise
@@ -0,0 +1,174 @@
+"""
+Helpers to send several independent reads to the node in a single request, either as a
+JSON-RPC batch or as one Multicall3 `aggregate3` call.
+
+Unlike `EthereumClient.raw_batch_request`, one failing entry (e.g. an `eth_call` to a
+method not available on old Safe versions) does not make the whole batch fail, so callers
+can fall back to individual requests just for the missing values.
+"""
+
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from eth_abi import (
+    decode as decode_abi,
+    encode as encode_abi,
+)
+from eth_typing import BlockIdentifier, ChecksumAddress
+from eth_utils import function_signature_to_4byte_selector
+from hexbytes import HexBytes
+from requests import RequestException
+from safe_eth.eth import EthereumClient
+from safe_eth.eth.utils import fast_bytes_to_checksum_address
+
+RpcRequest = tuple[str, Sequence[Any]]
+MulticallCall = tuple[ChecksumAddress, str]
+
+
+class MulticallNotDeployed(ValueError):
+    pass
+
+
+def encode_call_data(
+    function_signature: str, types: Sequence[str] = (), args=()
+) -> str:
+    """
+    :param function_signature: Canonical signature, e.g. `getOwners()`
+    :param types: ABI types of the arguments
+    :param args: Arguments for the call
+    :return: Hex encoded calldata for an `eth_call`
+    """
+    data = function_signature_to_4byte_selector(function_signature)
+    if types:
+        data += encode_abi(list(types), list(args))
+    return "0x" + data.hex()
+
+
+def eth_call_request(
+    to: ChecksumAddress, data: str, block_identifier: str = "latest"
+) -> RpcRequest:
+    return "eth_call", [{"to": to, "data": data}, block_identifier]
+
+
+def decode_call_result(types: Sequence[str], result: str | bytes | None) -> Any | None:
+    """
+    :param types: ABI output types
+    :param result: Result of an `eth_call`
+    :return: Decoded value (a tuple if more than one type is provided) or `None` if the
+        call failed or returned no data
+    """
+    if not result or result == "0x":
+        return None
+    try:
+        decoded = decode_abi(list(types), HexBytes(result))
+    except Exception:  # Not the expected output, e.g. calling a non Safe contract
+        return None
+    return decoded if len(types) > 1 else decoded[0]
+
+
+def decode_storage_address(result: str | bytes | None) -> ChecksumAddress | None:
+    """
+    :param result: Content of a storage slot
+    :return: Address stored in the last 20 bytes of the slot
+    """
+    if result is None:
+        return None
+    return fast_bytes_to_checksum_address(HexBytes(result)[-20:].rjust(20, b"\0"))
+
+
+def batch_rpc_request(
+    ethereum_client: EthereumClient, requests: Sequence[RpcRequest]
+) -> list[Any | None]:
+    """
+    Send all the `requests` as one JSON-RPC batch using the `EthereumClient` http session
+
+    :param ethereum_client:
+    :param requests: List of `(method, params)`
+    :return: Results in the same order as `requests`. `None` for entries the node answered
+        with an error
+    :raises ValueError: If the node does not support batch requests or answers with an
+        invalid response
+    :raises requests.RequestException: If the node cannot be reached
+    """
+    if not requests:
+        return []
+
+    payload = [
+        {"jsonrpc": "2.0", "method": method, "params": list(params), "id": i}
+        for i, (method, params) in enumerate(requests)
+    ]
+    response = ethereum_client.http_session.post(
+        # Provider resolves the default url if `ethereum_node_url` was not provided
+        ethereum_client.w3.provider.endpoint_uri,
+        json=payload,
+        timeout=ethereum_client.timeout,
+    )
+    if not response.ok:
+        raise ValueError(f"Batch request error: {response.content!r}")
+
+    results = response.json()
+    if not isinstance(results, list):
+        # Some nodes answer with a single error object if batching is not supported
+        raise ValueError(f"Batch request not supported by the node: {results}")
+
+    results_by_id = {
+        result.get("id"): result for result in results if isinstance(result, dict)
+    }
+    return [results_by_id.get(i, {}).get("result") for i in range(len(requests))]
+
+
+def batch_is_contract(
+    ethereum_client: EthereumClient, addresses: Sequence[ChecksumAddress]
+) -> Iterable[bool]:
+    """
+    `EthereumClient.is_contract` for all the `addresses` using one JSON-RPC batch
+
+    :param ethereum_client:
+    :param addresses:
+    :return: If there is code for every address, in the same order as `addresses`. If
+        the node does not support batch requests, addresses are checked lazily one by one
+    """
+    try:
+        codes = batch_rpc_request(
+            ethereum_client,
+            [("eth_getCode", [address, "latest"]) for address in addresses],
+        )
+        return [bool(code and code != "0x") for code in codes]
+    except (RequestException, ValueError):  # Node does not support batch requests
+        return (ethereum_client.is_contract(address) for address in addresses)
+
+
+def multicall3_aggregate3(
+    ethereum_client: EthereumClient,
+    multicall_address: ChecksumAddress,
+    calls: Sequence[MulticallCall],
+    block_identifier: BlockIdentifier = "latest",
+) -> list[bytes | None]:
+    """
+    Run all the `calls` in one `eth_call` to Multicall3 `aggregate3`, allowing every
+    call to fail
+
+    :param ethereum_client:
+    :param multicall_address: Multicall3 contract address
+    :param calls: List of `(target, calldata)`
+    :param block_identifier: Every call is executed on the same block
+    :return: Return data in the same order as `calls`. `None` for the calls that reverted
+    :raises MulticallNotDeployed: If Multicall3 `eth_call` returns no data
+    :raises ValueError: If the `eth_call` fails
+    :raises Web3Exception: If the node cannot process the request
+    """
+    data = encode_call_data(
+        "aggregate3((address,bool,bytes)[])",
+        ["(address,bool,bytes)[]"],
+        [[(target, True, HexBytes(call_data)) for target, call_data in calls]],
+    )
+    result = ethereum_client.w3.eth.call(
+        {"to": multicall_address, "data": data}, block_identifier=block_identifier
+    )
+    if not result:
+        raise MulticallNotDeployed(f"Multicall3 not deployed on {multicall_address}")
+
+    return [
+        bytes(return_data) if success else None
+        for success, return_data in decode_abi(["(bool,bytes)[]"], result)[0]
+    ]
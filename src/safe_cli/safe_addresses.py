@@ -1,34 +1,116 @@
 """
-Get the correct addresses for the contracts by testing the deployment addresses using the RPC
+Get the correct addresses for the contracts for the chain of the node.
 Currently using Safe v1.4.1 when available, and 1.3.0 as fallback as they are compatible
+
+Addresses are taken from the safe-deployments table for the chain id when the chain is
+known, so no RPC is required. For unknown chains (and development chains, where the
+table cannot be trusted) every candidate is checked on one batched `eth_getCode` request.
 https://github.com/gnosis/safe-deployments/tree/main/src/assets/v1.4.1
 https://github.com/gnosis/safe-deployments/tree/main/src/assets/v1.3.0
 """
 
 from collections.abc import Sequence
+from functools import cache
 
 from eth_typing import ChecksumAddress
 from safe_eth.eth import EthereumClient
+from safe_eth.safe.safe_deployments import safe_deployments
+
+from safe_cli.chain_cache import (
+    ChainCache,
+    get_chain_cache,
+    get_chain_id,
+    get_network,
+)
+from safe_cli.rpc_batch import batch_is_contract
+
+# Versions in order of preference
+DEPLOYMENT_VERSIONS = ("1.4.1", "1.3.0")
+# Contract name on safe-deployments for every version, keyed by the name used on the cache
+DEPLOYMENT_CONTRACT_NAMES: dict[str, dict[str, str]] = {
+    "safe_contract": {"1.4.1": "Safe", "1.3.0": "GnosisSafe"},
+    "safe_l2_contract": {"1.4.1": "SafeL2", "1.3.0": "GnosisSafeL2"},
+    "default_fallback_handler": {
+        "1.4.1": "CompatibilityFallbackHandler",
+        "1.3.0": "CompatibilityFallbackHandler",
+    },
+    "proxy_factory": {"1.4.1": "SafeProxyFactory", "1.3.0": "GnosisSafeProxyFactory"},
+    "multisend": {"1.4.1": "MultiSend", "1.3.0": "MultiSend"},
+    "multisend_call_only": {
+        "1.4.1": "MultiSendCallOnly",
+        "1.3.0": "MultiSendCallOnly",
+    },
+    "sign_message_lib": {"1.4.1": "SignMessageLib", "1.3.0": "SignMessageLib"},
+}
+
+
+@cache
+def get_deployments_index() -> dict[int, dict[str, ChecksumAddress]]:
+    """
+    :return: Preferred address for every contract, keyed by chain id and contract key
+        (e.g. ``{1: {"safe_contract": "0x41675C..."}}``)
+    """
+    index: dict[int, dict[str, ChecksumAddress]] = {}
+    for key, contract_names in DEPLOYMENT_CONTRACT_NAMES.items():
+        for version in DEPLOYMENT_VERSIONS:
+            deployments = safe_deployments[version][contract_names[version]]
+            for chain_id, addresses in deployments.items():
+                chain_index = index.setdefault(int(chain_id), {})
+                if addresses and key not in chain_index:
+                    chain_index[key] = addresses[0]
+    return index
 
 
 def _get_valid_contract(
-    ethereum_client: EthereumClient, addresses: Sequence[ChecksumAddress]
+    ethereum_client: EthereumClient,
+    addresses: Sequence[ChecksumAddress],
+    cache_key: str | None = None,
 ) -> ChecksumAddress:
     """
     :param ethereum_client:
     :param addresses:
+    :param cache_key: If provided, the valid contract is stored on the chain cache
+        using this key, so addresses are not checked again for the same chain
     :return: First valid contract from the list of addresses provided found in blockchain
     """
-
-    for address in addresses:
-        if ethereum_client.is_contract(address):
+    chain_cache = get_chain_cache()
+    chain_id = get_chain_id(ethereum_client) if cache_key else None
+    if cache_key and (address := chain_cache.get_address(chain_id, cache_key)):
+        return address
+
+    is_contract = batch_is_contract(ethereum_client, addresses)
+    for address, address_is_contract in zip(addresses, is_contract, strict=True):
+        if address_is_contract:
+            if cache_key:
+                chain_cache.set_address(chain_id, cache_key, address)
             return address
-    raise ValueError(f"Network {ethereum_client.get_network().name} is not supported")
+    raise ValueError(f"Network {get_network(ethereum_client).name} is not supported")
+
+
+def _get_contract_address(
+    ethereum_client: EthereumClient,
+    key: str,
+    addresses: Sequence[ChecksumAddress],
+) -> ChecksumAddress:
+    """
+    :param ethereum_client:
+    :param key: Key of the contract on ``DEPLOYMENT_CONTRACT_NAMES``
+    :param addresses: Candidates to check on the node if the chain is not on the
+        deployments table
+    :return: Address of the contract for the chain of the node
+    """
+    chain_id = get_chain_id(ethereum_client)
+    if ChainCache.is_cacheable_chain(chain_id) and (
+        address := get_deployments_index().get(chain_id, {}).get(key)
+    ):
+        return address
+    return _get_valid_contract(ethereum_client, addresses, cache_key=key)
 
 
 def get_safe_contract_address(ethereum_client: EthereumClient) -> ChecksumAddress:
-    return _get_valid_contract(
+    return _get_contract_address(
         ethereum_client,
+        "safe_contract",
         [
             "0x41675C099F32341bf84BFc5382aF534df5C7461a",  # v1.4.1
             "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",  # v1.3.0
@@ -38,8 +120,9 @@ def get_safe_contract_address(ethereum_client: EthereumClient) -> ChecksumAddres
 
 
 def get_safe_l2_contract_address(ethereum_client: EthereumClient) -> ChecksumAddress:
-    return _get_valid_contract(
+    return _get_contract_address(
         ethereum_client,
+        "safe_l2_contract",
         [
             "0x29fcB43b46531BcA003ddC8FCB67FFE91900C762",  # v1.4.1
             "0x610fcA2e0279Fa1F8C00c8c2F71dF522AD469380",  # v1.4.1 zkSync
@@ -53,8 +136,9 @@ def get_safe_l2_contract_address(ethereum_client: EthereumClient) -> ChecksumAdd
 def get_default_fallback_handler_address(
     ethereum_client: EthereumClient,
 ) -> ChecksumAddress:
-    return _get_valid_contract(
+    return _get_contract_address(
         ethereum_client,
+        "default_fallback_handler",
         [
             "0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99",  # v1.4.1
             "0x9301E98DD367135f21bdF66f342A249c9D5F9069",  # v1.4.1 zkSync
@@ -66,8 +150,9 @@ def get_default_fallback_handler_address(
 
 
 def get_proxy_factory_address(ethereum_client: EthereumClient) -> ChecksumAddress:
-    return _get_valid_contract(
+    return _get_contract_address(
         ethereum_client,
+        "proxy_factory",
         [
             "0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67",  # v1.4.1
             "0xc329D02fd8CB2fc13aa919005aF46320794a8629",  # v1.4.1 zkSync
@@ -79,8 +164,9 @@ def get_proxy_factory_address(ethereum_client: EthereumClient) -> ChecksumAddres
 
 
 def get_last_multisend_address(ethereum_client: EthereumClient) -> ChecksumAddress:
-    return _get_valid_contract(
+    return _get_contract_address(
         ethereum_client,
+        "multisend",
         [
             "0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526",  # v1.4.1
             "0x309D0B190FeCCa8e1D5D8309a16F7e3CB133E885",  # v1.4.1 zkSync
@@ -94,10 +180,11 @@ def get_last_multisend_address(ethereum_client: EthereumClient) -> ChecksumAddre
 def get_last_multisend_call_only_address(
     ethereum_client: EthereumClient,
 ) -> ChecksumAddress:
-    return _get_valid_contract(
+    return _get_contract_address(
         ethereum_client,
+        "multisend_call_only",
         [
-            "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",  # v1.4.1
+            "0x9641d764fc13c8B624c04430C7356C1C7C8102e2",  # v1.4.1
             "0x0408EF011960d02349d50286D20531229BCef773",  # v1.4.1 zkSync
             "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",  # v1.3.0
             "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",  # v1.3.0
@@ -109,8 +196,9 @@ def get_last_multisend_call_only_address(
 def get_last_sign_message_lib_address(
     ethereum_client: EthereumClient,
 ) -> ChecksumAddress:
-    return _get_valid_contract(
+    return _get_contract_address(
         ethereum_client,
+        "sign_message_lib",
         [
             "0xd53cd0aB83D845Ac265BE939c57F53AD838012c9",  # v1.4.1
             "0xAca1ec0a1A575CDCCF1DC3d5d296202Eb6061888",  # v1.4.1 zkSync
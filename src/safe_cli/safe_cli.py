@@ -9,10 +9,13 @@ from prompt_toolkit.history import FileHistory
 from prompt_toolkit.lexers import PygmentsLexer
 
 from .operators import (
+    AsyncSafeOperator,
+    AsyncSafeTxServiceOperator,
     SafeCliTerminationException,
     SafeOperator,
     SafeServiceNotAvailable,
     SafeTxServiceOperator,
+    is_async_operator_enabled,
 )
 from .prompt_parser import PromptParser
 from .safe_completer import SafeCompleter
@@ -34,7 +37,10 @@ class SafeCli:
             )
         else:
             self.session = PromptSession()
-        self.safe_operator = SafeOperator(safe_address, node_url)
+        self.use_async_operators = is_async_operator_enabled()
+        self.safe_operator = (
+            AsyncSafeOperator if self.use_async_operators else SafeOperator
+        )(safe_address, node_url)
         self.prompt_parser = PromptParser(self.safe_operator)
 
     def print_startup_info(self):
@@ -79,7 +85,11 @@ class SafeCli:
                 print_formatted_text(
                     HTML("<b><ansigreen>Sending txs to tx service</ansigreen></b>")
                 )
-                return SafeTxServiceOperator(self.safe_address, self.node_url)
+                return (
+                    AsyncSafeTxServiceOperator
+                    if self.use_async_operators
+                    else SafeTxServiceOperator
+                )(self.safe_address, self.node_url)
             elif split_command[0] == "blockchain":
                 print_formatted_text(
                     HTML("<b><ansigreen>Sending txs to blockchain</ansigreen></b>")
@@ -100,6 +110,8 @@ class SafeCli:
         )
 
     def loop(self):
+        # Keep the toolbar updated with the events of the Safe
+        self.safe_operator.start_safe_cli_info_watcher()
         while True:
             try:
                 command = self.get_command()
@@ -108,8 +120,13 @@ class SafeCli:
 
                 new_operator = self.parse_operator_mode(command)
                 if new_operator:
+                    previous_operator = self.prompt_parser.safe_operator
+                    if previous_operator not in (self.safe_operator, new_operator):
+                        # Operators for the tx service are created on every switch
+                        previous_operator.close()
                     self.prompt_parser = PromptParser(new_operator)
                     new_operator.refresh_safe_cli_info()  # ClI info needs to be initialized
+                    new_operator.start_safe_cli_info_watcher()
                 else:
                     self.prompt_parser.process_command(command)
             except SafeCliTerminationException:
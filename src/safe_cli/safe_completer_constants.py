@@ -22,12 +22,13 @@ safe_commands_arguments = {
     "get_nonce": "(read-only)",
     "get_owners": "(read-only)",
     "get_threshold": "(read-only)",
-    "history": "(read-only)",
+    "history": "[--limit <int>] [--since-nonce <int>] [--format jsonl|table] (read-only)",
     "info": "(read-only)",
+    "invalidate_cache": "",
     "load_cli_owners": "<account-private-key> [<account-private-key>...]",
-    "load_ledger_cli_owners": "[--legacy-accounts] [--derivation-path <str>]",
-    "load_trezor_cli_owners": "[--legacy-accounts] [--derivation-path <str>]",
-    "load_cli_owners_from_words": "<word_1> <word_2> ... <word_12>",
+    "load_ledger_cli_owners": "[--legacy-accounts] [--derivation-path <str>] [--number-accounts <int>]",
+    "load_trezor_cli_owners": "[--legacy-accounts] [--derivation-path <str>] [--number-accounts <int>]",
+    "load_cli_owners_from_words": "<word_1> <word_2> ... <word_12> [--gap-limit <int>] [--all-derivation-paths]",
     "refresh": "",
     "remove_delegate": "<address> <signer-address>",
     "remove_owner": "<address> [--threshold <int>]",
@@ -40,6 +41,8 @@ safe_commands_arguments = {
     "sign_message": "[--eip191_message] [--eip712_path <file-path>]",
     "confirm_message": "<safe-message-hash> <signer-address>",
     "sign-tx": "<safe-tx-hash>",
+    "sign-txs": "<safe-tx-hash> [ <safe-tx-hash> ... ]",
+    "sync": "",
     "unload_cli_owners": "<address> [<address>...]",
     "update": "",
     "update_version_to_l2": "<address>",
@@ -58,12 +61,15 @@ meta = {
         "Sender private key must be loaded first"
     ),
     "balances": HTML(
-        "<b>balances</b> will return the balance of Ether and ERC20 tokens of the Safe "
-        "(if tx service available for the network)"
+        "<b>balances</b> will return the balance of Ether and ERC20 tokens of the Safe. "
+        "Tx service is used if available, otherwise tokens are found on the blockchain"
     ),
     "history": HTML(
         "<b>history</b> will return information of last transactions for the Safe "
-        "(if tx service available for the network)"
+        "(from the tx service if available for the network, otherwise from the events of "
+        "the Safe indexed on a local database). Transactions are printed page by "
+        "page as they are retrieved. Use <b>--format jsonl</b> to print every "
+        "transaction as a JSON line"
     ),
     "batch-txs": HTML(
         "<b>batch-txs</b> will take pending or executed transactions by safe tx hash and will create a new"
@@ -75,6 +81,16 @@ meta = {
     "sign-tx": HTML(
         "<b>sign-tx</b> will sign the provided safeTxHash using the owners loaded on the CLI"
     ),
+    "sign-txs": HTML(
+        "<b>sign-txs</b> will sign all the provided safeTxHashes using the owners loaded on the CLI. "
+        "Hardware wallets sign all of them in one session"
+    ),
+    "sync": HTML(
+        "<b>sync</b> will mirror transactions, confirmations, messages and delegates of the "
+        "Safe from the tx service to a local database, retrieving only the changes since the "
+        "previous sync. Once synced, <b>history</b>, <b>sign-tx</b>, <b>execute-tx</b> and "
+        "other reads are served from the local database"
+    ),
     "sign_message": HTML(
         "<b>sign_message</b> sign the provided string message provided by standard input or the EIP712 provided by file"
     ),
@@ -163,10 +179,19 @@ meta = {
     ),
     "load_cli_owners_from_words": HTML(
         "Command <b>load_cli_owners_from_words</b> will try to load owners via"
-        "<u>seed_words</u>. Only relevant accounts(owners) will be loaded"
+        "<u>seed_words</u>. Only relevant accounts(owners) will be loaded. Accounts are "
+        "derived until every owner is found or <u>--gap-limit</u> (100 by default) "
+        "consecutive accounts are not owners. Use <u>--all-derivation-paths</u> to also "
+        "search Ledger Live and legacy Ledger derivation paths"
     ),
     "refresh": HTML(
-        "Command <b>refresh</b> will refresh the information for the current loaded safe."
+        "Command <b>refresh</b> will refresh the information for the current loaded safe. "
+        "Information is also kept updated in the background applying the events of the "
+        "Safe (owners, threshold, modules, guards...)"
+    ),
+    "invalidate_cache": HTML(
+        "Command <b>invalidate_cache</b> will remove the cached contract addresses and "
+        "master copy versions for the current network, so they are retrieved again."
     ),
     "change_master_copy": HTML(
         "Command <b>change_master_copy</b> will change the current MasterCopy of the "
@@ -2,32 +2,50 @@
 import argparse
 import secrets
 import sys
+from collections import Counter
 
 from art import text2art
 from eth_account import Account
 from eth_account.signers.local import LocalAccount
 from eth_typing import URI
-from hexbytes import HexBytes
 from prompt_toolkit import print_formatted_text
 from safe_eth.eth import EthereumClient, EthereumTxSent
 from safe_eth.eth.constants import NULL_ADDRESS
-from safe_eth.eth.contracts import get_safe_V1_4_1_contract
-from safe_eth.safe import ProxyFactory, Safe
+from safe_eth.safe import ProxyFactory
 from safe_eth.util.util import to_0x_hex_str
 
+from safe_cli.chain_cache import (
+    get_master_copy_version,
+    get_network,
+    get_proxy_creation_code,
+)
+from safe_cli.create2 import (
+    SafeAddressPredictor,
+    VanityPattern,
+    search_vanity_addresses,
+)
 from safe_cli.safe_addresses import (
     get_default_fallback_handler_address,
     get_proxy_factory_address,
     get_safe_contract_address,
     get_safe_l2_contract_address,
 )
+from safe_cli.safe_fleet import (
+    DEFAULT_MAX_IN_FLIGHT,
+    FleetSafe,
+    deploy_fleet,
+    load_fleet_file,
+    write_fleet_manifest,
+)
 from safe_cli.utils import yes_or_no_question
 
 from . import VERSION
 from .argparse_validators import (
     check_ethereum_address,
+    check_hex_pattern,
     check_positive_integer,
     check_private_key,
+    check_regex,
 )
 
 
@@ -49,7 +67,12 @@ def setup_argument_parser():
     )
     parser.add_argument("node_url", help="Ethereum node url")
     parser.add_argument(
-        "private_key", help="Deployer private_key", type=check_private_key
+        "private_key",
+        help="Deployer private_key. Not required with --predict-only or "
+        "--generate-vanity-addresses if --owners are provided",
+        type=check_private_key,
+        nargs="?",
+        default=None,
     )
     parser.add_argument(
         "--no-confirm",
@@ -104,32 +127,115 @@ def setup_argument_parser():
     )
     parser.add_argument(
         "--generate-vanity-addresses",
-        help="Don't deploy the Safe, only generate addresses",
+        help="Don't deploy the Safe, only search salt nonces for addresses matching "
+        "--vanity-prefix, --vanity-suffix and --vanity-regex",
         default=False,
         action="store_true",
     )
+    parser.add_argument(
+        "--predict-only",
+        help="Don't deploy the Safe, only print its address. Address is calculated "
+        "locally, node is only used the first time for every chain",
+        default=False,
+        action="store_true",
+    )
+    parser.add_argument(
+        "--fleet",
+        help="Deploy every Safe on a CSV or JSONL file with owners, threshold and "
+        "salt_nonce. Safes already deployed are skipped",
+        default=None,
+    )
+    parser.add_argument(
+        "--fleet-manifest",
+        help="JSONL file to write the result of every Safe of the fleet. By default "
+        "FLEET.manifest.jsonl",
+        default=None,
+    )
+    parser.add_argument(
+        "--max-in-flight",
+        help="Maximum number of fleet deployment transactions sent and not mined",
+        default=DEFAULT_MAX_IN_FLIGHT,
+        type=check_positive_integer,
+    )
+    parser.add_argument(
+        "--vanity-prefix",
+        help="Hexadecimal prefix for the vanity addresses (case insensitive)",
+        default="",
+        type=check_hex_pattern,
+    )
+    parser.add_argument(
+        "--vanity-suffix",
+        help="Hexadecimal suffix for the vanity addresses (case insensitive)",
+        default="",
+        type=check_hex_pattern,
+    )
+    parser.add_argument(
+        "--vanity-regex",
+        help="Regular expression the vanity addresses must match, without 0x (case insensitive)",
+        default=None,
+        type=check_regex,
+    )
+    parser.add_argument(
+        "--vanity-matches",
+        help="Stop after this number of vanity addresses are found",
+        default=1,
+        type=check_positive_integer,
+    )
+    parser.add_argument(
+        "--vanity-workers",
+        help="Number of processes used to search vanity addresses. By default one per CPU",
+        default=None,
+        type=check_positive_integer,
+    )
 
     return parser
 
 
-def main(*args, **kwargs) -> EthereumTxSent | None:
-    print_formatted_text(text2art("Safe Creator"))  # Print fancy text
+def print_vanity_progress(hashes: int, elapsed: float) -> None:
+    """
+    Print vanity search speed to stderr, so stdout only contains the matches
+    """
+    print(
+        f"\r{hashes} addresses checked - {hashes / max(elapsed, 1e-9):.0f} hashes/s",
+        end="",
+        file=sys.stderr,
+        flush=True,
+    )
+
 
+def print_fleet_safe(fleet_safe: FleetSafe) -> None:
+    print_formatted_text(
+        f"Safe={fleet_safe.address} {fleet_safe.status.value}"
+        + (f" tx-hash={fleet_safe.tx_hash}" if fleet_safe.tx_hash else "")
+        + (f" error={fleet_safe.error}" if fleet_safe.error else "")
+    )
+
+
+def main(*args, **kwargs) -> EthereumTxSent | None:
     parser = setup_argument_parser()
     args = parser.parse_args()
+    # Results of the local modes are written to stdout so they can be piped
+    local_only: bool = args.predict_only or args.generate_vanity_addresses
+    print_formatted_text(
+        text2art("Safe Creator"), file=sys.stderr if local_only else None
+    )  # Print fancy text
+
+    if not args.private_key and not (local_only and args.owners):
+        parser.error(
+            "private_key is required, unless --owners are provided with "
+            "--predict-only or --generate-vanity-addresses"
+        )
     node_url: URI = args.node_url
-    account: LocalAccount = Account.from_key(args.private_key)
+    # Local modes only use the account as the default owner
+    account: LocalAccount | None = (
+        Account.from_key(args.private_key) if args.private_key else None
+    )
     no_confirm: bool = args.no_confirm
     owners: list[str] = args.owners if args.owners else [account.address]
     threshold: int = args.threshold
     salt_nonce: int = args.salt_nonce
     without_events: bool = args.without_events
     generate_vanity_addresses: bool = args.generate_vanity_addresses
-    to = NULL_ADDRESS
-    data = b""
-    payment_token = NULL_ADDRESS
-    payment = 0
-    payment_receiver = NULL_ADDRESS
 
     if len(owners) < threshold:
         print_formatted_text(
@@ -143,7 +249,7 @@ def main(*args, **kwargs) -> EthereumTxSent | None:
         return yes_or_no_question(prompt)
 
     ethereum_client = EthereumClient(node_url)
-    ethereum_network = ethereum_client.get_network()
+    ethereum_network = get_network(ethereum_client)
 
     safe_contract_address = args.safe_contract or (
         get_safe_contract_address(ethereum_client)
@@ -157,6 +263,39 @@ def main(*args, **kwargs) -> EthereumTxSent | None:
         ethereum_client
     )
 
+    def get_predictor() -> SafeAddressPredictor:
+        return SafeAddressPredictor(
+            proxy_factory_address,
+            get_proxy_creation_code(ethereum_client, proxy_factory_address),
+            safe_contract_address,
+            fallback_handler,
+        )
+
+    if args.predict_only:
+        print_formatted_text(
+            f"{get_predictor().predict(owners, threshold, salt_nonce)} {salt_nonce}"
+        )
+        return None
+
+    if generate_vanity_addresses:
+        predictor = get_predictor()
+        vanity_pattern = VanityPattern(
+            args.vanity_prefix, args.vanity_suffix, args.vanity_regex
+        )
+        for expected_safe_address, vanity_salt_nonce in search_vanity_addresses(
+            proxy_factory_address,
+            predictor.get_initializer(owners, threshold),
+            predictor.init_code_hash,
+            vanity_pattern,
+            start_salt_nonce=salt_nonce,
+            max_matches=args.vanity_matches,
+            max_workers=args.vanity_workers,
+            on_progress=print_vanity_progress,
+        ):
+            print_formatted_text(f"{expected_safe_address} {vanity_salt_nonce}")
+        print(file=sys.stderr)
+        return None
+
     if not ethereum_client.is_contract(safe_contract_address):
         print_formatted_text(
             f"Safe contract address {safe_contract_address} "
@@ -188,7 +327,7 @@ def main(*args, **kwargs) -> EthereumTxSent | None:
             ethereum_client.w3.from_wei(account_balance, "ether"), 6
         )
         print_formatted_text(
-            f"Network {ethereum_client.get_network().name} - Sender {account.address} - "
+            f"Network {ethereum_network.name} - Sender {account.address} - "
             f"Balance: {ether_account_balance}Ξ"
         )
 
@@ -198,58 +337,65 @@ def main(*args, **kwargs) -> EthereumTxSent | None:
         print_formatted_text("Network not supported")
         sys.exit(1)
 
+    if args.fleet:
+        try:
+            fleet = load_fleet_file(args.fleet)
+        except (OSError, ValueError) as e:
+            print_formatted_text(f"Cannot load fleet file: {e}")
+            sys.exit(1)
+        manifest_path = args.fleet_manifest or f"{args.fleet}.manifest.jsonl"
+        print_formatted_text(
+            f"Deploying {len(fleet)} Safes from {args.fleet}\n"
+            f"Safe-master-copy={safe_contract_address}\n"
+            f"Fallback-handler={fallback_handler}\n"
+            f"Proxy factory={proxy_factory_address}"
+        )
+        if yes_or_no("Do you want to continue?"):
+            try:
+                deploy_fleet(
+                    ethereum_client,
+                    account,
+                    get_predictor(),
+                    fleet,
+                    max_in_flight=args.max_in_flight,
+                    on_update=print_fleet_safe,
+                )
+            finally:
+                write_fleet_manifest(manifest_path, fleet)
+            results = Counter(fleet_safe.status.value for fleet_safe in fleet)
+            print_formatted_text(
+                f"Results={dict(results)} written to manifest={manifest_path}"
+            )
+        return None
+
     print_formatted_text(
         f"Creating new Safe with owners={owners} threshold={threshold} salt-nonce={salt_nonce}"
     )
-    safe_version = Safe(safe_contract_address, ethereum_client).retrieve_version()
+    safe_version = get_master_copy_version(ethereum_client, safe_contract_address)
     print_formatted_text(
         f"Safe-master-copy={safe_contract_address} version={safe_version}\n"
         f"Fallback-handler={fallback_handler}\n"
         f"Proxy factory={proxy_factory_address}"
     )
     if yes_or_no("Do you want to continue?"):
-        safe_contract = get_safe_V1_4_1_contract(
-            ethereum_client.w3, safe_contract_address
-        )
-        safe_creation_tx_data = HexBytes(
-            safe_contract.functions.setup(
-                owners,
-                threshold,
-                to,
-                data,
-                fallback_handler,
-                payment_token,
-                payment,
-                payment_receiver,
-            ).build_transaction({"gas": 1, "gasPrice": 1})["data"]
-        )
+        predictor = get_predictor()
+        safe_creation_tx_data = predictor.get_initializer(owners, threshold)
 
         proxy_factory = ProxyFactory(proxy_factory_address, ethereum_client)
-        if generate_vanity_addresses:
-            for vanity_salt_nonce in range(2**256):
-                expected_safe_address = proxy_factory.calculate_proxy_address(
-                    safe_contract_address, safe_creation_tx_data, vanity_salt_nonce
-                )
-                print_formatted_text(f"{expected_safe_address} {vanity_salt_nonce}")
-        else:
-            expected_safe_address = proxy_factory.calculate_proxy_address(
-                safe_contract_address, safe_creation_tx_data, salt_nonce
-            )
-            if ethereum_client.is_contract(expected_safe_address):
-                print_formatted_text(
-                    f"Safe on {expected_safe_address} is already deployed"
-                )
-                sys.exit(1)
+        expected_safe_address = predictor.predict(owners, threshold, salt_nonce)
+        if ethereum_client.is_contract(expected_safe_address):
+            print_formatted_text(f"Safe on {expected_safe_address} is already deployed")
+            sys.exit(1)
 
-            if yes_or_no(
-                f"Safe will be deployed on {expected_safe_address}, would you like to proceed?"
-            ):
-                ethereum_tx_sent = proxy_factory.deploy_proxy_contract_with_nonce(
-                    account, safe_contract_address, safe_creation_tx_data, salt_nonce
-                )
-                print_formatted_text(
-                    f"Sent tx with tx-hash={to_0x_hex_str(ethereum_tx_sent.tx_hash)} "
-                    f"Safe={ethereum_tx_sent.contract_address} is being created"
-                )
-                print_formatted_text(f"Tx parameters={ethereum_tx_sent.tx}")
-                return ethereum_tx_sent
+        if yes_or_no(
+            f"Safe will be deployed on {expected_safe_address}, would you like to proceed?"
+        ):
+            ethereum_tx_sent = proxy_factory.deploy_proxy_contract_with_nonce(
+                account, safe_contract_address, safe_creation_tx_data, salt_nonce
+            )
+            print_formatted_text(
+                f"Sent tx with tx-hash={to_0x_hex_str(ethereum_tx_sent.tx_hash)} "
+                f"Safe={ethereum_tx_sent.contract_address} is being created"
+            )
+            print_formatted_text(f"Tx parameters={ethereum_tx_sent.tx}")
+            return ethereum_tx_sent
@@ -0,0 +1,463 @@
+"""
+Local index of the events of a Safe, so the executed history is available on networks
+without a Safe Transaction Service.
+
+`ExecutionSuccess` and `ExecutionFailure` logs are the executed multisig transactions.
+Configuration events (`AddedOwner`, `ChangedThreshold`, `EnabledModule`...) are linked to
+the execution that emitted them. Logs are retrieved with adaptive block windows and the
+last block indexed is stored as a checkpoint every `SAFE_EVENT_INDEX_CHECKPOINT_BLOCKS`,
+so updates and interrupted scans only request the blocks not indexed before.
+
+Index is stored as a SQLite database on the cache directory. Development chains are
+restarted reusing the same chain id, so they are indexed from scratch every time.
+"""
+
+import json
+import sqlite3
+import threading
+from collections.abc import Iterator, Sequence
+from contextlib import closing
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from eth_abi import decode as decode_abi
+from eth_typing import ChecksumAddress
+from eth_utils import event_abi_to_log_topic
+from hexbytes import HexBytes
+from safe_eth.eth import EthereumClient
+from safe_eth.eth.contracts import get_safe_V1_3_0_contract, get_safe_V1_5_0_contract
+from safe_eth.util.util import to_0x_hex_str
+from web3 import Web3
+from web3.contract.contract import ContractEvent
+from web3.types import LogReceipt
+
+from .chain_cache import ChainCache, get_cache_dir, get_chain_id
+from .utils import get_deployment_block, scan_block_range
+
+SAFE_EVENT_INDEX_FILE_NAME = "safe_event_index.sqlite3"
+SAFE_EVENT_INDEX_SCHEMA_VERSION = 1
+# Last blocks are scanned again on every update, in case of reorgs
+SAFE_EVENT_INDEX_REORG_BLOCKS = 64
+SAFE_EVENT_INDEX_CHECKPOINT_BLOCKS = 1_000_000  # Blocks scanned between checkpoints
+
+SAFE_EXECUTION_EVENTS = ("ExecutionSuccess", "ExecutionFailure")
+SAFE_CONFIGURATION_EVENTS = (
+    "AddedOwner",
+    "RemovedOwner",
+    "ChangedThreshold",
+    "EnabledModule",
+    "DisabledModule",
+    "ChangedFallbackHandler",
+    "ChangedGuard",
+    "ChangedModuleGuard",
+)
+# Emitted by L2 Safes before every execution, with the parameters of the transaction
+SAFE_MULTISIG_TRANSACTION_EVENT = "SafeMultiSigTransaction"
+
+SAFE_EVENT_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS index_state (
+    chain_id INTEGER NOT NULL,
+    safe_address TEXT NOT NULL,
+    last_block INTEGER NOT NULL,
+    PRIMARY KEY (chain_id, safe_address)
+);
+CREATE TABLE IF NOT EXISTS executions (
+    chain_id INTEGER NOT NULL,
+    safe_address TEXT NOT NULL,
+    block_number INTEGER NOT NULL,
+    log_index INTEGER NOT NULL,
+    nonce INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (chain_id, safe_address, block_number, log_index)
+);
+"""
+
+
+@dataclass
+class SafeEvent:
+    name: str
+    args: dict[str, Any]  # JSON serializable, bytes are encoded as hex
+    block_number: int
+    log_index: int
+    transaction_hash: HexBytes
+
+
+def _to_json_value(value: Any) -> Any:
+    if isinstance(value, bytes):
+        return to_0x_hex_str(value)
+    if isinstance(value, (list, tuple)):
+        return [_to_json_value(element) for element in value]
+    return value
+
+
+@cache
+def _get_safe_event_decoders() -> dict[HexBytes, dict[int, ContractEvent]]:
+    """
+    :return: Events by topic and number of indexed parameters. Parameters of most
+        Safe events are indexed since v1.4.1, so both versions are required
+    """
+    w3 = Web3()
+    event_names = (
+        SAFE_EXECUTION_EVENTS
+        + SAFE_CONFIGURATION_EVENTS
+        + (SAFE_MULTISIG_TRANSACTION_EVENT,)
+    )
+    decoders: dict[HexBytes, dict[int, ContractEvent]] = {}
+    for contract in (get_safe_V1_3_0_contract(w3), get_safe_V1_5_0_contract(w3)):
+        for event_abi in contract.abi:
+            if event_abi["type"] == "event" and event_abi["name"] in event_names:
+                indexed_inputs = sum(
+                    1 for event_input in event_abi["inputs"] if event_input["indexed"]
+                )
+                decoders.setdefault(HexBytes(event_abi_to_log_topic(event_abi)), {})[
+                    indexed_inputs
+                ] = contract.events[event_abi["name"]]()
+    return decoders
+
+
+def get_safe_event_topics(event_names: Sequence[str]) -> list[str]:
+    """
+    :return: Topics of the `event_names`, for `eth_getLogs` filters
+    """
+    return [
+        to_0x_hex_str(topic)
+        for topic, events in _get_safe_event_decoders().items()
+        if next(iter(events.values())).event_name in event_names
+    ]
+
+
+def decode_safe_log(log: LogReceipt) -> SafeEvent | None:
+    """
+    :return: Decoded Safe event, `None` if the log is not a known Safe event
+    """
+    if not log["topics"]:
+        return None
+    events = _get_safe_event_decoders().get(HexBytes(log["topics"][0]), {})
+    if not (event := events.get(len(log["topics"]) - 1)):
+        return None
+    event_data = event.process_log(log)
+    return SafeEvent(
+        event_data["event"],
+        {key: _to_json_value(value) for key, value in event_data["args"].items()},
+        event_data["blockNumber"],
+        event_data["logIndex"],
+        HexBytes(event_data["transactionHash"]),
+    )
+
+
+def _build_executions(
+    ethereum_client: EthereumClient,
+    safe_address: ChecksumAddress,
+    events: Sequence[SafeEvent],
+) -> list[tuple[SafeEvent, dict[str, Any]]]:
+    """
+    :return: Executions with the transaction in the same format as the tx service.
+        Parameters are taken from the `SafeMultiSigTransaction` event for L2 Safes,
+        otherwise from the input of the ethereum transaction if it called the Safe
+        directly. Nonce is `None` if it cannot be retrieved
+    """
+    executions = []
+    configuration_events: list[SafeEvent] = []
+    multisig_transaction: SafeEvent | None = None
+    for event in events:
+        if event.name == SAFE_MULTISIG_TRANSACTION_EVENT:
+            multisig_transaction = event
+        elif event.name in SAFE_CONFIGURATION_EVENTS:
+            configuration_events.append(event)
+        elif event.name in SAFE_EXECUTION_EVENTS:
+            transaction: dict[str, Any] = {
+                "safe": safe_address,
+                "to": None,
+                "value": None,
+                "data": None,
+                "operation": None,
+                "nonce": None,
+                "safeTxHash": event.args["txHash"],
+                "transactionHash": to_0x_hex_str(event.transaction_hash),
+                "blockNumber": event.block_number,
+                "isExecuted": True,
+                "isSuccessful": event.name == "ExecutionSuccess",
+                "events": [
+                    {
+                        "event": configuration_event.name,
+                        "args": configuration_event.args,
+                    }
+                    for configuration_event in configuration_events
+                    if configuration_event.transaction_hash == event.transaction_hash
+                ],
+            }
+            if (
+                multisig_transaction
+                and multisig_transaction.transaction_hash == event.transaction_hash
+            ):
+                args = multisig_transaction.args
+                nonce, _, _ = decode_abi(
+                    ["uint256", "address", "uint256"], HexBytes(args["additionalInfo"])
+                )
+                transaction.update(
+                    {
+                        "to": args["to"],
+                        "value": str(args["value"]),
+                        "data": args["data"],
+                        "operation": args["operation"],
+                        "nonce": nonce,
+                    }
+                )
+            executions.append((event, transaction))
+            configuration_events = []
+            multisig_transaction = None
+
+    # Not L2 Safes, retrieve the parameters from the ethereum transactions
+    missing = [
+        transaction for _, transaction in executions if transaction["to"] is None
+    ]
+    if missing:
+        safe_contract = get_safe_V1_5_0_contract(ethereum_client.w3)
+        ethereum_txs = ethereum_client.get_transactions(
+            [transaction["transactionHash"] for transaction in missing]
+        )
+        for transaction, ethereum_tx in zip(missing, ethereum_txs, strict=True):
+            if not ethereum_tx or ethereum_tx.get("to") != safe_address:
+                continue
+            try:
+                function, args = safe_contract.decode_function_input(
+                    ethereum_tx["input"]
+                )
+            except ValueError:
+                continue
+            if function.fn_name == "execTransaction":
+                transaction.update(
+                    {
+                        "to": args["to"],
+                        "value": str(args["value"]),
+                        "data": to_0x_hex_str(args["data"]) if args["data"] else None,
+                        "operation": args["operation"],
+                    }
+                )
+    return executions
+
+
+class SafeEventIndex:
+    def __init__(self, path: Path):
+        """
+        :param path: SQLite database. It is created on the first update
+        """
+        self.path = path
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self, create: bool = False) -> sqlite3.Connection | None:
+        """
+        :param create: Create the database if it does not exist
+        :return: Connection, or `None` if the database does not exist and `create`
+            is `False`, so reads do not create empty databases
+        """
+        if self._connection is None:
+            if not create and not self.path.exists():
+                return None
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.row_factory = sqlite3.Row
+            (user_version,) = connection.execute("PRAGMA user_version").fetchone()
+            if user_version != SAFE_EVENT_INDEX_SCHEMA_VERSION:
+                # Index can be rebuilt from the chain, so old schemas are dropped
+                for (table,) in connection.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'table'"
+                ).fetchall():
+                    connection.execute(f"DROP TABLE {table}")
+                connection.execute(
+                    f"PRAGMA user_version = {SAFE_EVENT_INDEX_SCHEMA_VERSION}"
+                )
+            connection.executescript(SAFE_EVENT_INDEX_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def get_last_block(
+        self, chain_id: int, safe_address: ChecksumAddress
+    ) -> int | None:
+        """
+        :return: Last block indexed for the Safe, `None` if it was never indexed
+        """
+        if not (connection := self._connect()):
+            return None
+        row = connection.execute(
+            "SELECT last_block FROM index_state "
+            "WHERE chain_id = ? AND safe_address = ?",
+            (chain_id, safe_address),
+        ).fetchone()
+        return row["last_block"] if row else None
+
+    def update(
+        self,
+        ethereum_client: EthereumClient,
+        safe_address: ChecksumAddress,
+        to_block: int | None = None,
+    ) -> int:
+        """
+        Index the blocks after the last checkpoint. The first time, scan starts at the
+        deployment block of the Safe
+
+        :param ethereum_client:
+        :param safe_address:
+        :param to_block: Last block to index. Latest block by default
+        :return: Number of executions indexed
+        :raises Web3Exception: If node rejects a request for a single block
+        """
+        chain_id = get_chain_id(ethereum_client)
+        topics = get_safe_event_topics(
+            SAFE_EXECUTION_EVENTS
+            + SAFE_CONFIGURATION_EVENTS
+            + (SAFE_MULTISIG_TRANSACTION_EVENT,)
+        )
+        if to_block is None:
+            to_block = ethereum_client.current_block_number
+        with self._lock:
+            connection = self._connect(create=True)
+            if not ChainCache.is_cacheable_chain(chain_id):
+                self._delete(connection, chain_id, safe_address)
+            last_block = self.get_last_block(chain_id, safe_address)
+            if last_block is None:
+                from_block = get_deployment_block(
+                    ethereum_client, safe_address, to_block
+                )
+            else:
+                from_block = max(last_block - SAFE_EVENT_INDEX_REORG_BLOCKS, 0) + 1
+
+            indexed = 0
+            for checkpoint_from_block in range(
+                from_block, to_block + 1, SAFE_EVENT_INDEX_CHECKPOINT_BLOCKS
+            ):
+                checkpoint_to_block = min(
+                    checkpoint_from_block + SAFE_EVENT_INDEX_CHECKPOINT_BLOCKS - 1,
+                    to_block,
+                )
+                logs = scan_block_range(
+                    lambda window_from_block, window_to_block: (
+                        ethereum_client.w3.eth.get_logs(
+                            {
+                                "address": safe_address,
+                                "fromBlock": window_from_block,
+                                "toBlock": window_to_block,
+                                "topics": [topics],
+                            }
+                        )
+                    ),
+                    checkpoint_from_block,
+                    checkpoint_to_block,
+                )
+                events = [event for log in logs if (event := decode_safe_log(log))]
+                executions = _build_executions(ethereum_client, safe_address, events)
+                with connection:
+                    # Blocks scanned again replace the previous executions
+                    connection.execute(
+                        "DELETE FROM executions WHERE chain_id = ? "
+                        "AND safe_address = ? AND block_number >= ?",
+                        (chain_id, safe_address, checkpoint_from_block),
+                    )
+                    (next_nonce,) = connection.execute(
+                        "SELECT COALESCE(MAX(nonce) + 1, 0) FROM executions "
+                        "WHERE chain_id = ? AND safe_address = ?",
+                        (chain_id, safe_address),
+                    ).fetchone()
+                    for event, transaction in executions:
+                        # Nonce of not L2 Safes is the number of previous executions
+                        if transaction["nonce"] is None:
+                            transaction["nonce"] = next_nonce
+                        next_nonce = transaction["nonce"] + 1
+                        connection.execute(
+                            "INSERT OR REPLACE INTO executions (chain_id, "
+                            "safe_address, block_number, log_index, nonce, data) "
+                            "VALUES (?, ?, ?, ?, ?, ?)",
+                            (
+                                chain_id,
+                                safe_address,
+                                event.block_number,
+                                event.log_index,
+                                transaction["nonce"],
+                                json.dumps(transaction),
+                            ),
+                        )
+                    connection.execute(
+                        "INSERT OR REPLACE INTO index_state "
+                        "(chain_id, safe_address, last_block) VALUES (?, ?, ?)",
+                        (chain_id, safe_address, checkpoint_to_block),
+                    )
+                indexed += len(executions)
+        return indexed
+
+    def iter_executions(
+        self,
+        chain_id: int,
+        safe_address: ChecksumAddress,
+        since_nonce: int | None = None,
+        limit: int | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        :return: Executed transactions of the Safe in the same format and order as the
+            tx service history (newest first), read while the iterator is consumed
+        """
+        if not (connection := self._connect()):
+            return
+        with closing(
+            connection.execute(
+                "SELECT data FROM executions "
+                "WHERE chain_id = ? AND safe_address = ? AND nonce >= ? "
+                "ORDER BY block_number DESC, log_index DESC LIMIT ?",
+                (
+                    chain_id,
+                    safe_address,
+                    since_nonce if since_nonce is not None else 0,
+                    limit if limit is not None else -1,
+                ),
+            )
+        ) as cursor:
+            for row in cursor:
+                yield json.loads(row["data"])
+
+    @staticmethod
+    def _delete(
+        connection: sqlite3.Connection,
+        chain_id: int | None = None,
+        safe_address: ChecksumAddress | None = None,
+    ) -> None:
+        conditions = []
+        parameters: list[Any] = []
+        if chain_id is not None:
+            conditions.append("chain_id = ?")
+            parameters.append(chain_id)
+        if safe_address is not None:
+            conditions.append("safe_address = ?")
+            parameters.append(safe_address)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        with connection:
+            for table in ("executions", "index_state"):
+                connection.execute(f"DELETE FROM {table}{where}", parameters)
+
+    def invalidate(
+        self,
+        chain_id: int | None = None,
+        safe_address: ChecksumAddress | None = None,
+    ) -> None:
+        """
+        Remove the indexed events, next update scans them again
+
+        :param chain_id: Only remove the Safes for this chain. If not provided, the
+            whole index is removed
+        :param safe_address: Only remove this Safe
+        """
+        if not (connection := self._connect()):
+            return
+        with self._lock:
+            self._delete(connection, chain_id, safe_address)
+
+
+@cache
+def get_safe_event_index() -> SafeEventIndex:
+    return SafeEventIndex(get_cache_dir() / SAFE_EVENT_INDEX_FILE_NAME)
@@ -0,0 +1,135 @@
+"""
+Watch the configuration and execution events of a Safe, so the information shown on the
+prompt is updated applying the changes instead of retrieving every field again. Logs are
+polled from the last block seen, optionally on a background thread.
+"""
+
+import logging
+import threading
+from collections.abc import Callable, Sequence
+
+from eth_typing import ChecksumAddress
+from requests import RequestException
+from safe_eth.eth import EthereumClient
+from web3.exceptions import Web3Exception
+
+from .safe_event_index import (
+    SAFE_CONFIGURATION_EVENTS,
+    SAFE_EXECUTION_EVENTS,
+    SafeEvent,
+    decode_safe_log,
+    get_safe_event_topics,
+)
+from .utils import scan_block_range
+
+logger = logging.getLogger(__name__)
+
+SAFE_EVENT_WATCHER_POLL_INTERVAL = 5  # Seconds between polls on the background thread
+SAFE_WATCHED_EVENTS = SAFE_CONFIGURATION_EVENTS + SAFE_EXECUTION_EVENTS
+
+
+class SafeEventWatcher:
+    def __init__(
+        self,
+        ethereum_client: EthereumClient,
+        safe_address: ChecksumAddress,
+        event_names: Sequence[str] = SAFE_WATCHED_EVENTS,
+        poll_interval: float = SAFE_EVENT_WATCHER_POLL_INTERVAL,
+    ):
+        """
+        :param ethereum_client:
+        :param safe_address:
+        :param event_names: Safe events to watch
+        :param poll_interval: Seconds between polls on the background thread
+        """
+        self.ethereum_client = ethereum_client
+        self.safe_address = safe_address
+        self.topics = get_safe_event_topics(event_names)
+        self.poll_interval = poll_interval
+        self._last_block: int | None = None
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._stop_event = threading.Event()
+
+    @property
+    def last_block(self) -> int | None:
+        """
+        :return: Last block seen, `None` if the watcher was never reset
+        """
+        return self._last_block
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def reset(self, block_number: int | None) -> None:
+        """
+        :param block_number: Events are polled from the next block
+        """
+        with self._lock:
+            self._last_block = block_number
+
+    def poll(self) -> tuple[list[SafeEvent], int | None]:
+        """
+        :return: Events emitted since the last block seen, in block order, and the
+            last block polled
+        :raises Web3Exception: If node rejects a request for a single block
+        """
+        with self._lock:
+            if self._last_block is None:
+                raise ValueError("Watcher must be reset before polling")
+            to_block = self.ethereum_client.current_block_number
+            if to_block <= self._last_block:
+                return [], self._last_block
+            logs = scan_block_range(
+                lambda window_from_block, window_to_block: (
+                    self.ethereum_client.w3.eth.get_logs(
+                        {
+                            "address": self.safe_address,
+                            "fromBlock": window_from_block,
+                            "toBlock": window_to_block,
+                            "topics": [self.topics],
+                        }
+                    )
+                ),
+                self._last_block + 1,
+                to_block,
+            )
+            self._last_block = to_block
+        return [event for log in logs if (event := decode_safe_log(log))], to_block
+
+    def start(self, on_poll: Callable[[], None]) -> None:
+        """
+        Call `on_poll` every `poll_interval` on a background thread, until `stop` is
+        called. Node errors are ignored and any other error is logged, so next poll
+        tries again and the thread is never stopped by an error
+
+        :param on_poll: Function polling the watcher and applying the events. It must
+            not use the event loop of the async operators, owned by the main thread
+        """
+        if self.is_running:
+            return
+        # Every thread gets its own event, so a thread stopped in the middle of a poll
+        # exits when done, instead of polling again if the watcher is restarted
+        stop_event = threading.Event()
+        self._stop_event = stop_event
+
+        def run() -> None:
+            while not stop_event.wait(self.poll_interval):
+                try:
+                    on_poll()
+                except (Web3Exception, ValueError, RequestException):
+                    pass
+                except Exception:
+                    logger.exception(
+                        "Cannot apply the events of Safe %s", self.safe_address
+                    )
+
+        self._thread = threading.Thread(
+            target=run, name="SafeEventWatcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self._thread = None
@@ -0,0 +1,241 @@
+"""
+Deploy many Safes in one run for onboardings. Safes to deploy are read from a CSV or a
+JSONL file and the result of every deployment is written to a JSONL manifest.
+
+Addresses are predicted locally and Safes already deployed are skipped, so a fleet file
+can be deployed again after a failure. Transactions are sent with the `TxPipeline` used
+to execute Safe transactions: deployer nonces are managed locally, several transactions
+are kept in flight, and transactions not mined in time are replaced with a higher gas
+price.
+"""
+
+import csv
+import dataclasses
+import json
+import re
+from collections.abc import Callable
+from enum import StrEnum
+from pathlib import Path
+
+from eth_account.signers.local import LocalAccount
+from eth_typing import ChecksumAddress
+from hexbytes import HexBytes
+from safe_eth.eth import EthereumClient
+from safe_eth.safe import ProxyFactory
+from safe_eth.util.util import to_0x_hex_str
+from web3 import Web3
+
+from safe_cli.create2 import SafeAddressPredictor
+from safe_cli.rpc_batch import batch_is_contract
+from safe_cli.tx_pipeline import PipelinedTx, TxPipeline
+
+FLEET_BATCH_SIZE = 100  # Addresses checked on every `eth_getCode` batch
+DEFAULT_MAX_IN_FLIGHT = 10
+
+
+class FleetSafeStatus(StrEnum):
+    PENDING = "pending"  # Not sent, or sent with `tx_hash` and not mined yet
+    EXISTING = "existing"
+    DEPLOYED = "deployed"
+    FAILED = "failed"
+
+
+@dataclasses.dataclass
+class FleetSafe:
+    owners: list[ChecksumAddress]
+    threshold: int
+    salt_nonce: int
+    address: ChecksumAddress | None = None
+    status: FleetSafeStatus = FleetSafeStatus.PENDING
+    tx_hash: str | None = None
+    error: str | None = None
+
+
+def _parse_fleet_safe(
+    owners: list[str], threshold: int | str, salt_nonce: int | str
+) -> FleetSafe:
+    for owner in owners:
+        if not Web3.is_checksum_address(owner):
+            raise ValueError(f"{owner} is not a valid checksummed ethereum address")
+    threshold = int(threshold)
+    if not 0 < threshold <= len(owners):
+        raise ValueError(
+            f"Threshold {threshold} must be greater than 0 and less or equal than "
+            f"the number of owners"
+        )
+    return FleetSafe(owners, threshold, int(salt_nonce))
+
+
+def load_fleet_file(path: str | Path) -> list[FleetSafe]:
+    """
+    Load the Safes to deploy. JSONL files (`.jsonl` or `.json`) have one object per line
+    with `owners` (list), `threshold` and `salt_nonce`. CSV files have a header with
+    `owners`, `threshold` and `salt_nonce` columns, owners separated by spaces or `;`
+
+    :param path:
+    :return: Safes to deploy
+    :raises ValueError: If a line is not valid
+    """
+    path = Path(path)
+    fleet = []
+    with open(path, newline="") as fleet_file:
+        if path.suffix in (".jsonl", ".json"):
+            rows = (
+                (line_number, json.loads(line))
+                for line_number, line in enumerate(fleet_file, start=1)
+                if line.strip()
+            )
+        else:
+            rows = (
+                (line_number, row)
+                for line_number, row in enumerate(csv.DictReader(fleet_file), start=2)
+            )
+        for line_number, row in rows:
+            try:
+                owners = row["owners"]
+                if isinstance(owners, str):
+                    owners = re.split(r"[\s;]+", owners.strip())
+                fleet.append(
+                    _parse_fleet_safe(owners, row["threshold"], row["salt_nonce"])
+                )
+            except (KeyError, TypeError, ValueError) as e:
+                raise ValueError(f"{path}:{line_number} is not valid: {e}") from e
+    return fleet
+
+
+def write_fleet_manifest(path: str | Path, fleet: list[FleetSafe]) -> None:
+    """
+    :param path:
+    :param fleet:
+    :return: Write one JSON line per Safe with the deployment result
+    """
+    with open(path, "w") as manifest_file:
+        for fleet_safe in fleet:
+            manifest_file.write(json.dumps(dataclasses.asdict(fleet_safe)) + "\n")
+
+
+class FleetTxPipeline(TxPipeline[FleetSafe]):
+    def __init__(
+        self,
+        ethereum_client: EthereumClient,
+        deployer_account: LocalAccount,
+        predictor: SafeAddressPredictor,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        **kwargs,
+    ):
+        """
+        :param ethereum_client:
+        :param deployer_account:
+        :param predictor: Contracts used for the deployment
+        :param max_in_flight: Maximum number of transactions sent and not mined
+        :param kwargs: Other `TxPipeline` parameters
+        """
+        super().__init__(
+            ethereum_client,
+            deployer_account.address,
+            max_in_flight=max_in_flight,
+            continue_on_send_error=True,  # Deployments do not depend on each other
+            **kwargs,
+        )
+        self.deployer_account = deployer_account
+        self.predictor = predictor
+        self.proxy_factory = ProxyFactory(
+            predictor.proxy_factory_address, ethereum_client
+        )
+
+    def _broadcast(self, pipelined_tx: PipelinedTx[FleetSafe]) -> HexBytes:
+        fleet_safe = pipelined_tx.tx
+        return self.proxy_factory.deploy_proxy_contract_with_nonce(
+            self.deployer_account,
+            self.predictor.master_copy,
+            self.predictor.get_initializer(fleet_safe.owners, fleet_safe.threshold),
+            fleet_safe.salt_nonce,
+            gas=pipelined_tx.gas,
+            gas_price=pipelined_tx.gas_price,
+            nonce=pipelined_tx.nonce,
+        ).tx_hash
+
+
+def deploy_fleet(
+    ethereum_client: EthereumClient,
+    deployer_account: LocalAccount,
+    predictor: SafeAddressPredictor,
+    fleet: list[FleetSafe],
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    on_update: Callable[[FleetSafe], None] | None = None,
+    **pipeline_kwargs,
+) -> list[FleetSafe]:
+    """
+    Deploy every Safe of the `fleet` not deployed yet. Deployment transactions are sent
+    with consecutive deployer nonces, keeping up to `max_in_flight` transactions not
+    mined. Safes whose transaction could not be mined, or was not sent because a
+    previous one is stuck, are left `pending` (with their `tx_hash` if sent), so
+    deploying the fleet again skips them once they are mined
+
+    :param ethereum_client:
+    :param deployer_account:
+    :param predictor: Contracts used for the deployment
+    :param fleet: Safes are updated in place with the address and the result
+    :param max_in_flight: Maximum number of transactions sent and not mined
+    :param on_update: Called when the result of a Safe is known
+    :param pipeline_kwargs: Other `TxPipeline` parameters, e.g. `stuck_timeout`
+    :return: The `fleet`
+    """
+
+    def update(
+        fleet_safe: FleetSafe, status: FleetSafeStatus, error: str | None = None
+    ):
+        fleet_safe.status = status
+        fleet_safe.error = error
+        if on_update:
+            on_update(fleet_safe)
+
+    def update_pipelined_tx(pipelined_tx: PipelinedTx[FleetSafe]):
+        fleet_safe = pipelined_tx.tx
+        if pipelined_tx.tx_hash:
+            fleet_safe.tx_hash = to_0x_hex_str(pipelined_tx.tx_hash)
+        if pipelined_tx.receipt:
+            if pipelined_tx.succeeded:
+                update(fleet_safe, FleetSafeStatus.DEPLOYED)
+            else:
+                update(fleet_safe, FleetSafeStatus.FAILED, pipelined_tx.error)
+        elif pipelined_tx.error:
+            if pipelined_tx.tx_hashes or pipelined_tx.blocked:
+                # Transaction can still be mined, or was not sent
+                update(fleet_safe, FleetSafeStatus.PENDING, pipelined_tx.error)
+            else:
+                update(fleet_safe, FleetSafeStatus.FAILED, pipelined_tx.error)
+
+    for fleet_safe in fleet:
+        fleet_safe.address = predictor.predict(
+            fleet_safe.owners, fleet_safe.threshold, fleet_safe.salt_nonce
+        )
+
+    pending = []
+    pending_addresses = set()
+    for start in range(0, len(fleet), FLEET_BATCH_SIZE):
+        chunk = fleet[start : start + FLEET_BATCH_SIZE]
+        is_contract = batch_is_contract(
+            ethereum_client, [fleet_safe.address for fleet_safe in chunk]
+        )
+        for fleet_safe, address_is_contract in zip(chunk, is_contract, strict=True):
+            if address_is_contract:
+                update(fleet_safe, FleetSafeStatus.EXISTING)
+            elif fleet_safe.address in pending_addresses:
+                update(fleet_safe, FleetSafeStatus.FAILED, "Duplicated Safe on fleet")
+            else:
+                pending.append(fleet_safe)
+                pending_addresses.add(fleet_safe.address)
+
+    if pending:
+        FleetTxPipeline(
+            ethereum_client,
+            deployer_account,
+            predictor,
+            max_in_flight=max_in_flight,
+            **pipeline_kwargs,
+        ).execute_pipelined_txs(
+            [PipelinedTx(fleet_safe, None) for fleet_safe in pending],
+            on_update=update_pipelined_tx,
+        )
+    return fleet
@@ -11,6 +11,7 @@ class SafeLexer(BashLexer):
     ADDRESS = r"^0x[a-fA-F0-9]{40}$|^0x[a-fA-F0-9]{64}$"
     EXTRA_KEYWORDS = {
         "refresh",
+        "invalidate_cache",
         "get_nonce",
         "get_owners",
         "get_threshold",
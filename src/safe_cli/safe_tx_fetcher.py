@@ -0,0 +1,88 @@
+"""
+Retrieve several transactions from the Safe Transaction Service concurrently. Requests
+run on a bounded thread pool sharing the keep-alive http session of the
+`TransactionServiceApi`, and every failure is reported together instead of stopping on
+the first one.
+"""
+
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+
+from hexbytes import HexBytes
+from requests import RequestException
+from safe_eth.safe import SafeTx
+from safe_eth.safe.api import SafeAPIException, TransactionServiceApi
+from safe_eth.util.util import to_0x_hex_str
+
+SAFE_TX_FETCH_MAX_WORKERS = 8  # Requests in flight at the same time
+
+SafeTxResult = tuple[SafeTx, HexBytes | None]
+
+
+class SafeTxFetchException(SafeAPIException):
+    """
+    One or more transactions could not be retrieved
+    """
+
+    def __init__(self, errors: dict[HexBytes, Exception]):
+        """
+        :param errors: Error for every `safe-tx-hash` that could not be retrieved
+        """
+        self.errors = errors
+        super().__init__(
+            f"Cannot get {len(errors)} transactions: "
+            + ", ".join(
+                f"safe-tx-hash={to_0x_hex_str(safe_tx_hash)} ({error})"
+                for safe_tx_hash, error in errors.items()
+            )
+        )
+
+
+def collect_safe_tx_results(
+    safe_tx_hashes: Sequence[bytes | str],
+    results: Sequence[SafeTxResult | Exception],
+) -> list[SafeTxResult]:
+    """
+    :param safe_tx_hashes:
+    :param results: Result or error for every `safe_tx_hash`, in the same order
+    :return: `results` if there are no errors
+    :raises: SafeTxFetchException with the errors of every failing `safe-tx-hash`
+    """
+    errors = {
+        HexBytes(safe_tx_hash): result
+        for safe_tx_hash, result in zip(safe_tx_hashes, results, strict=True)
+        if isinstance(result, Exception)
+    }
+    if errors:
+        raise SafeTxFetchException(errors)
+    return list(results)
+
+
+def fetch_safe_transactions(
+    safe_tx_service: TransactionServiceApi,
+    safe_tx_hashes: Sequence[bytes | str],
+    max_workers: int = SAFE_TX_FETCH_MAX_WORKERS,
+) -> list[SafeTxResult]:
+    """
+    :param safe_tx_service:
+    :param safe_tx_hashes:
+    :param max_workers: Maximum number of concurrent requests
+    :return: SafeTx and `tx-hash` (if executed) for every `safe_tx_hash`, in the same
+        order
+    :raises: SafeTxFetchException
+    """
+
+    def fetch(safe_tx_hash: bytes | str) -> SafeTxResult | Exception:
+        try:
+            return safe_tx_service.get_safe_transaction(safe_tx_hash)
+        except (SafeAPIException, RequestException, ValueError) as e:
+            return e
+
+    if len(safe_tx_hashes) <= 1:
+        results = [fetch(safe_tx_hash) for safe_tx_hash in safe_tx_hashes]
+    else:
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(safe_tx_hashes))
+        ) as executor:
+            results = list(executor.map(fetch, safe_tx_hashes))
+    return collect_safe_tx_results(safe_tx_hashes, results)
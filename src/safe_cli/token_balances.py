@@ -0,0 +1,156 @@
+"""
+Retrieve the balance, decimals, symbol and name of many ERC20 tokens with a few requests,
+using Multicall3 `aggregate3` if available or JSON-RPC batches otherwise.
+"""
+
+import dataclasses
+from collections.abc import Sequence
+
+from eth_abi import decode as decode_abi
+from eth_abi.exceptions import DecodingError
+from eth_typing import BlockIdentifier, ChecksumAddress
+from hexbytes import HexBytes
+from requests import RequestException
+from safe_eth.eth import EthereumClient
+from web3.exceptions import Web3Exception
+
+from safe_cli.rpc_batch import (
+    MulticallCall,
+    MulticallNotDeployed,
+    batch_rpc_request,
+    decode_call_result,
+    encode_call_data,
+    eth_call_request,
+    multicall3_aggregate3,
+)
+
+TOKEN_BALANCES_CHUNK_SIZE = 100  # Tokens retrieved on every request
+TOKEN_CALLS = (
+    ("balanceOf(address)", ["address"]),
+    ("decimals()", []),
+    ("symbol()", []),
+    ("name()", []),
+)
+
+
+@dataclasses.dataclass
+class TokenBalance:
+    token_address: ChecksumAddress | None  # `None` for the native token
+    balance: int
+    decimals: int | None
+    symbol: str | None
+    name: str | None
+
+
+def _decode_string(result: bytes | None) -> str | None:
+    """
+    :param result:
+    :return: `string` return value. Old tokens (e.g. MKR) return `bytes32` instead
+    """
+    if not result:
+        return None
+    try:
+        return decode_abi(["string"], result)[0]
+    except (DecodingError, OverflowError, UnicodeDecodeError):
+        return HexBytes(result[:32]).rstrip(b"\0").decode(errors="replace") or None
+
+
+def _call_many(
+    ethereum_client: EthereumClient,
+    calls: Sequence[MulticallCall],
+    block_identifier: BlockIdentifier,
+) -> list[bytes | None]:
+    """
+    :return: Return data for every call, `None` for the calls that failed
+    :raises ValueError: If the node rejects the request
+    :raises Web3Exception: If the node rejects the request
+    """
+    if multicall := ethereum_client.multicall:
+        try:
+            return multicall3_aggregate3(
+                ethereum_client, multicall.address, calls, block_identifier
+            )
+        except MulticallNotDeployed:
+            pass  # Use a JSON-RPC batch instead
+    return [
+        bytes(HexBytes(result)) if result else None
+        for result in batch_rpc_request(
+            ethereum_client,
+            [
+                eth_call_request(to, call_data, block_identifier)
+                for to, call_data in calls
+            ],
+        )
+    ]
+
+
+def get_token_balances(
+    ethereum_client: EthereumClient,
+    address: ChecksumAddress,
+    token_addresses: Sequence[ChecksumAddress],
+    include_native_balance: bool = True,
+    chunk_size: int = TOKEN_BALANCES_CHUNK_SIZE,
+    block_identifier: BlockIdentifier = "latest",
+) -> list[TokenBalance]:
+    """
+    Retrieve `balanceOf`, `decimals`, `symbol` and `name` for every token, `chunk_size`
+    tokens on every request. Chunk is halved when the node rejects a request (response
+    too big, timeout...)
+
+    :param ethereum_client:
+    :param address: Holder of the tokens
+    :param token_addresses:
+    :param include_native_balance: If `True`, native token balance is returned first
+    :param chunk_size: Initial number of tokens on every request
+    :param block_identifier:
+    :return: Balances in the same order as `token_addresses`. Tokens without
+        `balanceOf` have `0` balance
+    :raises ValueError: If node does not support Multicall3 or batch requests
+    :raises Web3Exception: If node rejects a request for a single token
+    :raises requests.RequestException: If node cannot be reached
+    """
+    balances = []
+    if include_native_balance:
+        balances.append(
+            TokenBalance(
+                None,
+                ethereum_client.get_balance(address, block_identifier),
+                18,
+                "Ξ",
+                "ETHER",
+            )
+        )
+
+    start = 0
+    while start < len(token_addresses):
+        chunk = token_addresses[start : start + chunk_size]
+        calls = [
+            (
+                token_address,
+                encode_call_data(signature, types, [address] if types else []),
+            )
+            for token_address in chunk
+            for signature, types in TOKEN_CALLS
+        ]
+        try:
+            results = _call_many(ethereum_client, calls, block_identifier)
+        except (Web3Exception, ValueError, RequestException):
+            if len(chunk) == 1:
+                raise
+            chunk_size = max(len(chunk) // 2, 1)
+            continue
+        start += len(chunk)
+        for index, token_address in enumerate(chunk):
+            balance, decimals, symbol, name = results[
+                index * len(TOKEN_CALLS) : (index + 1) * len(TOKEN_CALLS)
+            ]
+            balances.append(
+                TokenBalance(
+                    token_address,
+                    decode_call_result(["uint256"], balance) or 0,
+                    decode_call_result(["uint8"], decimals),
+                    _decode_string(symbol),
+                    _decode_string(name),
+                )
+            )
+    return balances
@@ -0,0 +1,118 @@
+"""
+Persistent index of the tokens every Safe interacted with, so `Transfer` logs are only
+scanned for the blocks not seen before.
+
+Index is stored as a JSON file next to the chain cache, keyed by chain id and Safe
+address. Development chains are not indexed.
+"""
+
+from functools import cache
+from typing import Any
+
+from eth_typing import ChecksumAddress
+from safe_eth.eth import EthereumClient
+
+from safe_cli.chain_cache import (
+    ChainCache,
+    JsonFileCache,
+    get_cache_dir,
+    get_chain_id,
+)
+from safe_cli.utils import (
+    get_deployment_block,
+    get_erc_20_list,
+    get_erc_20_received_list,
+)
+
+TOKEN_INDEX_VERSION = 1
+TOKEN_INDEX_FILE_NAME = "token_index.json"
+# Last blocks are scanned again on every update, in case of reorgs
+TOKEN_INDEX_REORG_BLOCKS = 64
+
+
+class TokenIndex(JsonFileCache):
+    """
+    Tokens found on `Transfer` logs and last block scanned, keyed by chain id and
+    Safe address
+    """
+
+    def _empty(self) -> dict[str, Any]:
+        return {"version": TOKEN_INDEX_VERSION, "chains": {}}
+
+    def get_tokens(
+        self, chain_id: int, safe_address: ChecksumAddress
+    ) -> tuple[set[ChecksumAddress], int | None]:
+        """
+        :return: Tokens indexed and last block scanned for the Safe. `None` if the
+            Safe was never scanned
+        """
+        if not ChainCache.is_cacheable_chain(chain_id):
+            return set(), None
+        entry = self._data["chains"].get(str(chain_id), {}).get(safe_address)
+        if not entry:
+            return set(), None
+        return set(entry["tokens"]), entry["last_block"]
+
+    def set_tokens(
+        self,
+        chain_id: int,
+        safe_address: ChecksumAddress,
+        tokens: set[ChecksumAddress],
+        last_block: int,
+    ) -> None:
+        if ChainCache.is_cacheable_chain(chain_id):
+            self._data["chains"].setdefault(str(chain_id), {})[safe_address] = {
+                "tokens": sorted(tokens),
+                "last_block": last_block,
+            }
+            self._save()
+
+    def invalidate(self, chain_id: int | None = None) -> None:
+        """
+        :param chain_id: Only remove the Safes for this chain. If not provided, the
+            whole index is removed
+        """
+        if chain_id is None:
+            self._data = self._empty()
+        else:
+            self._data["chains"].pop(str(chain_id), None)
+        self._save()
+
+
+@cache
+def get_token_index() -> TokenIndex:
+    return TokenIndex(get_cache_dir() / TOKEN_INDEX_FILE_NAME)
+
+
+def get_safe_tokens(
+    ethereum_client: EthereumClient,
+    safe_address: ChecksumAddress,
+    to_block: int | None = None,
+) -> set[ChecksumAddress]:
+    """
+    :param ethereum_client:
+    :param safe_address:
+    :param to_block: Last block to scan. Latest block by default
+    :return: ERC20 tokens the Safe sent or received. Only the blocks after the last
+        update of the index are scanned. The first time, scan starts at the deployment
+        block of the Safe, and only the tokens received are scanned for the previous
+        blocks, as tokens can be sent to the counterfactual address of the Safe
+    """
+    token_index = get_token_index()
+    chain_id = get_chain_id(ethereum_client)
+    tokens, last_block = token_index.get_tokens(chain_id, safe_address)
+    if to_block is None:
+        to_block = ethereum_client.current_block_number
+    if last_block is None:
+        from_block = get_deployment_block(ethereum_client, safe_address, to_block)
+        if from_block:
+            tokens |= get_erc_20_received_list(
+                ethereum_client, safe_address, 0, from_block - 1
+            )
+    else:
+        from_block = max(last_block - TOKEN_INDEX_REORG_BLOCKS, 0) + 1
+
+    if from_block <= to_block:
+        tokens |= get_erc_20_list(ethereum_client, safe_address, from_block, to_block)
+        token_index.set_tokens(chain_id, safe_address, tokens, to_block)
+    return tokens
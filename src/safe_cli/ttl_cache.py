@@ -0,0 +1,88 @@
+"""
+In memory cache for reads that change rarely, like the delegates of a Safe on the tx
+service. Entries expire after a TTL and can be invalidated or updated in place when the
+cli itself changes them.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+TX_SERVICE_CACHE_TTL = 300  # Seconds
+
+_MISSING = object()
+
+
+class TtlCache:
+    def __init__(self, ttl: float = TX_SERVICE_CACHE_TTL):
+        """
+        :param ttl: Seconds an entry is valid
+        """
+        self.ttl = ttl
+        self._entries: dict[str, tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry[0] > time.monotonic()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        :return: Cached value, or `default` if it is missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def get_or_set(self, key: str, fetch: Callable[[], T]) -> T:
+        """
+        :param key:
+        :param fetch: Retrieves the value if it is not cached
+        :return: Cached value, or the one returned by `fetch`
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = fetch()
+            self.set(key, value)
+        return value
+
+    def update(self, key: str, update_value: Callable[[T], T]) -> bool:
+        """
+        Update a cached value in place, keeping its expiration. Nothing is done if
+        the value is not cached, so next read retrieves it
+
+        :param key:
+        :param update_value: Returns the new value from the cached one
+        :return: `True` if the value was cached and updated
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                return False
+            expires_at, value = entry
+            self._entries[key] = (expires_at, update_value(value))
+            return True
+
+    def invalidate(self, key: str | None = None) -> None:
+        """
+        :param key: Entry to remove. Every entry is removed if not provided
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
@@ -0,0 +1,63 @@
+"""
+Stream the transaction history of a Safe from the Safe Transaction Service. Pages are
+requested following the `next` cursor of every response only when the previous one was
+consumed, so history is printed as it arrives and memory does not grow with the number
+of transactions.
+"""
+
+from collections.abc import Iterator
+from typing import Any
+from urllib.parse import urlencode
+
+from eth_typing import ChecksumAddress
+from safe_eth.safe.api import SafeAPIException, TransactionServiceApi
+
+from .tx_service_http import tx_service_get
+
+TX_HISTORY_PAGE_SIZE = 100  # Transactions requested on every page
+TX_HISTORY_FORMATS = ("table", "jsonl")
+
+
+def iter_tx_service_results(
+    safe_tx_service: TransactionServiceApi, path: str, query: dict[str, Any]
+) -> Iterator[dict[str, Any]]:
+    """
+    :param safe_tx_service:
+    :param path: Path of a paginated endpoint
+    :param query: Query parameters for the first page, `next` cursors keep them
+    :return: Results of every page, requesting the next one when the previous one
+        was consumed
+    :raises: SafeAPIException
+    """
+    url = f"{path}?{urlencode(query)}"
+    while url:
+        # `next` cursors are absolute urls
+        response = tx_service_get(safe_tx_service, url)
+        if not response.ok:
+            raise SafeAPIException(f"Cannot get {path}: {response.content!r}")
+        page = response.json()
+        yield from page.get("results", [])
+        url = page.get("next")
+
+
+def iter_multisig_transactions(
+    safe_tx_service: TransactionServiceApi,
+    safe_address: ChecksumAddress,
+    since_nonce: int | None = None,
+    page_size: int = TX_HISTORY_PAGE_SIZE,
+) -> Iterator[dict[str, Any]]:
+    """
+    :param safe_tx_service:
+    :param safe_address:
+    :param since_nonce: Only transactions with this nonce or higher
+    :param page_size: Transactions requested on every page
+    :return: Multisig transactions of the Safe, as returned by the tx service (newest
+        nonce first)
+    :raises: SafeAPIException
+    """
+    query = {"limit": page_size}
+    if since_nonce is not None:
+        query["nonce__gte"] = since_nonce
+    return iter_tx_service_results(
+        safe_tx_service, f"/api/v2/safes/{safe_address}/multisig-transactions/", query
+    )
@@ -0,0 +1,356 @@
+"""
+Send several transactions from one sender without waiting for every one of them to be
+mined. Sender nonces are assigned locally, every transaction is broadcast in order and
+receipts are waited together. If the oldest transaction is not mined in time it is
+replaced with a higher gas price, and no new nonces are sent until it is mined, as it
+blocks every next one.
+
+`SafeTxPipeline` executes Safe transactions with consecutive Safe nonces, and the Safe
+fleet deployment uses the same pipeline for the proxy creation transactions.
+"""
+
+import dataclasses
+import math
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future
+from typing import Generic, TypeVar
+
+from eth_typing import ChecksumAddress
+from hexbytes import HexBytes
+from safe_eth.eth import EthereumClient
+from safe_eth.safe import Safe, SafeTx
+from safe_eth.safe.exceptions import CannotEstimateGas
+from web3.exceptions import Web3Exception
+from web3.types import TxReceipt
+
+from safe_cli.receipt_tracker import ReceiptTracker
+
+# Gas used by `execTransaction` on top of the inner transaction (signatures, refunds...)
+PIPELINE_TX_BASE_GAS = 100_000
+# Gas for inner transactions that cannot be estimated before the previous ones are mined
+PIPELINE_TX_DEFAULT_GAS = 1_000_000
+PIPELINE_POLL_INTERVAL = 2  # Seconds between receipt polls
+PIPELINE_STUCK_TIMEOUT = 60  # Seconds before replacing a transaction not mined
+PIPELINE_GAS_PRICE_BUMP = 1.125  # Nodes require at least 10% more for replacements
+PIPELINE_MAX_REPLACEMENTS = 3
+
+T = TypeVar("T")
+
+# Send `safe_tx` with the provided `(gas, gas_price, nonce)` and return the tx hash
+SendSafeTx = Callable[[SafeTx, int, int, int], HexBytes]
+
+
+@dataclasses.dataclass
+class PipelinedTx(Generic[T]):
+    tx: T  # What the transaction is built from, e.g. a `SafeTx`
+    gas: int | None  # `None` to estimate it when sending
+    nonce: int | None = None
+    gas_price: int | None = None
+    tx_hashes: list[HexBytes] = dataclasses.field(default_factory=list)
+    receipt_futures: list[Future] = dataclasses.field(default_factory=list, repr=False)
+    sent_at: float | None = None
+    receipt: TxReceipt | None = None
+    error: str | None = None
+    # Given up because a previous transaction was not sent or mined
+    blocked: bool = False
+
+    @property
+    def tx_hash(self) -> HexBytes | None:
+        """
+        :return: Hash of the transaction mined, or of the last one sent
+        """
+        if self.receipt:
+            return HexBytes(self.receipt["transactionHash"])
+        return self.tx_hashes[-1] if self.tx_hashes else None
+
+    @property
+    def succeeded(self) -> bool:
+        return bool(self.receipt and self.receipt["status"] == 1)
+
+    @property
+    def replaced(self) -> bool:
+        return len(self.tx_hashes) > 1
+
+
+@dataclasses.dataclass
+class PipelinedSafeTx(PipelinedTx[SafeTx]):
+    # Kept for replacements, as executing a `SafeTx` clears them
+    signatures: bytes = b""
+
+    @property
+    def safe_tx(self) -> SafeTx:
+        return self.tx
+
+
+def estimate_safe_tx_gas(
+    ethereum_client: EthereumClient, sender: ChecksumAddress, safe_tx: SafeTx
+) -> int:
+    """
+    Estimate the gas of the transaction executing `safe_tx`. If it cannot be estimated
+    directly (e.g. the Safe nonce is not the current one), inner transaction is
+    estimated and the `execTransaction` overhead added
+
+    :param ethereum_client:
+    :param sender:
+    :param safe_tx:
+    :return: Gas limit for the transaction
+    """
+    try:
+        return safe_tx.w3_tx.estimate_gas({"from": sender}) + 75_000
+    except (Web3Exception, ValueError):
+        pass
+    try:
+        inner_gas = Safe(safe_tx.safe_address, ethereum_client).estimate_tx_gas(
+            safe_tx.to, safe_tx.value, safe_tx.data, safe_tx.operation
+        )
+    except (CannotEstimateGas, Web3Exception, ValueError):
+        inner_gas = PIPELINE_TX_DEFAULT_GAS
+    return max(
+        inner_gas + PIPELINE_TX_BASE_GAS + 16 * len(safe_tx.data or b""),
+        safe_tx.recommended_gas(),
+    )
+
+
+class TxPipeline(ABC, Generic[T]):
+    def __init__(
+        self,
+        ethereum_client: EthereumClient,
+        sender: ChecksumAddress,
+        poll_interval: float = PIPELINE_POLL_INTERVAL,
+        stuck_timeout: float = PIPELINE_STUCK_TIMEOUT,
+        max_replacements: int = PIPELINE_MAX_REPLACEMENTS,
+        receipt_tracker: ReceiptTracker | None = None,
+        max_in_flight: int | None = None,
+        continue_on_send_error: bool = False,
+    ):
+        """
+        :param ethereum_client:
+        :param sender: Account sending the transactions
+        :param poll_interval: Seconds between receipt polls
+        :param stuck_timeout: Seconds to wait before replacing a transaction not mined
+        :param max_replacements: Replacements of a transaction before giving up
+        :param receipt_tracker: Tracker to wait for the receipts. A new one polling
+            every `poll_interval` is used if not provided
+        :param max_in_flight: Maximum number of transactions sent and not mined. No
+            limit if not provided
+        :param continue_on_send_error: If `False`, next transactions are not sent when
+            one cannot be sent, e.g. as they depend on it. Otherwise, its nonce is used
+            for the next one
+        """
+        self.ethereum_client = ethereum_client
+        self.sender = sender
+        self.poll_interval = poll_interval
+        self.stuck_timeout = stuck_timeout
+        self.max_replacements = max_replacements
+        self.receipt_tracker = receipt_tracker or ReceiptTracker(
+            ethereum_client, poll_interval
+        )
+        self.max_in_flight = max_in_flight
+        self.continue_on_send_error = continue_on_send_error
+
+    @abstractmethod
+    def _broadcast(self, pipelined_tx: PipelinedTx[T]) -> HexBytes:
+        """
+        Send the transaction with the `gas`, `gas_price` and `nonce` of `pipelined_tx`
+
+        :return: Transaction hash
+        :raises Web3Exception | ValueError: If transaction cannot be sent
+        """
+
+    def _send(self, pipelined_tx: PipelinedTx[T]) -> None:
+        tx_hash = self._broadcast(pipelined_tx)
+        pipelined_tx.tx_hashes.append(HexBytes(tx_hash))
+        pipelined_tx.sent_at = time.monotonic()
+        pipelined_tx.receipt_futures.append(self.receipt_tracker.track(tx_hash))
+
+    def _replace(self, pipelined_tx: PipelinedTx[T]) -> None:
+        """
+        Send the transaction again with the same nonce and a higher gas price. If the
+        replacement is rejected (e.g. the original was mined meanwhile) receipts of the
+        transactions already sent are still polled
+        """
+        if len(pipelined_tx.tx_hashes) > self.max_replacements:
+            pipelined_tx.error = (
+                f"Transaction not mined after {self.max_replacements} replacements"
+            )
+            return
+        pipelined_tx.gas_price = math.ceil(
+            pipelined_tx.gas_price * PIPELINE_GAS_PRICE_BUMP
+        )
+        try:
+            self._send(pipelined_tx)
+        except (Web3Exception, ValueError):
+            pipelined_tx.sent_at = time.monotonic()
+
+    def _get_receipt(self, pipelined_tx: PipelinedTx[T]) -> TxReceipt | None:
+        """
+        :return: Receipt of the transaction or any of its replacements, if mined.
+            Replacements not mined are not tracked anymore
+        """
+        for future in pipelined_tx.receipt_futures:
+            if future.done() and not future.cancelled():
+                for receipt_future in pipelined_tx.receipt_futures:
+                    self.receipt_tracker.untrack(receipt_future)
+                return future.result()
+        return None
+
+    def execute_pipelined_txs(
+        self,
+        pipelined_txs: Sequence[PipelinedTx[T]],
+        on_update: Callable[[PipelinedTx[T]], None] | None = None,
+    ) -> Sequence[PipelinedTx[T]]:
+        """
+        Broadcast the transactions in order with consecutive sender nonces, keeping up
+        to `max_in_flight` of them not mined. No new transactions are sent while the
+        oldest one is being replaced. If it is not mined after `max_replacements`, the
+        next ones are given up, as their nonces cannot be mined before it
+
+        :param pipelined_txs: Transactions to send, updated in place
+        :param on_update: Called when a transaction is sent, replaced or resolved
+        :return: `pipelined_txs`
+        """
+
+        def update(pipelined_tx: PipelinedTx[T]):
+            if on_update:
+                on_update(pipelined_tx)
+
+        def give_up(pipelined_txs: Sequence[PipelinedTx[T]], error: str):
+            for pipelined_tx in pipelined_txs:
+                for future in pipelined_tx.receipt_futures:
+                    self.receipt_tracker.untrack(future)
+                pipelined_tx.error = error
+                pipelined_tx.blocked = True
+                update(pipelined_tx)
+
+        nonce = self.ethereum_client.get_nonce_for_account(
+            self.sender, block_identifier="pending"
+        )
+        gas_price = self.ethereum_client.w3.eth.gas_price
+        to_send = deque(pipelined_txs)
+        in_flight: deque[PipelinedTx[T]] = deque()
+        while to_send or in_flight:
+            while (
+                to_send
+                and (self.max_in_flight is None or len(in_flight) < self.max_in_flight)
+                and not (in_flight and in_flight[0].replaced)
+            ):
+                pipelined_tx = to_send.popleft()
+                pipelined_tx.nonce = nonce
+                pipelined_tx.gas_price = gas_price
+                try:
+                    self._send(pipelined_tx)
+                except (Web3Exception, ValueError) as e:
+                    pipelined_tx.error = str(e)
+                    update(pipelined_tx)
+                    if not self.continue_on_send_error:
+                        give_up(to_send, "Previous transaction was not sent")
+                        to_send.clear()
+                    continue
+                nonce += 1
+                in_flight.append(pipelined_tx)
+                update(pipelined_tx)
+
+            if not in_flight:
+                continue
+            time.sleep(self.poll_interval)
+            still_in_flight: deque[PipelinedTx[T]] = deque()
+            for pipelined_tx in in_flight:
+                pipelined_tx.receipt = self._get_receipt(pipelined_tx)
+                if pipelined_tx.receipt:
+                    if not pipelined_tx.succeeded:
+                        pipelined_tx.error = "Transaction reverted"
+                    update(pipelined_tx)
+                else:
+                    still_in_flight.append(pipelined_tx)
+            in_flight = still_in_flight
+
+            # Oldest transaction blocks the next ones
+            if (
+                in_flight
+                and time.monotonic() - in_flight[0].sent_at > self.stuck_timeout
+            ):
+                oldest = in_flight.popleft()
+                self._replace(oldest)
+                if oldest.error:
+                    for future in oldest.receipt_futures:
+                        self.receipt_tracker.untrack(future)
+                    update(oldest)
+                    give_up(
+                        [*in_flight, *to_send], "Previous transaction was not mined"
+                    )
+                    in_flight.clear()
+                    to_send.clear()
+                else:
+                    update(oldest)
+                    in_flight.appendleft(oldest)
+        return pipelined_txs
+
+
+class SafeTxPipeline(TxPipeline[SafeTx]):
+    def __init__(
+        self,
+        ethereum_client: EthereumClient,
+        sender: ChecksumAddress,
+        send_safe_tx: SendSafeTx,
+        poll_interval: float = PIPELINE_POLL_INTERVAL,
+        stuck_timeout: float = PIPELINE_STUCK_TIMEOUT,
+        max_replacements: int = PIPELINE_MAX_REPLACEMENTS,
+        receipt_tracker: ReceiptTracker | None = None,
+    ):
+        """
+        :param ethereum_client:
+        :param sender: Account sending the transactions
+        :param send_safe_tx: Sends a `SafeTx` with the provided gas, gas price and
+            sender nonce, e.g. using `SafeTx.execute`
+        :param poll_interval: Seconds between receipt polls
+        :param stuck_timeout: Seconds to wait before replacing a transaction not mined
+        :param max_replacements: Replacements of a transaction before giving up
+        :param receipt_tracker: Tracker to wait for the receipts. A new one polling
+            every `poll_interval` is used if not provided
+        """
+        super().__init__(
+            ethereum_client,
+            sender,
+            poll_interval=poll_interval,
+            stuck_timeout=stuck_timeout,
+            max_replacements=max_replacements,
+            receipt_tracker=receipt_tracker,
+        )
+        self.send_safe_tx = send_safe_tx
+
+    def _broadcast(self, pipelined_tx: PipelinedSafeTx) -> HexBytes:
+        pipelined_tx.safe_tx.signatures = pipelined_tx.signatures
+        return self.send_safe_tx(
+            pipelined_tx.safe_tx,
+            pipelined_tx.gas,
+            pipelined_tx.gas_price,
+            pipelined_tx.nonce,
+        )
+
+    def execute(
+        self,
+        safe_txs: Sequence[SafeTx],
+        on_update: Callable[[PipelinedSafeTx], None] | None = None,
+    ) -> list[PipelinedSafeTx]:
+        """
+        Broadcast all the transactions in order with consecutive sender nonces and wait
+        for the receipts together. If a transaction cannot be sent the next ones are not
+        sent, as they would fail with an invalid Safe nonce
+
+        :param safe_txs: Signed Safe transactions, sorted by Safe nonce
+        :param on_update: Called when a transaction is sent, replaced or resolved
+        :return: Result of every transaction, in the same order as `safe_txs`
+        """
+        pipelined_txs = [
+            PipelinedSafeTx(
+                safe_tx,
+                estimate_safe_tx_gas(self.ethereum_client, self.sender, safe_tx),
+                signatures=safe_tx.signatures,
+            )
+            for safe_tx in safe_txs
+        ]
+        self.execute_pipelined_txs(pipelined_txs, on_update)
+        return pipelined_txs
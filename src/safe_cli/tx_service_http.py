@@ -0,0 +1,80 @@
+"""
+Requests to the Safe Transaction Service not covered by `TransactionServiceApi` methods.
+They are built only with its public attributes (`base_url`, `api_key`, `http_session`
+and `request_timeout`), so a safe-eth-py upgrade changing its private helpers does not
+break them.
+"""
+
+from typing import Any
+
+import requests
+from eth_typing import HexStr
+from hexbytes import HexBytes
+from safe_eth.eth import EthereumClient
+from safe_eth.safe import SafeTx
+from safe_eth.safe.api import SafeAPIException, TransactionServiceApi
+from safe_eth.util.http import build_full_url
+from safe_eth.util.util import to_0x_hex_str
+
+
+def get_tx_service_headers(safe_tx_service: TransactionServiceApi) -> dict[str, str]:
+    """
+    :param safe_tx_service:
+    :return: Headers for a request, with the api key if configured
+    """
+    if safe_tx_service.api_key:
+        return {"Authorization": f"Bearer {safe_tx_service.api_key}"}
+    return {}
+
+
+def tx_service_get(
+    safe_tx_service: TransactionServiceApi, url: str
+) -> requests.Response:
+    """
+    :param safe_tx_service:
+    :param url: Path of the endpoint, or absolute url (e.g. `next` cursors of pages)
+    :return: Response, using the keep-alive session of `safe_tx_service`
+    """
+    return safe_tx_service.http_session.get(
+        build_full_url(safe_tx_service.base_url, url),
+        headers=get_tx_service_headers(safe_tx_service),
+        timeout=safe_tx_service.request_timeout,
+    )
+
+
+def build_safe_tx(
+    ethereum_client: EthereumClient | None,
+    chain_id: int,
+    safe_tx_hash: bytes | HexStr,
+    tx_raw: dict[str, Any],
+) -> SafeTx:
+    """
+    :param ethereum_client:
+    :param chain_id:
+    :param safe_tx_hash: Expected `safe-tx-hash` of the transaction
+    :param tx_raw: Multisig transaction as returned by the tx service
+    :return: SafeTx with the signatures of the confirmations
+    :raises: SafeAPIException if the transaction does not match `safe_tx_hash`
+    """
+    safe_tx = SafeTx(
+        ethereum_client,
+        tx_raw["safe"],
+        tx_raw["to"],
+        int(tx_raw["value"]),
+        HexBytes(tx_raw["data"]) if tx_raw["data"] else b"",
+        int(tx_raw["operation"]),
+        int(tx_raw["safeTxGas"]),
+        int(tx_raw["baseGas"]),
+        int(tx_raw["gasPrice"]),
+        tx_raw["gasToken"],
+        tx_raw["refundReceiver"],
+        signatures=TransactionServiceApi.parse_signatures(tx_raw) or b"",
+        safe_nonce=int(tx_raw["nonce"]),
+        chain_id=chain_id,
+    )
+    if safe_tx.safe_tx_hash != HexBytes(safe_tx_hash):
+        raise SafeAPIException(
+            f"API safe-tx-hash: {to_0x_hex_str(HexBytes(safe_tx_hash))} doesn't match "
+            f"the calculated safe-tx-hash: {to_0x_hex_str(safe_tx.safe_tx_hash)}"
+        )
+    return safe_tx
@@ -0,0 +1,532 @@
+"""
+Local SQLite mirror of the multisig transactions (with their confirmations), messages
+and delegates of a Safe on the Safe Transaction Service, so read commands are served
+locally, also offline or when the tx service is rate limiting.
+
+Transactions are synced incrementally using their `modified` timestamp: every sync
+only requests the transactions modified since the newest one stored. Messages and
+delegates are few, so they are replaced on every sync. Mirror is stored on the cache
+directory, next to the chain cache.
+
+Only read-only commands use the mirror, and it is synced again before reading if it is
+older than `TX_SERVICE_MIRROR_MAX_AGE`. Writes of the cli update or remove the affected
+rows, and expire the mirror so the next read syncs it.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import closing
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from eth_typing import ChecksumAddress
+from hexbytes import HexBytes
+from safe_eth.safe.api import SafeAPIException, TransactionServiceApi
+from safe_eth.util.util import to_0x_hex_str
+
+from .chain_cache import get_cache_dir
+from .tx_history import TX_HISTORY_PAGE_SIZE, iter_tx_service_results
+from .tx_service_http import tx_service_get
+
+TX_SERVICE_MIRROR_FILE_NAME = "tx_service_mirror.sqlite3"
+TX_SERVICE_MIRROR_SCHEMA_VERSION = 1
+TX_SERVICE_MIRROR_MAX_AGE = 60  # Seconds before reads sync the mirror again
+
+TX_SERVICE_MIRROR_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sync_state (
+    chain_id INTEGER NOT NULL,
+    safe_address TEXT NOT NULL,
+    synced_at REAL NOT NULL,
+    last_modified TEXT,
+    PRIMARY KEY (chain_id, safe_address)
+);
+CREATE TABLE IF NOT EXISTS multisig_transactions (
+    chain_id INTEGER NOT NULL,
+    safe_tx_hash TEXT NOT NULL,
+    safe_address TEXT NOT NULL,
+    nonce INTEGER NOT NULL,
+    modified TEXT NOT NULL,
+    executed INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (chain_id, safe_tx_hash)
+);
+CREATE INDEX IF NOT EXISTS multisig_transactions_safe_nonce
+    ON multisig_transactions (chain_id, safe_address, nonce);
+CREATE TABLE IF NOT EXISTS confirmations (
+    chain_id INTEGER NOT NULL,
+    safe_tx_hash TEXT NOT NULL,
+    owner TEXT NOT NULL,
+    signature TEXT,
+    signature_type TEXT,
+    submission_date TEXT,
+    PRIMARY KEY (chain_id, safe_tx_hash, owner)
+);
+CREATE TABLE IF NOT EXISTS messages (
+    chain_id INTEGER NOT NULL,
+    message_hash TEXT NOT NULL,
+    safe_address TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (chain_id, message_hash)
+);
+CREATE TABLE IF NOT EXISTS delegates (
+    chain_id INTEGER NOT NULL,
+    safe_address TEXT NOT NULL,
+    delegate TEXT NOT NULL,
+    delegator TEXT NOT NULL,
+    label TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (chain_id, safe_address, delegate, delegator)
+);
+"""
+
+
+@dataclass
+class TxServiceSyncResult:
+    transactions: int  # Transactions created or modified since the previous sync
+    messages: int
+    delegates: int
+
+
+class TxServiceMirror:
+    def __init__(self, path: Path):
+        """
+        :param path: SQLite database. It is created on the first sync
+        """
+        self.path = path
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self, create: bool = False) -> sqlite3.Connection | None:
+        """
+        :param create: Create the database if it does not exist
+        :return: Connection, or `None` if the database does not exist and `create`
+            is `False`, so reads do not create empty databases
+        """
+        if self._connection is None:
+            if not create and not self.path.exists():
+                return None
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.row_factory = sqlite3.Row
+            (user_version,) = connection.execute("PRAGMA user_version").fetchone()
+            if user_version != TX_SERVICE_MIRROR_SCHEMA_VERSION:
+                # Mirror can be rebuilt from the tx service, so old schemas are dropped
+                for (table,) in connection.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'table'"
+                ).fetchall():
+                    connection.execute(f"DROP TABLE {table}")
+                connection.execute(
+                    f"PRAGMA user_version = {TX_SERVICE_MIRROR_SCHEMA_VERSION}"
+                )
+            connection.executescript(TX_SERVICE_MIRROR_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def get_synced_at(
+        self, chain_id: int, safe_address: ChecksumAddress
+    ) -> float | None:
+        """
+        :return: Timestamp of the last sync of the Safe, `None` if it was never
+            completely synced. Expired mirrors return a timestamp older than any
+            `TX_SERVICE_MIRROR_MAX_AGE`
+        """
+        if not (connection := self._connect()):
+            return None
+        row = connection.execute(
+            "SELECT synced_at FROM sync_state WHERE chain_id = ? AND safe_address = ?",
+            (chain_id, safe_address),
+        ).fetchone()
+        return (row["synced_at"] or None) if row else None
+
+    def _store_multisig_transaction(
+        self,
+        connection: sqlite3.Connection,
+        chain_id: int,
+        safe_address: ChecksumAddress,
+        tx: dict[str, Any],
+    ) -> None:
+        connection.execute(
+            "INSERT OR REPLACE INTO multisig_transactions "
+            "(chain_id, safe_tx_hash, safe_address, nonce, modified, executed, data) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                chain_id,
+                tx["safeTxHash"].lower(),
+                safe_address,
+                int(tx["nonce"]),
+                tx["modified"],
+                bool(tx.get("transactionHash")),
+                json.dumps(tx),
+            ),
+        )
+        connection.execute(
+            "DELETE FROM confirmations WHERE chain_id = ? AND safe_tx_hash = ?",
+            (chain_id, tx["safeTxHash"].lower()),
+        )
+        connection.executemany(
+            "INSERT OR REPLACE INTO confirmations (chain_id, safe_tx_hash, owner, "
+            "signature, signature_type, submission_date) VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    chain_id,
+                    tx["safeTxHash"].lower(),
+                    confirmation["owner"],
+                    confirmation.get("signature"),
+                    confirmation.get("signatureType"),
+                    confirmation.get("submissionDate"),
+                )
+                for confirmation in tx.get("confirmations") or []
+            ],
+        )
+
+    def sync(
+        self,
+        safe_tx_service: TransactionServiceApi,
+        safe_address: ChecksumAddress,
+        page_size: int = TX_HISTORY_PAGE_SIZE,
+    ) -> TxServiceSyncResult:
+        """
+        Retrieve the changes since the last sync. Every transaction is committed when
+        stored, so an interrupted sync continues from the last one stored
+
+        :param safe_tx_service:
+        :param safe_address:
+        :param page_size: Items requested on every page
+        :return: Number of items retrieved
+        :raises: SafeAPIException
+        """
+        chain_id = safe_tx_service.network.value
+        with self._lock:
+            connection = self._connect(create=True)
+            row = connection.execute(
+                "SELECT last_modified FROM sync_state "
+                "WHERE chain_id = ? AND safe_address = ?",
+                (chain_id, safe_address),
+            ).fetchone()
+            last_modified = row["last_modified"] if row else None
+
+            query: dict[str, Any] = {"ordering": "modified", "limit": page_size}
+            if last_modified:
+                # Transactions modified on the same timestamp could be missing
+                query["modified__gte"] = last_modified
+            transactions = 0
+            for tx in iter_tx_service_results(
+                safe_tx_service,
+                f"/api/v2/safes/{safe_address}/multisig-transactions/",
+                query,
+            ):
+                with connection:
+                    self._store_multisig_transaction(
+                        connection, chain_id, safe_address, tx
+                    )
+                    last_modified = max(last_modified or "", tx["modified"])
+                    connection.execute(
+                        "INSERT INTO sync_state "
+                        "(chain_id, safe_address, synced_at, last_modified) "
+                        "VALUES (?, ?, ?, ?) ON CONFLICT (chain_id, safe_address) "
+                        "DO UPDATE SET last_modified = excluded.last_modified",
+                        (chain_id, safe_address, 0, last_modified),
+                    )
+                transactions += 1
+
+            messages = list(
+                iter_tx_service_results(
+                    safe_tx_service,
+                    f"/api/v1/safes/{safe_address}/messages/",
+                    {"limit": page_size},
+                )
+            )
+            delegates = list(
+                iter_tx_service_results(
+                    safe_tx_service,
+                    "/api/v2/delegates/",
+                    {"safe": safe_address, "limit": page_size},
+                )
+            )
+            with connection:
+                connection.execute(
+                    "DELETE FROM messages WHERE chain_id = ? AND safe_address = ?",
+                    (chain_id, safe_address),
+                )
+                connection.executemany(
+                    "INSERT OR REPLACE INTO messages "
+                    "(chain_id, message_hash, safe_address, data) VALUES (?, ?, ?, ?)",
+                    [
+                        (
+                            chain_id,
+                            message["messageHash"].lower(),
+                            safe_address,
+                            json.dumps(message),
+                        )
+                        for message in messages
+                    ],
+                )
+                connection.execute(
+                    "DELETE FROM delegates WHERE chain_id = ? AND safe_address = ?",
+                    (chain_id, safe_address),
+                )
+                connection.executemany(
+                    "INSERT OR REPLACE INTO delegates (chain_id, safe_address, "
+                    "delegate, delegator, label, data) VALUES (?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            chain_id,
+                            safe_address,
+                            delegate["delegate"],
+                            delegate["delegator"],
+                            delegate.get("label"),
+                            json.dumps(delegate),
+                        )
+                        for delegate in delegates
+                    ],
+                )
+                connection.execute(
+                    "INSERT INTO sync_state "
+                    "(chain_id, safe_address, synced_at, last_modified) "
+                    "VALUES (?, ?, ?, ?) ON CONFLICT (chain_id, safe_address) "
+                    "DO UPDATE SET synced_at = excluded.synced_at",
+                    (chain_id, safe_address, time.time(), last_modified),
+                )
+        return TxServiceSyncResult(transactions, len(messages), len(delegates))
+
+    def iter_multisig_transactions(
+        self,
+        chain_id: int,
+        safe_address: ChecksumAddress,
+        since_nonce: int | None = None,
+        limit: int | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        :return: Transactions of the Safe in the same order as the tx service (newest
+            nonce first), read from the database while the iterator is consumed
+        """
+        if not (connection := self._connect()):
+            return
+        with closing(
+            connection.execute(
+                "SELECT data FROM multisig_transactions "
+                "WHERE chain_id = ? AND safe_address = ? AND nonce >= ? "
+                "ORDER BY nonce DESC, modified DESC LIMIT ?",
+                (
+                    chain_id,
+                    safe_address,
+                    since_nonce if since_nonce is not None else 0,
+                    limit if limit is not None else -1,
+                ),
+            )
+        ) as cursor:
+            for row in cursor:
+                yield json.loads(row["data"])
+
+    def get_multisig_transactions(
+        self, chain_id: int, safe_tx_hashes: Sequence[bytes | str]
+    ) -> dict[HexBytes, dict[str, Any]]:
+        """
+        :return: Stored transactions by `safe-tx-hash`. Missing ones are not included
+        """
+        if not (connection := self._connect()) or not safe_tx_hashes:
+            return {}
+        keys = [
+            to_0x_hex_str(HexBytes(safe_tx_hash)) for safe_tx_hash in safe_tx_hashes
+        ]
+        rows = connection.execute(
+            "SELECT safe_tx_hash, data FROM multisig_transactions WHERE chain_id = ? "
+            f"AND safe_tx_hash IN ({', '.join('?' * len(keys))})",
+            (chain_id, *keys),
+        ).fetchall()
+        return {HexBytes(row["safe_tx_hash"]): json.loads(row["data"]) for row in rows}
+
+    def get_confirmations(
+        self, chain_id: int, safe_tx_hash: bytes | str
+    ) -> list[dict[str, Any]]:
+        if not (connection := self._connect()):
+            return []
+        return [
+            dict(row)
+            for row in connection.execute(
+                "SELECT owner, signature, signature_type, submission_date "
+                "FROM confirmations WHERE chain_id = ? AND safe_tx_hash = ? "
+                "ORDER BY submission_date",
+                (chain_id, to_0x_hex_str(HexBytes(safe_tx_hash))),
+            )
+        ]
+
+    def get_message(
+        self, chain_id: int, message_hash: bytes | str
+    ) -> dict[str, Any] | None:
+        if not (connection := self._connect()):
+            return None
+        row = connection.execute(
+            "SELECT data FROM messages WHERE chain_id = ? AND message_hash = ?",
+            (chain_id, to_0x_hex_str(HexBytes(message_hash))),
+        ).fetchone()
+        return json.loads(row["data"]) if row else None
+
+    def get_delegates(
+        self, chain_id: int, safe_address: ChecksumAddress
+    ) -> list[dict[str, Any]]:
+        if not (connection := self._connect()):
+            return []
+        return [
+            json.loads(row["data"])
+            for row in connection.execute(
+                "SELECT data FROM delegates WHERE chain_id = ? AND safe_address = ?",
+                (chain_id, safe_address),
+            )
+        ]
+
+    def refresh_multisig_transaction(
+        self,
+        safe_tx_service: TransactionServiceApi,
+        safe_address: ChecksumAddress,
+        safe_tx_hash: bytes | str,
+    ) -> None:
+        """
+        Retrieve again a transaction modified by the cli, like when posting signatures.
+        Nothing is done if the Safe was never synced
+
+        :raises: SafeAPIException
+        """
+        chain_id = safe_tx_service.network.value
+        if not self.get_synced_at(chain_id, safe_address):
+            return
+        connection = self._connect()
+        key = to_0x_hex_str(HexBytes(safe_tx_hash))
+        response = tx_service_get(
+            safe_tx_service, f"/api/v2/multisig-transactions/{key}/"
+        )
+        if not response.ok:
+            raise SafeAPIException(
+                f"Cannot get transaction with safe-tx-hash={key}: {response.content!r}"
+            )
+        with self._lock, connection:
+            self._store_multisig_transaction(
+                connection, chain_id, safe_address, response.json()
+            )
+
+    def delete_multisig_transaction(
+        self, chain_id: int, safe_tx_hash: bytes | str
+    ) -> None:
+        """
+        Remove a transaction deleted from the tx service, as incremental syncs cannot
+        detect deletions, or changed on chain and not indexed yet by the tx service
+        """
+        if not (connection := self._connect()):
+            return
+        key = to_0x_hex_str(HexBytes(safe_tx_hash))
+        with self._lock, connection:
+            for table in ("multisig_transactions", "confirmations"):
+                connection.execute(
+                    f"DELETE FROM {table} WHERE chain_id = ? AND safe_tx_hash = ?",
+                    (chain_id, key),
+                )
+
+    def delete_message(self, chain_id: int, message_hash: bytes | str) -> None:
+        if not (connection := self._connect()):
+            return
+        with self._lock, connection:
+            connection.execute(
+                "DELETE FROM messages WHERE chain_id = ? AND message_hash = ?",
+                (chain_id, to_0x_hex_str(HexBytes(message_hash))),
+            )
+
+    def store_delegate(
+        self, chain_id: int, safe_address: ChecksumAddress, delegate: dict[str, Any]
+    ) -> None:
+        if not (connection := self._connect()):
+            return
+        with self._lock, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO delegates (chain_id, safe_address, "
+                "delegate, delegator, label, data) VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    chain_id,
+                    safe_address,
+                    delegate["delegate"],
+                    delegate["delegator"],
+                    delegate.get("label"),
+                    json.dumps(delegate),
+                ),
+            )
+
+    def delete_delegate(
+        self,
+        chain_id: int,
+        safe_address: ChecksumAddress,
+        delegate: ChecksumAddress,
+        delegator: ChecksumAddress,
+    ) -> None:
+        if not (connection := self._connect()):
+            return
+        with self._lock, connection:
+            connection.execute(
+                "DELETE FROM delegates WHERE chain_id = ? AND safe_address = ? "
+                "AND delegate = ? AND delegator = ?",
+                (chain_id, safe_address, delegate, delegator),
+            )
+
+    def expire(self, chain_id: int, safe_address: ChecksumAddress) -> None:
+        """
+        Keep the Safe as synced, but sync it again before the next read, as the
+        cli changed it on the tx service
+        """
+        if not (connection := self._connect()):
+            return
+        with self._lock, connection:
+            connection.execute(
+                "UPDATE sync_state SET synced_at = MIN(synced_at, 1) "
+                "WHERE chain_id = ? AND safe_address = ? AND synced_at > 0",
+                (chain_id, safe_address),
+            )
+
+    def invalidate(
+        self,
+        chain_id: int | None = None,
+        safe_address: ChecksumAddress | None = None,
+    ) -> None:
+        """
+        Remove everything stored, next sync retrieves it again
+
+        :param chain_id: Only remove the Safes for this chain. If not provided, the
+            whole mirror is removed
+        :param safe_address: Only remove this Safe
+        """
+        if not (connection := self._connect()):
+            return
+        conditions = []
+        parameters: list[Any] = []
+        if chain_id is not None:
+            conditions.append("chain_id = ?")
+            parameters.append(chain_id)
+        if safe_address is not None:
+            conditions.append("safe_address = ?")
+            parameters.append(safe_address)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        with self._lock, connection:
+            connection.execute(
+                "DELETE FROM confirmations WHERE (chain_id, safe_tx_hash) IN "
+                f"(SELECT chain_id, safe_tx_hash FROM multisig_transactions{where})",
+                parameters,
+            )
+            for table in (
+                "multisig_transactions",
+                "messages",
+                "delegates",
+                "sync_state",
+            ):
+                connection.execute(f"DELETE FROM {table}{where}", parameters)
+
+
+@cache
+def get_tx_service_mirror() -> TxServiceMirror:
+    return TxServiceMirror(get_cache_dir() / TX_SERVICE_MIRROR_FILE_NAME)
@@ -1,9 +1,117 @@
 import os
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
 
 from eth_typing import ChecksumAddress
 from prompt_toolkit import HTML, print_formatted_text
+from requests import RequestException
 from safe_eth.eth import EthereumClient
+from safe_eth.eth.ethereum_client import ERC20_721_TRANSFER_TOPIC
 from safe_eth.safe.api import TransactionServiceApi
+from web3.exceptions import Web3Exception, Web3RPCError
+
+T = TypeVar("T")
+
+
+LOG_SCAN_BLOCK_STEP = 500_000  # Initial window for every `eth_getLogs`
+LOG_SCAN_MAX_BLOCK_STEP = 10_000_000
+LOG_SCAN_MAX_WORKERS = 4
+
+
+def _scan_partition(
+    fetch_logs: Callable[[int, int], list[T]],
+    from_block: int,
+    to_block: int,
+    block_step: int,
+    max_block_step: int,
+) -> list[T]:
+    results = []
+    block = from_block
+    while block <= to_block:
+        window_to_block = min(block + block_step - 1, to_block)
+        try:
+            logs = fetch_logs(block, window_to_block)
+        except (Web3RPCError, ValueError):
+            # Too many results or range too big for the node, try a smaller window.
+            # Connection errors are raised, a smaller window would not fix them
+            if block_step == 1:
+                raise
+            block_step = max(block_step // 2, 1)
+            continue
+        results.extend(logs)
+        block = window_to_block + 1
+        if not logs:
+            block_step = min(block_step * 2, max_block_step)
+    return results
+
+
+def scan_block_range(
+    fetch_logs: Callable[[int, int], list[T]],
+    from_block: int,
+    to_block: int,
+    block_step: int = LOG_SCAN_BLOCK_STEP,
+    max_block_step: int = LOG_SCAN_MAX_BLOCK_STEP,
+    max_workers: int = LOG_SCAN_MAX_WORKERS,
+) -> list[T]:
+    """
+    Retrieve logs for a block range with adaptive windows. Window is halved when the
+    node rejects a request (too many results, range too big...) and doubled when a
+    window has no logs. Range is split in `max_workers` partitions scanned concurrently.
+    Connection errors are raised without retrying
+
+    :param fetch_logs: Function returning the logs between two blocks (both included)
+    :param from_block:
+    :param to_block:
+    :param block_step: Initial number of blocks for every request
+    :param max_block_step: Maximum number of blocks for every request
+    :param max_workers: Maximum number of concurrent requests
+    :return: Logs of every partition, in block order
+    :raises Web3RPCError: If node rejects a request for a single block
+    :raises RequestException: If node cannot be reached
+    """
+    number_blocks = to_block - from_block + 1
+    if number_blocks <= 0:
+        return []
+    number_partitions = max(min(max_workers, number_blocks // block_step), 1)
+    partition_size = -(-number_blocks // number_partitions)  # Ceil division
+    partitions = [
+        (start, min(start + partition_size - 1, to_block))
+        for start in range(from_block, to_block + 1, partition_size)
+    ]
+    with ThreadPoolExecutor(max_workers=number_partitions) as executor:
+        partition_results = executor.map(
+            lambda partition: _scan_partition(
+                fetch_logs, *partition, block_step, max_block_step
+            ),
+            partitions,
+        )
+        return [log for logs in partition_results for log in logs]
+
+
+def get_deployment_block(
+    ethereum_client: EthereumClient, address: ChecksumAddress, to_block: int
+) -> int:
+    """
+    Binary search the first block with code for the `address`. Requires an archive node
+
+    :param ethereum_client:
+    :param address:
+    :param to_block: A block where the contract is deployed
+    :return: Deployment block of the contract. `0` if it cannot be found, e.g. if the
+        node does not keep the state of old blocks
+    """
+    low, high = 0, to_block
+    try:
+        while low < high:
+            middle = (low + high) // 2
+            if ethereum_client.w3.eth.get_code(address, block_identifier=middle):
+                high = middle
+            else:
+                low = middle + 1
+    except (Web3Exception, ValueError, RequestException):
+        return 0
+    return low
 
 
 def get_erc_20_list(
@@ -11,27 +119,66 @@ def get_erc_20_list(
     safe_address: str,
     from_block: int,
     to_block: int,
-    block_step: int = 500000,
-) -> list:
+    block_step: int = LOG_SCAN_BLOCK_STEP,
+    max_workers: int = LOG_SCAN_MAX_WORKERS,
+) -> set[ChecksumAddress]:
     """
 
     :param ethereum_client:
     :param safe_address:
     :param from_block:
     :param to_block:
-    :param block_step: is the number of blocks retrieved for each get until get all blocks between from_block until to_block
-    :return: a list of address of ERC20 tokens related with the safe_address
+    :param block_step: is the initial number of blocks retrieved for each get, it is adapted
+        to the density of events. Check `scan_block_range`
+    :param max_workers: maximum number of concurrent requests
+    :return: a set of address of ERC20 tokens related with the safe_address
     """
-    addresses = set()
-    for i in range(from_block, to_block + 1, block_step):
-        events = ethereum_client.erc20.get_total_transfer_history(
-            from_block=i, to_block=i + (block_step - 1), addresses=[safe_address]
-        )
-        for event in events:
-            if "value" in event["args"]:
-                addresses.add(event["address"])
+    events = scan_block_range(
+        lambda window_from_block, window_to_block: (
+            ethereum_client.erc20.get_total_transfer_history(
+                from_block=window_from_block,
+                to_block=window_to_block,
+                addresses=[safe_address],
+            )
+        ),
+        from_block,
+        to_block,
+        block_step=block_step,
+        max_workers=max_workers,
+    )
+    return {event["address"] for event in events if "value" in event["args"]}
+
+
+def get_erc_20_received_list(
+    ethereum_client: EthereumClient,
+    address: ChecksumAddress,
+    from_block: int,
+    to_block: int,
+) -> set[ChecksumAddress]:
+    """
+    Only `Transfer` logs to the `address` are requested, e.g. for the blocks before a
+    counterfactual Safe was deployed, when it could only receive tokens
 
-    return addresses
+    :param ethereum_client:
+    :param address:
+    :param from_block:
+    :param to_block:
+    :return: a set of address of ERC20 tokens sent to the `address`
+    """
+    to_topic = "0x" + address[2:].lower().rjust(64, "0")
+    logs = scan_block_range(
+        lambda window_from_block, window_to_block: ethereum_client.w3.eth.get_logs(
+            {
+                "fromBlock": window_from_block,
+                "toBlock": window_to_block,
+                "topics": [ERC20_721_TRANSFER_TOPIC, None, to_topic],
+            }
+        ),
+        from_block,
+        to_block,
+    )
+    # ERC721 `Transfer` has the same topic, but the token id is indexed too
+    return {log["address"] for log in logs if len(log["topics"]) == 3}
 
 
 def get_input(*args, **kwargs):
@@ -0,0 +1,61 @@
+from eth_account import Account
+from eth_account.messages import encode_defunct
+from eth_keys import keys
+from eth_typing import ChecksumAddress
+from eth_utils import keccak
+from safe_eth.safe.signatures import signature_to_bytes
+from web3.types import TxParams
+
+from safe_cli.ethereum_hd_wallet import EthereumHdWallet
+from safe_cli.operators.hw_wallets.hw_wallet import HwWallet
+
+FAKE_HW_WALLET_WORDS = (
+    "loan satoshi action taste party limit cat elder powder dress link decline"
+)
+
+
+class FakeHwWallet(HwWallet):
+    """
+    Hardware wallet backed by a software seed. Every request that would reach the
+    device is counted on `device_calls`
+    """
+
+    hd_wallet = EthereumHdWallet(FAKE_HW_WALLET_WORDS)
+    device_calls = 0
+
+    def _get_private_key(self) -> keys.PrivateKey:
+        FakeHwWallet.device_calls += 1
+        return keys.PrivateKey(
+            self.hd_wallet.get_private_key(f"m/{self.derivation_path}")
+        )
+
+    def get_address(self) -> ChecksumAddress:
+        return self._get_private_key().public_key.to_checksum_address()
+
+    @staticmethod
+    def get_extended_public_key(derivation_path: str) -> tuple[keys.PublicKey, bytes]:
+        FakeHwWallet.device_calls += 1
+        private_key, chain_code = FakeHwWallet.hd_wallet.get_extended_key(
+            f"m/{derivation_path}"
+        )
+        return keys.PrivateKey(private_key).public_key, chain_code
+
+    def sign_typed_hash(self, domain_hash: bytes, message_hash: bytes) -> bytes:
+        signature = self._get_private_key().sign_msg_hash(
+            keccak(b"\x19\x01" + domain_hash + message_hash)
+        )
+        return signature_to_bytes(signature.v + 27, signature.r, signature.s)
+
+    def get_signed_raw_transaction(
+        self, tx_parameters: TxParams, chain_id: int
+    ) -> bytes:
+        return Account.sign_transaction(
+            {**tx_parameters, "chainId": chain_id}, self._get_private_key()
+        ).raw_transaction
+
+    def sign_message(self, message: bytes) -> bytes:
+        signed = Account.sign_message(
+            encode_defunct(primitive=message), self._get_private_key()
+        )
+        # V field must be greater than 30 for signed messages, like the devices
+        return signature_to_bytes(signed.v + 4, signed.r, signed.s)
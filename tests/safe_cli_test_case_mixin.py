@@ -1,7 +1,7 @@
 from unittest import mock
 
 from eth_account import Account
-from safe_eth.eth import EthereumClient, EthereumNetwork
+from safe_eth.eth import EthereumNetwork
 from safe_eth.safe.tests.safe_test_case import SafeTestCaseMixin
 from safe_eth.util.util import to_0x_hex_str
 
@@ -41,8 +41,9 @@ class SafeCliTestCaseMixin(SafeTestCaseMixin):
         if mode == SafeOperatorMode.BLOCKCHAIN:
             safe_operator = SafeOperator(safe.address, self.ethereum_node_url)
         else:
-            with mock.patch.object(
-                EthereumClient, "get_network", return_value=EthereumNetwork.SEPOLIA
+            with mock.patch(
+                "safe_cli.operators.safe_operator.get_network",
+                return_value=EthereumNetwork.SEPOLIA,
             ):
                 safe_operator = SafeTxServiceOperator(
                     safe.address, self.ethereum_node_url
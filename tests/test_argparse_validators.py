@@ -7,9 +7,11 @@ from safe_eth.util.util import to_0x_hex_str
 
 from safe_cli.argparse_validators import (
     check_ethereum_address,
+    check_hex_pattern,
     check_hex_str,
     check_keccak256_hash,
     check_private_key,
+    check_regex,
 )
 from safe_cli.safe_creator import check_positive_integer
 
@@ -67,6 +69,21 @@ class TestArgparseValidators(SafeCliTestCaseMixin, unittest.TestCase):
         ):
             check_keccak256_hash("0x12x")
 
+    def test_check_hex_pattern(self):
+        self.assertEqual(check_hex_pattern("0xC0ffe"), "c0ffe")
+        self.assertEqual(check_hex_pattern("dead"), "dead")
+
+        with self.assertRaises(argparse.ArgumentTypeError):
+            check_hex_pattern("0xcafeg")
+        with self.assertRaises(argparse.ArgumentTypeError):
+            check_hex_pattern("a" * 41)
+
+    def test_check_regex(self):
+        self.assertEqual(check_regex("^c0+ffee"), "^c0+ffee")
+
+        with self.assertRaises(argparse.ArgumentTypeError):
+            check_regex("[c0ffee")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,137 @@
+import unittest
+from unittest import mock
+from unittest.mock import AsyncMock
+
+from eth_account import Account
+from hexbytes import HexBytes
+from safe_eth.eth import EthereumNetwork
+from safe_eth.eth.clients import EtherscanClientV2
+from safe_eth.safe import SafeTx
+from safe_eth.safe.api import SafeAPIException
+from safe_eth.util.util import to_0x_hex_str
+from web3 import Web3
+
+from safe_cli.async_tx_service import AsyncTransactionServiceApi
+from safe_cli.operators import (
+    AsyncSafeOperator,
+    AsyncSafeTxServiceOperator,
+    SafeOperator,
+)
+
+from .mocks.multisig_tx_mock import GetMultisigTxRequestMock
+from .safe_cli_test_case_mixin import SafeCliTestCaseMixin
+
+
+class TestAsyncSafeOperator(SafeCliTestCaseMixin, unittest.TestCase):
+    def test_get_safe_cli_info(self):
+        safe = self.deploy_test_safe_v1_4_1(owners=[self.ethereum_test_account.address])
+        self.send_ether(safe.address, 5)
+        safe_operator = AsyncSafeOperator(safe.address, self.ethereum_node_url)
+        self.addCleanup(safe_operator.close)
+
+        self.assertEqual(
+            safe_operator.get_safe_cli_info(),
+            SafeOperator(safe.address, self.ethereum_node_url).get_safe_cli_info(),
+        )
+        block_number = self.ethereum_client.current_block_number
+        self.send_ether(safe.address, 5)
+        self.assertEqual(
+            safe_operator.get_safe_cli_info(block_number).balance_ether,
+            Web3.from_wei(5, "ether"),
+        )
+        self.assertEqual(
+            safe_operator.get_safe_cli_info().balance_ether, Web3.from_wei(10, "ether")
+        )
+
+        # Not a Safe, falls back to the regular path
+        with mock.patch.object(
+            SafeOperator, "get_safe_cli_info", return_value=None
+        ) as get_safe_cli_info_mock:
+            safe_operator.address = Account.create().address
+            self.assertIsNone(safe_operator.get_safe_cli_info())
+            get_safe_cli_info_mock.assert_called_once()
+
+    def test_close(self):
+        safe = self.deploy_test_safe_v1_4_1(owners=[self.ethereum_test_account.address])
+        with mock.patch("safe_cli.operators.async_safe_operator.atexit") as atexit_mock:
+            safe_operator = AsyncSafeOperator(safe.address, self.ethereum_node_url)
+            atexit_mock.register.assert_called_once_with(safe_operator.close)
+            safe_operator.close()
+            atexit_mock.unregister.assert_called_once_with(safe_operator.close)
+        self.assertTrue(safe_operator._loop.is_closed())
+        safe_operator.close()  # Closing again does nothing
+
+    def test_load_cli_owners(self):
+        safe = self.deploy_test_safe_v1_4_1(owners=[self.ethereum_test_account.address])
+        safe_operator = AsyncSafeOperator(safe.address, self.ethereum_node_url)
+        self.addCleanup(safe_operator.close)
+        empty_account = Account.create()
+        safe_operator.load_cli_owners(
+            [
+                to_0x_hex_str(empty_account.key),
+                to_0x_hex_str(self.ethereum_test_account.key),
+            ]
+        )
+        self.assertEqual(
+            {account.address for account in safe_operator.accounts},
+            {empty_account.address, self.ethereum_test_account.address},
+        )
+        # Only accounts with balance are set as default sender
+        self.assertEqual(
+            safe_operator.default_sender.address, self.ethereum_test_account.address
+        )
+        with mock.patch.object(
+            EtherscanClientV2, "is_supported_network", return_value=False
+        ):
+            safe_operator.print_info()
+        self.assertIsNotNone(safe_operator._safe_cli_info)
+
+
+class TestAsyncSafeTxServiceOperator(SafeCliTestCaseMixin, unittest.TestCase):
+    @mock.patch.object(
+        SafeTx, "safe_version", return_value="1.4.1", new_callable=mock.PropertyMock
+    )
+    def test_get_safe_transactions(self, safe_version_mock: mock.PropertyMock):
+        safe = self.deploy_test_safe_v1_4_1(owners=[self.ethereum_test_account.address])
+        with mock.patch(
+            "safe_cli.operators.safe_operator.get_network",
+            return_value=EthereumNetwork.SEPOLIA,
+        ):
+            safe_operator = AsyncSafeTxServiceOperator(
+                safe.address, self.ethereum_node_url
+            )
+        self.addCleanup(safe_operator.close)
+        safe_tx_hash = HexBytes(
+            "0xae1c18dd9fca652b83743fc0b0ac2d396c68d523b49f4d41af5b00dc2f995bf6"
+        )
+
+        with mock.patch.object(
+            AsyncTransactionServiceApi,
+            "_get_request",
+            new_callable=AsyncMock,
+            return_value=(200, GetMultisigTxRequestMock(executed=True).json()),
+        ) as get_request_mock:
+            safe_txs = safe_operator.get_safe_transactions([safe_tx_hash] * 3)
+        self.assertEqual(get_request_mock.await_count, 3)
+        self.assertEqual(len(safe_txs), 3)
+        for safe_tx, tx_hash in safe_txs:
+            self.assertEqual(safe_tx.safe_tx_hash, safe_tx_hash)
+            self.assertEqual(
+                tx_hash,
+                HexBytes(
+                    "0x7d229cdd1a197acdd23787cedcb7ec4d746ce0e730dff75e209359894af7fb52"
+                ),
+            )
+
+        with mock.patch.object(
+            AsyncTransactionServiceApi,
+            "_get_request",
+            new_callable=AsyncMock,
+            return_value=(404, {"detail": "Not found."}),
+        ):
+            with self.assertRaisesRegex(SafeAPIException, "Not found"):
+                safe_operator.get_safe_transactions([safe_tx_hash])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from eth_account import Account
+from safe_eth.eth import EthereumClient, EthereumNetwork
+
+from safe_cli import chain_cache
+from safe_cli.chain_cache import (
+    CACHE_VERSION,
+    ChainCache,
+    get_cache_dir,
+    get_chain_cache,
+    get_chain_id,
+    get_master_copy_version,
+    get_network,
+    get_proxy_creation_code,
+)
+from safe_cli.main import invalidate_cache
+from safe_cli.rpc_batch import batch_rpc_request
+from safe_cli.safe_addresses import _get_valid_contract
+
+from .safe_cli_test_case_mixin import SafeCliTestCaseMixin
+
+
+class TestChainCache(SafeCliTestCaseMixin, unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.environ_patch = mock.patch.dict(
+            os.environ, {"SAFE_CLI_CACHE_DIR": self.cache_dir.name}
+        )
+        self.environ_patch.start()
+        get_chain_cache.cache_clear()
+
+    def tearDown(self) -> None:
+        super().tearDown()
+        get_chain_cache.cache_clear()
+        self.environ_patch.stop()
+        self.cache_dir.cleanup()
+
+    def test_get_cache_dir(self):
+        self.assertEqual(get_cache_dir(), Path(self.cache_dir.name))
+        with mock.patch.dict(
+            os.environ, {"SAFE_CLI_CACHE_DIR": "", "XDG_CACHE_HOME": "/tmp/xdg"}
+        ):
+            self.assertEqual(get_cache_dir(), Path("/tmp/xdg/safe-cli"))
+
+    def test_chain_cache(self):
+        cache = get_chain_cache()
+        address = Account.create().address
+        self.assertIsNone(cache.get_address(1, "safe_contract"))
+        cache.set_address(1, "safe_contract", address)
+        cache.set_master_copy_version(1, address, "1.4.1")
+        cache.set_chain_id("https://rpc.gnosischain.com", 100)
+        self.assertEqual(cache.get_address(1, "safe_contract"), address)
+
+        # Persisted
+        cache = ChainCache(cache.path)
+        self.assertEqual(cache.get_address(1, "safe_contract"), address)
+        self.assertEqual(cache.get_master_copy_version(1, address), "1.4.1")
+        self.assertEqual(cache.get_chain_id("https://rpc.gnosischain.com"), 100)
+
+        # Development chains and local nodes are not cached
+        cache.set_address(1337, "safe_contract", address)
+        self.assertIsNone(cache.get_address(1337, "safe_contract"))
+        cache.set_chain_id("http://localhost:8545", 1)
+        self.assertIsNone(cache.get_chain_id("http://localhost:8545"))
+
+        cache.set_address(100, "safe_contract", address)
+        cache.invalidate(100)
+        self.assertIsNone(cache.get_address(100, "safe_contract"))
+        self.assertIsNone(cache.get_chain_id("https://rpc.gnosischain.com"))
+        self.assertEqual(cache.get_address(1, "safe_contract"), address)
+        cache.invalidate()
+        self.assertIsNone(ChainCache(cache.path).get_address(1, "safe_contract"))
+
+        # Cache from other versions is ignored
+        cache.set_address(1, "safe_contract", address)
+        with open(cache.path) as cache_file:
+            data = json.load(cache_file)
+        data["version"] = CACHE_VERSION + 1
+        with open(cache.path, "w") as cache_file:
+            json.dump(data, cache_file)
+        self.assertIsNone(ChainCache(cache.path).get_address(1, "safe_contract"))
+
+        # Invalid cache is ignored
+        with open(cache.path, "w") as cache_file:
+            cache_file.write("{invalid")
+        self.assertIsNone(ChainCache(cache.path).get_address(1, "safe_contract"))
+
+    @mock.patch.object(chain_cache, "NOT_CACHED_CHAIN_IDS", frozenset())
+    def test_get_valid_contract(self):
+        addresses = [Account.create().address, self.safe_contract_V1_4_1.address]
+        with mock.patch(
+            "safe_cli.rpc_batch.batch_rpc_request", wraps=batch_rpc_request
+        ) as batch_rpc_request_mock:
+            for _ in range(2):
+                self.assertEqual(
+                    _get_valid_contract(
+                        self.ethereum_client, addresses, cache_key="safe_contract"
+                    ),
+                    self.safe_contract_V1_4_1.address,
+                )
+            batch_rpc_request_mock.assert_called_once()
+
+        # Node is not queried if chain id is cached for the url
+        ethereum_client = EthereumClient("https://unreachable-node.invalid")
+        get_chain_cache().set_chain_id("https://unreachable-node.invalid", 100)
+        self.assertEqual(get_chain_id(ethereum_client), 100)
+        self.assertEqual(get_network(ethereum_client), EthereumNetwork.GNOSIS)
+
+        # Node urls can contain api keys, so they are not written to disk
+        node_url = "https://rpc.invalid/v1/secret-api-key"
+        get_chain_cache().set_chain_id(node_url, 100)
+        self.assertEqual(get_chain_cache().get_chain_id(node_url), 100)
+        self.assertNotIn("secret-api-key", get_chain_cache().path.read_text())
+
+    @mock.patch.object(chain_cache, "NOT_CACHED_CHAIN_IDS", frozenset())
+    def test_get_master_copy_version(self):
+        master_copy_address = self.safe_contract_V1_4_1.address
+        with mock.patch(
+            "safe_eth.safe.Safe.retrieve_version", return_value="1.4.1"
+        ) as retrieve_version_mock:
+            for _ in range(2):
+                self.assertEqual(
+                    get_master_copy_version(self.ethereum_client, master_copy_address),
+                    "1.4.1",
+                )
+            retrieve_version_mock.assert_called_once()
+
+    @mock.patch.object(chain_cache, "NOT_CACHED_CHAIN_IDS", frozenset())
+    def test_get_proxy_creation_code(self):
+        proxy_factory_address = self.proxy_factory.address
+        expected_code = self.proxy_factory.get_proxy_creation_code()
+        with mock.patch(
+            "safe_eth.safe.ProxyFactory.get_proxy_creation_code",
+            return_value=expected_code,
+        ) as get_proxy_creation_code_mock:
+            for _ in range(2):
+                self.assertEqual(
+                    get_proxy_creation_code(
+                        self.ethereum_client, proxy_factory_address
+                    ),
+                    expected_code,
+                )
+            get_proxy_creation_code_mock.assert_called_once()
+
+    def test_invalidate_cache_command(self):
+        address = Account.create().address
+        cache = get_chain_cache()
+        cache.set_address(1, "safe_contract", address)
+        cache.set_address(100, "safe_contract", address)
+
+        invalidate_cache(chain_id=100)
+        self.assertIsNone(cache.get_address(100, "safe_contract"))
+        self.assertEqual(cache.get_address(1, "safe_contract"), address)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import unittest
+
+from eth_account import Account
+from safe_eth.safe import Safe
+
+from safe_cli.create2 import (
+    SafeAddressPredictor,
+    VanityPattern,
+    calculate_create2_address,
+    get_proxy_init_code_hash,
+    get_proxy_salt,
+    search_vanity_addresses,
+)
+
+from .safe_cli_test_case_mixin import SafeCliTestCaseMixin
+
+
+class TestCreate2(SafeCliTestCaseMixin, unittest.TestCase):
+    def test_calculate_create2_address(self):
+        master_copy = self.safe_contract_V1_4_1.address
+        initializer = b"setup"
+        init_code_hash = get_proxy_init_code_hash(
+            self.proxy_factory.get_proxy_creation_code(), master_copy
+        )
+        for salt_nonce in (0, 4815, 2**256 - 1):
+            with self.subTest(salt_nonce=salt_nonce):
+                self.assertEqual(
+                    calculate_create2_address(
+                        self.proxy_factory.address,
+                        get_proxy_salt(initializer, salt_nonce),
+                        init_code_hash,
+                    ),
+                    self.proxy_factory.calculate_proxy_address(
+                        master_copy, initializer, salt_nonce
+                    ),
+                )
+
+    def test_safe_address_predictor(self):
+        owners = [Account.create().address for _ in range(3)]
+        predictor = SafeAddressPredictor(
+            self.proxy_factory.address,
+            self.proxy_factory.get_proxy_creation_code(),
+            self.safe_contract_V1_4_1.address,
+            self.compatibility_fallback_handler_V1_4_1.address,
+        )
+        expected_address = predictor.predict(owners, 2, 4815)
+        ethereum_tx_sent = self.proxy_factory.deploy_proxy_contract_with_nonce(
+            self.ethereum_test_account,
+            self.safe_contract_V1_4_1.address,
+            predictor.get_initializer(owners, 2),
+            4815,
+        )
+        self.assertEqual(ethereum_tx_sent.contract_address, expected_address)
+        safe_info = Safe(expected_address, self.ethereum_client).retrieve_all_info()
+        self.assertEqual(safe_info.owners, owners)
+        self.assertEqual(safe_info.threshold, 2)
+        self.assertEqual(
+            safe_info.fallback_handler,
+            self.compatibility_fallback_handler_V1_4_1.address,
+        )
+        self.assertNotEqual(predictor.predict(owners, 1, 4815), expected_address)
+        self.assertNotEqual(predictor.predict(owners, 2, 4816), expected_address)
+
+    def test_vanity_pattern(self):
+        address = "c0ffee254729296a45a3885639ac7e10f9d54979"
+        self.assertTrue(VanityPattern().get_matcher()(address))
+        self.assertTrue(VanityPattern("0xC0FFEE").get_matcher()(address))
+        self.assertTrue(VanityPattern("c0", "979").get_matcher()(address))
+        self.assertFalse(VanityPattern("c0", "978").get_matcher()(address))
+        self.assertTrue(VanityPattern(regex="^c0f+ee").get_matcher()(address))
+        self.assertFalse(VanityPattern(regex="^dead").get_matcher()(address))
+
+    def test_search_vanity_addresses(self):
+        deployer = Account.create().address
+        initializer = b"setup"
+        init_code_hash = bytes(32)
+        pattern = VanityPattern(prefix="0", regex="a$")
+        for max_workers in (1, 2):
+            with self.subTest(max_workers=max_workers):
+                matches = list(
+                    search_vanity_addresses(
+                        deployer,
+                        initializer,
+                        init_code_hash,
+                        pattern,
+                        start_salt_nonce=2**256 - 100,
+                        max_matches=3,
+                        max_workers=max_workers,
+                        chunk_size=1_000,
+                    )
+                )
+                self.assertEqual(len(matches), 3)
+                for address, salt_nonce in matches:
+                    self.assertEqual(
+                        calculate_create2_address(
+                            deployer,
+                            get_proxy_salt(initializer, salt_nonce),
+                            init_code_hash,
+                        ),
+                        address,
+                    )
+                    self.assertTrue(address.lower().startswith("0x0"))
+                    self.assertTrue(address.lower().endswith("a"))
+
+
+if __name__ == "__main__":
+    unittest.main()
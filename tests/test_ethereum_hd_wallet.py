@@ -1,8 +1,18 @@
 import unittest
+from unittest import mock
 
+from eth_account import Account
+from eth_account.hdaccount import seed_from_mnemonic
+from eth_keys import keys
 from eth_utils import ValidationError
 
-from safe_cli.ethereum_hd_wallet import get_account_from_words, get_address_from_words
+from safe_cli.ethereum_hd_wallet import (
+    EthereumHdWallet,
+    derive_public_child,
+    get_account_from_words,
+    get_address_from_words,
+    parse_hd_path,
+)
 
 
 class TestEthereumHdWallet(unittest.TestCase):
@@ -66,6 +76,114 @@ class TestEthereumHdWallet(unittest.TestCase):
                 get_address_from_words(words, index=index), expected[index]
             )
 
+    def test_ethereum_hd_wallet(self):
+        words = (
+            "loan satoshi action taste party limit cat elder powder dress link decline"
+        )
+        Account.enable_unaudited_hdwallet_features()
+        with mock.patch(
+            "safe_cli.ethereum_hd_wallet.seed_from_mnemonic",
+            wraps=seed_from_mnemonic,
+        ) as seed_from_mnemonic_mock:
+            hd_wallet = EthereumHdWallet(words)
+            for hd_path in (
+                "m/44'/60'/0'/0/0",
+                "m/44'/60'/0'/0/25",
+                "m/44'/60'/2'/0/0",  # Ledger Live
+                "m/44'/60'/0'/3",  # Legacy Ledger
+            ):
+                self.assertEqual(
+                    hd_wallet.get_account(hd_path).key,
+                    Account.from_mnemonic(words, account_path=hd_path).key,
+                )
+            seed_from_mnemonic_mock.assert_called_once()
+
+        with self.assertRaises(ValidationError):
+            EthereumHdWallet("loan satoshi action taste party limit")
+
+    def test_find_accounts(self):
+        words = (
+            "loan satoshi action taste party limit cat elder powder dress link decline"
+        )
+        hd_wallet = EthereumHdWallet(words)
+        owners = [
+            "0x38DF5615C090Ca80930986295B9bbFCc36a0Ae7B",  # Index 4
+            "0x09A512D5ecfF9492Cb0f50AFF853dFD8B4ec3EB1",  # Index 1
+        ]
+        with mock.patch.object(
+            hd_wallet, "get_private_key", wraps=hd_wallet.get_private_key
+        ) as get_private_key_mock:
+            accounts = hd_wallet.find_accounts(owners)
+            self.assertEqual([account.address for account in accounts], owners[::-1])
+            # Scan stops when every owner is found
+            self.assertEqual(get_private_key_mock.call_count, 5)
+
+        # Gap limit reached before index 4
+        self.assertEqual(
+            [account.address for account in hd_wallet.find_accounts(owners, 2)],
+            owners[1:],
+        )
+        self.assertEqual(
+            hd_wallet.find_accounts([Account.create().address], gap_limit=10), []
+        )
+
+    def test_discover_accounts(self):
+        words = (
+            "loan satoshi action taste party limit cat elder powder dress link decline"
+        )
+        Account.enable_unaudited_hdwallet_features()
+        paths = [
+            "m/44'/60'/0'/0/2",
+            "m/44'/60'/12'/0/0",  # Ledger Live
+            "m/44'/60'/0'/30",  # Legacy Ledger
+        ]
+        owners = [
+            Account.from_mnemonic(words, account_path=path).address for path in paths
+        ]
+        hd_wallet = EthereumHdWallet(words)
+        for max_workers in (1, 2):
+            with self.subTest(max_workers=max_workers):
+                discovered = hd_wallet.discover_accounts(
+                    owners[::-1] + [Account.create().address],
+                    indexes=range(40),
+                    max_workers=max_workers,
+                )
+                self.assertEqual([path for path, _ in discovered], paths)
+                self.assertEqual([account.address for _, account in discovered], owners)
+
+        self.assertEqual(
+            hd_wallet.discover_accounts(owners, indexes=range(10), max_workers=1),
+            [(paths[0], hd_wallet.get_account(paths[0]))],
+        )
+
+    def test_derive_public_child(self):
+        words = (
+            "loan satoshi action taste party limit cat elder powder dress link decline"
+        )
+        hd_wallet = EthereumHdWallet(words)
+        private_key, chain_code = hd_wallet.get_extended_key("m/44'/60'/0'/0")
+        public_key = keys.PrivateKey(private_key).public_key
+        for index in (0, 7):
+            child_public_key, _ = derive_public_child(public_key, chain_code, index)
+            self.assertEqual(
+                child_public_key.to_checksum_address(),
+                hd_wallet.get_account(f"m/44'/60'/0'/0/{index}").address,
+            )
+
+        with self.assertRaisesRegex(ValidationError, "hardened"):
+            derive_public_child(public_key, chain_code, 2**31)
+
+    def test_parse_hd_path(self):
+        self.assertEqual(parse_hd_path("m"), ())
+        self.assertEqual(
+            parse_hd_path("m/44'/60H/0'/0/7"),
+            (2**31 + 44, 2**31 + 60, 2**31, 0, 7),
+        )
+        for hd_path in ("", "44'/60'", "m/", "m/a", "m/-1", f"m/{2**31}", "m/1''"):
+            with self.subTest(hd_path=hd_path):
+                with self.assertRaises(ValidationError):
+                    parse_hd_path(hd_path)
+
 
 if __name__ == "__main__":
     unittest.main()
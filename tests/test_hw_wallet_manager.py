@@ -3,18 +3,23 @@ from unittest import mock
 from unittest.mock import MagicMock
 
 from eth_account import Account
+from eth_keys import keys
 from hexbytes import HexBytes
 from ledgerblue.Dongle import Dongle
 from ledgereth import SignedTransaction
 from safe_eth.safe import SafeTx
 from safe_eth.safe.tests.safe_test_case import SafeTestCaseMixin
 
+from safe_cli.ethereum_hd_wallet import EthereumHdWallet
 from safe_cli.operators.hw_wallets.hw_wallet_manager import (
     HwWalletManager,
     HwWalletType,
     get_hw_wallet_manager,
 )
 from safe_cli.operators.hw_wallets.ledger_wallet import LedgerWallet
+from safe_cli.operators.hw_wallets.trezor_wallet import TrezorWallet
+
+from .fake_hw_wallet import FAKE_HW_WALLET_WORDS, FakeHwWallet
 
 
 class Testledger_wallet(SafeTestCaseMixin, unittest.TestCase):
@@ -29,33 +34,125 @@ class Testledger_wallet(SafeTestCaseMixin, unittest.TestCase):
         other_hw_wallet_manager = get_hw_wallet_manager()
         self.assertEqual(other_hw_wallet_manager, hw_wallet_manager)
 
-    @mock.patch(
-        "safe_cli.operators.hw_wallets.ledger_wallet.init_dongle",
-        autospec=True,
-        return_value=Dongle(),
-    )
-    @mock.patch(
-        "safe_cli.operators.hw_wallets.ledger_wallet.LedgerWallet.get_address",
-        autospec=True,
-    )
-    def test_get_accounts(
-        self, mock_get_address: MagicMock, mock_init_dongle: MagicMock
+    def test_get_accounts(self):
+        hw_wallet_manager = HwWalletManager()
+        hw_wallet_manager.supported_hw_wallet_types[HwWalletType.LEDGER] = FakeHwWallet
+        hd_wallet = EthereumHdWallet(FAKE_HW_WALLET_WORDS)
+
+        for template_derivation_path, number_accounts, expected_device_calls in (
+            ("44'/60'/0'/0/{i}", 100, 1),
+            ("44'/60'/0'/{i}", 100, 1),
+            ("44'/60'/{i}'/0/0", 3, 3),  # Hardened index, one call per account
+        ):
+            with self.subTest(template_derivation_path=template_derivation_path):
+                FakeHwWallet.device_calls = 0
+                hw_wallets = hw_wallet_manager.get_accounts(
+                    HwWalletType.LEDGER,
+                    template_derivation_path,
+                    number_accounts=number_accounts,
+                )
+                self.assertEqual(FakeHwWallet.device_calls, expected_device_calls)
+                self.assertEqual(len(hw_wallets), number_accounts)
+                for i in (0, number_accounts - 1):
+                    derivation_path = template_derivation_path.format(i=i)
+                    self.assertEqual(
+                        hw_wallets[i],
+                        (
+                            hd_wallet.get_account(f"m/{derivation_path}").address,
+                            derivation_path,
+                        ),
+                    )
+
+    @mock.patch("safe_cli.operators.hw_wallets.ledger_wallet.init_dongle")
+    def test_ledger_get_extended_public_key(self, mock_init_dongle: MagicMock):
+        hd_wallet = EthereumHdWallet(FAKE_HW_WALLET_WORDS)
+        private_key, chain_code = hd_wallet.get_extended_key("m/44'/60'/0'")
+        public_key = keys.PrivateKey(private_key).public_key
+        address = public_key.to_checksum_address()[2:].encode()
+        mock_init_dongle.return_value.exchange.return_value = (
+            bytes([65])
+            + b"\x04"
+            + public_key.to_bytes()
+            + bytes([len(address)])
+            + address
+            + chain_code
+        )
+        self.assertEqual(
+            LedgerWallet.get_extended_public_key("44'/60'/0'"),
+            (public_key, chain_code),
+        )
+        # Chain code is requested
+        self.assertEqual(
+            mock_init_dongle.return_value.exchange.call_args.args[0][:4],
+            b"\xe0\x02\x00\x01",
+        )
+        mock_init_dongle.return_value.close.assert_called_once()
+
+    @mock.patch("safe_cli.operators.hw_wallets.trezor_wallet.get_trezor_client")
+    @mock.patch("safe_cli.operators.hw_wallets.trezor_wallet.get_public_node")
+    def test_trezor_get_extended_public_key(
+        self, mock_get_public_node: MagicMock, mock_get_trezor_client: MagicMock
     ):
+        hd_wallet = EthereumHdWallet(FAKE_HW_WALLET_WORDS)
+        private_key, chain_code = hd_wallet.get_extended_key("m/44'/60'/0'/0")
+        public_key = keys.PrivateKey(private_key).public_key
+        mock_get_public_node.return_value.node.public_key = (
+            public_key.to_compressed_bytes()
+        )
+        mock_get_public_node.return_value.node.chain_code = chain_code
+        self.assertEqual(
+            TrezorWallet.get_extended_public_key("44'/60'/0'/0"),
+            (public_key, chain_code),
+        )
+        self.assertEqual(
+            mock_get_public_node.call_args.args[1],
+            [2147483692, 2147483708, 2147483648, 0],
+        )
+
+    def test_sign_safe_txs(self):
         hw_wallet_manager = HwWalletManager()
-        addresses = [Account.create().address, Account.create().address]
-        derivation_paths = ["44'/60'/0'/0/0", "44'/60'/1'/0/0"]
-        mock_get_address.side_effect = addresses
-        # Choosing LEDGER because function is mocked for LEDGER
-        hw_wallets = hw_wallet_manager.get_accounts(
-            HwWalletType.LEDGER, "44'/60'/{i}'/0/0", number_accounts=2
+        wallets = [
+            FakeHwWallet("44'/60'/0'/0/0"),
+            FakeHwWallet("44'/60'/0'/0/1"),
+        ]
+        safe_address = Account.create().address
+        safe_txs = [
+            SafeTx(
+                self.ethereum_client,
+                safe_address,
+                Account.create().address,
+                nonce,
+                b"",
+                0,
+                0,
+                0,
+                0,
+                None,
+                None,
+                safe_nonce=nonce,
+                safe_version="1.4.1",
+                chain_id=1337,
+            )
+            for nonce in range(5)
+        ]
+        FakeHwWallet.device_calls = 0
+        signed_safe_txs = hw_wallet_manager.sign_safe_txs(safe_txs, wallets)
+        # Only one device request per signature
+        self.assertEqual(FakeHwWallet.device_calls, len(safe_txs) * len(wallets))
+        self.assertEqual(signed_safe_txs, safe_txs)
+        expected_signers = sorted(
+            (wallet.address for wallet in wallets), key=lambda address: address.lower()
         )
-        self.assertEqual(len(hw_wallets), 2)
-        for hw_wallet, expected_address, expected_derivation_path in zip(
-            hw_wallets, addresses, derivation_paths, strict=False
-        ):
-            address, derivation_path = hw_wallet
-            self.assertEqual(expected_address, address)
-            self.assertEqual(expected_derivation_path, derivation_path)
+        for safe_tx in signed_safe_txs:
+            self.assertEqual(safe_tx.signers, expected_signers)
+
+        # Existing signatures are kept
+        owner = Account.create()
+        safe_tx = safe_txs[0]
+        safe_tx.signatures = b""
+        safe_tx.sign(owner.key)
+        hw_wallet_manager.sign_safe_tx(safe_tx, wallets[:1])
+        self.assertCountEqual(safe_tx.signers, [owner.address, wallets[0].address])
 
     @mock.patch(
         "safe_cli.operators.hw_wallets.ledger_wallet.init_dongle",
@@ -0,0 +1,148 @@
+import math
+import unittest
+from unittest import mock
+
+from eth_account import Account
+from hexbytes import HexBytes
+from safe_eth.eth.constants import NULL_ADDRESS
+from safe_eth.safe.multi_send import MultiSend, MultiSendOperation, MultiSendTx
+
+from safe_cli.multisend_diagnosis import (
+    find_failing_multisend_tx,
+    get_revert_reason,
+)
+
+from .safe_cli_test_case_mixin import SafeCliTestCaseMixin
+
+
+class TestMultiSendDiagnosis(SafeCliTestCaseMixin, unittest.TestCase):
+    def test_find_failing_multisend_tx(self):
+        safe_address = Account.create().address
+        multisend_address = self.multi_send_contract.address
+        multisend_txs = [
+            MultiSendTx(MultiSendOperation.CALL, Account.create().address, i, b"")
+            for i in range(200)
+        ]
+        failing_index = 137
+        requests_sent = []
+
+        def batch_rpc_request(ethereum_client, requests):
+            results = []
+            for method, (tx, _, state_override) in requests:
+                self.assertEqual(method, "eth_call")
+                self.assertEqual(tx["to"], safe_address)
+                self.assertIn(safe_address, state_override)
+                prefix = MultiSend.from_transaction_data(HexBytes(tx["data"])) or []
+                results.append(None if len(prefix) > failing_index else "0x")
+            requests_sent.append(len(requests))
+            return results
+
+        for probes in (1, 4):
+            with self.subTest(probes=probes):
+                requests_sent.clear()
+                with mock.patch(
+                    "safe_cli.multisend_diagnosis.batch_rpc_request",
+                    side_effect=batch_rpc_request,
+                ):
+                    failure = find_failing_multisend_tx(
+                        self.ethereum_client,
+                        safe_address,
+                        multisend_address,
+                        multisend_txs,
+                        probes=probes,
+                    )
+                self.assertEqual(failure.index, failing_index)
+                self.assertEqual(failure.multisend_tx, multisend_txs[failing_index])
+                self.assertIsNone(failure.revert_reason)  # Not failing alone
+                rounds = math.ceil(math.log(len(multisend_txs), probes + 1)) + 1
+                self.assertLessEqual(len(requests_sent), rounds)
+                self.assertTrue(all(sent <= max(probes, 2) for sent in requests_sent))
+
+        # Transactions calling the Safe cannot be simulated
+        self_call_tx = MultiSendTx(MultiSendOperation.CALL, safe_address, 0, b"")
+        for self_call_index, expected_index in ((150, failing_index), (50, 50)):
+            with self.subTest(self_call_index=self_call_index):
+                with mock.patch(
+                    "safe_cli.multisend_diagnosis.batch_rpc_request",
+                    side_effect=batch_rpc_request,
+                ):
+                    failure = find_failing_multisend_tx(
+                        self.ethereum_client,
+                        safe_address,
+                        multisend_address,
+                        multisend_txs[:self_call_index]
+                        + [self_call_tx]
+                        + multisend_txs[self_call_index:],
+                    )
+                self.assertEqual(failure.index, expected_index)
+                self.assertEqual(failure.self_call, self_call_index < failing_index)
+
+        # Batch does not fail
+        with mock.patch(
+            "safe_cli.multisend_diagnosis.batch_rpc_request",
+            return_value=["0x", "0x"],
+        ):
+            self.assertIsNone(
+                find_failing_multisend_tx(
+                    self.ethereum_client, safe_address, multisend_address, multisend_txs
+                )
+            )
+
+        # Node does not support state overrides
+        self.assertIsNone(
+            find_failing_multisend_tx(
+                self.ethereum_client, safe_address, multisend_address, multisend_txs
+            )
+        )
+
+    def test_get_revert_reason(self):
+        safe_address = Account.create().address
+        # Singleton is already set up
+        setup_data = HexBytes(
+            self.safe_contract_V1_4_1.functions.setup(
+                [Account.create().address],
+                1,
+                NULL_ADDRESS,
+                b"",
+                NULL_ADDRESS,
+                NULL_ADDRESS,
+                0,
+                NULL_ADDRESS,
+            ).build_transaction({"gas": 1, "gasPrice": 1})["data"]
+        )
+        self.assertEqual(
+            "GS200",
+            get_revert_reason(
+                self.ethereum_client,
+                safe_address,
+                MultiSendTx(
+                    MultiSendOperation.CALL,
+                    self.safe_contract_V1_4_1.address,
+                    0,
+                    setup_data,
+                ),
+            ),
+        )
+        self.assertIsNone(
+            get_revert_reason(
+                self.ethereum_client,
+                safe_address,
+                MultiSendTx(MultiSendOperation.CALL, safe_address, 0, b""),
+            )
+        )
+        self.assertIsNone(
+            get_revert_reason(
+                self.ethereum_client,
+                safe_address,
+                MultiSendTx(
+                    MultiSendOperation.DELEGATE_CALL,
+                    self.safe_contract_V1_4_1.address,
+                    0,
+                    setup_data,
+                ),
+            )
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import threading
+import unittest
+from unittest import mock
+
+from eth_account import Account
+
+from safe_cli.receipt_tracker import ReceiptTracker
+
+from .safe_cli_test_case_mixin import SafeCliTestCaseMixin
+
+
+class TestReceiptTracker(SafeCliTestCaseMixin, unittest.TestCase):
+    def test_track(self):
+        tracker = ReceiptTracker(self.ethereum_client, poll_interval=0.1)
+        tx_hashes = [self.send_ether(Account.create().address, 1) for _ in range(3)]
+        receipts = []
+        futures = [
+            tracker.track(tx_hash, callback=receipts.append) for tx_hash in tx_hashes
+        ]
+        for tx_hash, future in zip(tx_hashes, futures, strict=True):
+            self.assertEqual(future.result(timeout=10)["transactionHash"], tx_hash)
+        self.assertEqual(len(receipts), 3)
+        self.assertEqual(tracker.wait(tx_hashes[0], timeout=10)["status"], 1)
+        self.assertIsNone(tracker.wait(bytes(32), timeout=0.3))
+        self.assertEqual(tracker.pending, [])
+
+    def test_poll(self):
+        tracker = ReceiptTracker(self.ethereum_client)
+        tx_hashes = [self.send_ether(Account.create().address, 1) for _ in range(3)]
+        with (
+            mock.patch.object(ReceiptTracker, "_run"),  # Poll manually
+            mock.patch.object(
+                self.ethereum_client,
+                "get_transaction_receipts",
+                wraps=self.ethereum_client.get_transaction_receipts,
+            ) as get_transaction_receipts_mock,
+        ):
+            futures = [tracker.track(tx_hash) for tx_hash in tx_hashes]
+            not_mined = tracker.track(bytes(32))
+            tracker.poll()
+            get_transaction_receipts_mock.assert_called_once()
+            self.assertTrue(all(future.done() for future in futures))
+            self.assertFalse(not_mined.done())
+
+            # No new blocks
+            tracker.poll()
+            get_transaction_receipts_mock.assert_called_once()
+
+            # Untracking only cancels the future of that caller
+            other_not_mined = tracker.track(bytes(32))
+            tracker.untrack(not_mined)
+            self.assertTrue(not_mined.cancelled())
+            self.assertFalse(other_not_mined.cancelled())
+            self.assertEqual(tracker.pending, [bytes(32)])
+            tracker.untrack(other_not_mined)
+            self.assertEqual(tracker.pending, [])
+
+    def test_run_no_pending(self):
+        tracker = ReceiptTracker(self.ethereum_client, poll_interval=0.01)
+        threads_on_release = []
+
+        class Lock:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *args):
+                threads_on_release.append(tracker._thread)
+
+        tracker._thread = threading.current_thread()
+        tracker._lock = Lock()
+        tracker._run()
+        # Poller is cleared holding the lock that finds nothing to poll, so a `track`
+        # after it starts a new one
+        self.assertEqual(threads_on_release, [None])
+
+    def test_run_failure(self):
+        tracker = ReceiptTracker(self.ethereum_client, poll_interval=0.01)
+        with mock.patch.object(ReceiptTracker, "poll", side_effect=KeyError):
+            future = tracker.track(bytes(32))
+            tracker._thread.join(timeout=10)
+        # A new poller is started after an unexpected error
+        self.assertIsNone(tracker._thread)
+        other_future = tracker.track(bytes(32))
+        self.assertTrue(tracker._thread.is_alive())
+        tracker.untrack(future)
+        tracker.untrack(other_future)
+
+
+if __name__ == "__main__":
+    unittest.main()
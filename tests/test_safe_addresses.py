@@ -1,4 +1,5 @@
 import unittest
+from unittest import mock
 
 from eth_account import Account
 from safe_eth.eth import EthereumClient
@@ -7,6 +8,7 @@ from safe_eth.eth.tests.utils import just_test_if_mainnet_node
 from safe_cli.safe_addresses import (
     _get_valid_contract,
     get_default_fallback_handler_address,
+    get_deployments_index,
     get_last_multisend_address,
     get_last_multisend_call_only_address,
     get_proxy_factory_address,
@@ -36,6 +38,49 @@ class TestSafeAddresses(SafeCliTestCaseMixin, unittest.TestCase):
         ):
             _get_valid_contract(self.ethereum_client, addresses[:1])
 
+        # Candidates are checked one by one if node does not support batch requests
+        with mock.patch(
+            "safe_cli.rpc_batch.batch_rpc_request",
+            side_effect=ValueError("Batch request not supported"),
+        ):
+            self.assertEqual(
+                _get_valid_contract(self.ethereum_client, addresses), expected_address
+            )
+
+    def test_get_addresses_from_deployments(self):
+        self.assertEqual(
+            get_deployments_index()[1]["safe_contract"],
+            "0x41675C099F32341bf84BFc5382aF534df5C7461a",
+        )
+        # zkSync specific deployments are preferred
+        self.assertEqual(
+            get_deployments_index()[324]["proxy_factory"],
+            "0xc329D02fd8CB2fc13aa919005aF46320794a8629",
+        )
+
+        # Known chains do not require querying the node
+        ethereum_client = EthereumClient("https://unreachable-node.invalid")
+        ethereum_client._cache["chain_id"] = 1
+        self.assertEqual(
+            get_safe_l2_contract_address(ethereum_client),
+            "0x29fcB43b46531BcA003ddC8FCB67FFE91900C762",
+        )
+        self.assertEqual(
+            get_last_multisend_call_only_address(ethereum_client),
+            "0x9641d764fc13c8B624c04430C7356C1C7C8102e2",
+        )
+
+        # Deployments are not trusted for development chains
+        with mock.patch(
+            "safe_cli.safe_addresses._get_valid_contract",
+            return_value=self.safe_contract_V1_4_1.address,
+        ) as get_valid_contract_mock:
+            self.assertEqual(
+                get_safe_contract_address(self.ethereum_client),
+                self.safe_contract_V1_4_1.address,
+            )
+            get_valid_contract_mock.assert_called_once()
+
     def test_get_addresses(self):
         mainnet_node = just_test_if_mainnet_node()
         ethereum_client = EthereumClient(mainnet_node)
@@ -62,7 +107,7 @@ class TestSafeAddresses(SafeCliTestCaseMixin, unittest.TestCase):
         )
         self.assertEqual(
             get_last_multisend_call_only_address(ethereum_client),
-            "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
+            "0x9641d764fc13c8B624c04430C7356C1C7C8102e2",
         )
 
 
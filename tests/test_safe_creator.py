@@ -1,9 +1,15 @@
 import argparse
+import json
+import sys
+import tempfile
 import unittest
+from pathlib import Path
 from unittest import mock
 from unittest.mock import MagicMock
 
 from eth_account import Account
+from hexbytes import HexBytes
+from safe_eth.eth.constants import NULL_ADDRESS
 from safe_eth.safe import Safe
 from safe_eth.util.util import to_0x_hex_str
 
@@ -32,6 +38,15 @@ class TestSafeCreator(SafeCliTestCaseMixin, unittest.TestCase):
             callback_handler=self.compatibility_fallback_handler_V1_4_1.address,
             without_events=False,
             generate_vanity_addresses=False,
+            predict_only=False,
+            fleet=None,
+            fleet_manifest=None,
+            max_in_flight=10,
+            vanity_prefix="",
+            vanity_suffix="",
+            vanity_regex=None,
+            vanity_matches=1,
+            vanity_workers=None,
         )
 
         safe_address = main().contract_address
@@ -49,6 +64,132 @@ class TestSafeCreator(SafeCliTestCaseMixin, unittest.TestCase):
         with self.assertRaisesRegex(SystemExit, "1"):
             main()
 
+        # Predicted address matches the deployed Safe
+        mock_parse_args.return_value.predict_only = True
+        with mock.patch(
+            "safe_cli.safe_creator.print_formatted_text"
+        ) as print_formatted_text_mock:
+            self.assertIsNone(main())
+        print_formatted_text_mock.assert_called_with(f"{safe_address} 4815")
+
+        # Private key is only needed for the default owner
+        mock_parse_args.return_value.private_key = None
+        with mock.patch(
+            "safe_cli.safe_creator.print_formatted_text"
+        ) as print_formatted_text_mock:
+            self.assertIsNone(main())
+        print_formatted_text_mock.assert_called_with(f"{safe_address} 4815")
+
+        mock_parse_args.return_value.owners = None
+        with self.assertRaisesRegex(SystemExit, "2"):
+            main()
+
+    @mock.patch("safe_cli.safe_creator.print_formatted_text")
+    @mock.patch("argparse.ArgumentParser.parse_args")
+    def test_main_generate_vanity_addresses(
+        self, mock_parse_args: MagicMock, print_formatted_text_mock: MagicMock
+    ):
+        owner_account = self.get_ethereum_test_account()
+        owners = [Account.create().address]
+        mock_parse_args.return_value = argparse.Namespace(
+            node_url=self.ethereum_node_url,
+            private_key=to_0x_hex_str(owner_account.key),
+            no_confirm=False,
+            owners=owners,
+            threshold=1,
+            salt_nonce=4815,
+            safe_contract=self.safe_contract.address,
+            proxy_factory=self.proxy_factory_contract.address,
+            callback_handler=self.compatibility_fallback_handler_V1_4_1.address,
+            without_events=False,
+            generate_vanity_addresses=True,
+            predict_only=False,
+            fleet=None,
+            fleet_manifest=None,
+            max_in_flight=10,
+            vanity_prefix="a",
+            vanity_suffix="",
+            vanity_regex="b$",
+            vanity_matches=2,
+            vanity_workers=1,
+        )
+
+        with mock.patch(
+            "safe_cli.safe_creator.yes_or_no_question"
+        ) as yes_or_no_question_mock:
+            self.assertIsNone(main())
+        # Nothing is asked and only the matches are written to stdout
+        yes_or_no_question_mock.assert_not_called()
+        self.assertEqual(
+            print_formatted_text_mock.call_args_list[0].kwargs["file"], sys.stderr
+        )
+        matches = [
+            call.args[0].split()
+            for call in print_formatted_text_mock.call_args_list[1:]
+        ]
+        self.assertEqual(len(matches), 2)
+        for address, salt_nonce in matches:
+            self.assertGreaterEqual(int(salt_nonce), 4815)
+            self.assertTrue(address.lower().startswith("0xa"))
+            self.assertTrue(address.lower().endswith("b"))
+            safe_creation_tx_data = self.safe_contract.functions.setup(
+                owners,
+                1,
+                NULL_ADDRESS,
+                b"",
+                self.compatibility_fallback_handler_V1_4_1.address,
+                NULL_ADDRESS,
+                0,
+                NULL_ADDRESS,
+            ).build_transaction({"gas": 1, "gasPrice": 1})["data"]
+            self.assertEqual(
+                self.proxy_factory.calculate_proxy_address(
+                    self.safe_contract.address,
+                    HexBytes(safe_creation_tx_data),
+                    int(salt_nonce),
+                ),
+                address,
+            )
+
+    @mock.patch("argparse.ArgumentParser.parse_args")
+    def test_main_fleet(self, mock_parse_args: MagicMock):
+        owners = [Account.create().address for _ in range(2)]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            fleet_path = Path(tmp_dir) / "fleet.csv"
+            fleet_path.write_text(
+                f"owners,threshold,salt_nonce\n{owners[0]};{owners[1]},2,1\n{owners[0]},1,2\n"
+            )
+            mock_parse_args.return_value = argparse.Namespace(
+                node_url=self.ethereum_node_url,
+                private_key=to_0x_hex_str(self.ethereum_test_account.key),
+                no_confirm=True,
+                owners=None,
+                threshold=1,
+                salt_nonce=4815,
+                safe_contract=self.safe_contract.address,
+                proxy_factory=self.proxy_factory_contract.address,
+                callback_handler=self.compatibility_fallback_handler_V1_4_1.address,
+                without_events=False,
+                generate_vanity_addresses=False,
+                predict_only=False,
+                fleet=str(fleet_path),
+                fleet_manifest=None,
+                max_in_flight=10,
+            )
+            self.assertIsNone(main())
+            manifest = [
+                json.loads(line)
+                for line in Path(f"{fleet_path}.manifest.jsonl")
+                .read_text()
+                .splitlines()
+            ]
+        self.assertEqual(
+            [fleet_safe["status"] for fleet_safe in manifest], ["deployed"] * 2
+        )
+        for fleet_safe in manifest:
+            safe = Safe(fleet_safe["address"], self.ethereum_client)
+            self.assertEqual(safe.retrieve_owners(), fleet_safe["owners"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,97 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from eth_account import Account
+
+from safe_cli import chain_cache, safe_event_index
+from safe_cli.safe_event_index import (
+    SAFE_EVENT_INDEX_REORG_BLOCKS,
+    get_safe_event_index,
+)
+from safe_cli.utils import scan_block_range
+
+from .safe_cli_test_case_mixin import SafeCliTestCaseMixin
+
+
+@mock.patch.object(chain_cache, "NOT_CACHED_CHAIN_IDS", frozenset())
+class TestSafeEventIndex(SafeCliTestCaseMixin, unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.environ_patch = mock.patch.dict(
+            os.environ, {"SAFE_CLI_CACHE_DIR": self.cache_dir.name}
+        )
+        self.environ_patch.start()
+        get_safe_event_index.cache_clear()
+
+    def tearDown(self) -> None:
+        super().tearDown()
+        get_safe_event_index().close()
+        get_safe_event_index.cache_clear()
+        self.environ_patch.stop()
+        self.cache_dir.cleanup()
+
+    def test_transaction_history(self):
+        for version in ("1.3.0", "1.4.1"):
+            with self.subTest(version=version):
+                safe_operator = self.setup_operator(number_owners=2, version=version)
+                new_owner = Account.create().address
+                safe_operator.add_owner(new_owner, threshold=2)
+                index = safe_operator.safe_event_index
+                chain_id = self.ethereum_client.get_chain_id()
+
+                history = list(safe_operator.iter_transaction_history())
+                self.assertEqual([tx["nonce"] for tx in history], [1, 0])
+                self.assertTrue(all(tx["isSuccessful"] for tx in history))
+                self.assertEqual(
+                    history[0]["events"],
+                    [
+                        {"event": "AddedOwner", "args": {"owner": new_owner}},
+                        {"event": "ChangedThreshold", "args": {"threshold": 2}},
+                    ],
+                )
+                self.assertEqual(history[0]["to"], safe_operator.address)
+                self.assertEqual(history[0]["value"], "0")
+                last_block = index.get_last_block(chain_id, safe_operator.address)
+                self.assertEqual(last_block, self.ethereum_client.current_block_number)
+
+                # Only blocks after the checkpoint are scanned
+                safe_operator.change_threshold(1)
+                with mock.patch.object(
+                    safe_event_index, "scan_block_range", wraps=scan_block_range
+                ) as scan_block_range_mock:
+                    self.assertEqual(
+                        [
+                            tx["nonce"]
+                            for tx in safe_operator.iter_transaction_history(
+                                since_nonce=1
+                            )
+                        ],
+                        [2, 1],
+                    )
+                scan_block_range_mock.assert_called_once()
+                self.assertEqual(
+                    scan_block_range_mock.call_args.args[1:3],
+                    (
+                        max(last_block - SAFE_EVENT_INDEX_REORG_BLOCKS, 0) + 1,
+                        self.ethereum_client.current_block_number,
+                    ),
+                )
+                self.assertEqual(
+                    len(list(safe_operator.iter_transaction_history(limit=1))), 1
+                )
+
+                with mock.patch("builtins.print") as print_mock:
+                    self.assertEqual(safe_operator.get_transaction_history(), 3)
+                self.assertIn(
+                    "ChangedThreshold(threshold=1)", print_mock.call_args[0][0]
+                )
+
+                safe_operator.invalidate_chain_cache()
+                self.assertIsNone(index.get_last_block(chain_id, safe_operator.address))
+
+
+if __name__ == "__main__":
+    unittest.main()
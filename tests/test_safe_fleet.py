@@ -0,0 +1,171 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+from unittest.mock import MagicMock
+
+from eth_account import Account
+from hexbytes import HexBytes
+from safe_eth.safe import Safe
+
+from safe_cli.create2 import SafeAddressPredictor
+from safe_cli.safe_fleet import (
+    FleetSafe,
+    FleetSafeStatus,
+    FleetTxPipeline,
+    deploy_fleet,
+    load_fleet_file,
+    write_fleet_manifest,
+)
+
+from .safe_cli_test_case_mixin import SafeCliTestCaseMixin
+
+
+class TestSafeFleet(SafeCliTestCaseMixin, unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.tmp_path = Path(self.tmp_dir.name)
+
+    def tearDown(self) -> None:
+        super().tearDown()
+        self.tmp_dir.cleanup()
+
+    def test_load_fleet_file(self):
+        owners = [Account.create().address for _ in range(2)]
+        csv_path = self.tmp_path / "fleet.csv"
+        csv_path.write_text(
+            f"owners,threshold,salt_nonce\n{owners[0]} {owners[1]},2,1\n{owners[0]},1,2\n"
+        )
+        jsonl_path = self.tmp_path / "fleet.jsonl"
+        jsonl_path.write_text(
+            json.dumps({"owners": owners, "threshold": 2, "salt_nonce": 1})
+            + "\n\n"
+            + json.dumps({"owners": owners[:1], "threshold": 1, "salt_nonce": 2})
+            + "\n"
+        )
+        expected = [FleetSafe(owners, 2, 1), FleetSafe(owners[:1], 1, 2)]
+        self.assertEqual(load_fleet_file(csv_path), expected)
+        self.assertEqual(load_fleet_file(jsonl_path), expected)
+
+        jsonl_path.write_text(
+            json.dumps({"owners": owners, "threshold": 3, "salt_nonce": 1})
+        )
+        with self.assertRaisesRegex(ValueError, "fleet.jsonl:1 is not valid"):
+            load_fleet_file(jsonl_path)
+
+        csv_path.write_text(f"owners,threshold,salt_nonce\n{owners[0].lower()},1,1\n")
+        with self.assertRaisesRegex(ValueError, "fleet.csv:2 is not valid"):
+            load_fleet_file(csv_path)
+
+    def test_deploy_fleet(self):
+        predictor = SafeAddressPredictor(
+            self.proxy_factory.address,
+            self.proxy_factory.get_proxy_creation_code(),
+            self.safe_contract_V1_4_1.address,
+            self.compatibility_fallback_handler_V1_4_1.address,
+        )
+        deployer_account = self.ethereum_test_account
+        owners = [Account.create().address for _ in range(3)]
+        fleet = [FleetSafe(owners[:i], i, 4815 + i - 1) for i in range(1, 4)]
+        fleet.append(FleetSafe(owners[:2], 2, 4816))  # Twice on the same fleet
+        existing_address = predictor.predict(owners[:1], 1, 4815)
+        self.proxy_factory.deploy_proxy_contract_with_nonce(
+            deployer_account,
+            predictor.master_copy,
+            predictor.get_initializer(owners[:1], 1),
+            4815,
+        )
+
+        updates = []
+        deploy_fleet(
+            self.ethereum_client,
+            deployer_account,
+            predictor,
+            fleet,
+            max_in_flight=2,
+            on_update=updates.append,
+        )
+        self.assertEqual(len(updates), len(fleet))
+        self.assertEqual(
+            [fleet_safe.status for fleet_safe in fleet],
+            [
+                FleetSafeStatus.EXISTING,
+                FleetSafeStatus.DEPLOYED,
+                FleetSafeStatus.DEPLOYED,
+                FleetSafeStatus.FAILED,
+            ],
+        )
+        self.assertEqual(fleet[0].address, existing_address)
+        for fleet_safe in fleet[1:3]:
+            self.assertIsNotNone(fleet_safe.tx_hash)
+            safe_info = Safe(
+                fleet_safe.address, self.ethereum_client
+            ).retrieve_all_info()
+            self.assertEqual(safe_info.owners, fleet_safe.owners)
+            self.assertEqual(safe_info.threshold, fleet_safe.threshold)
+
+        # Deploying again does not send any transaction
+        deploy_fleet(self.ethereum_client, deployer_account, predictor, fleet)
+        self.assertEqual(
+            {fleet_safe.status for fleet_safe in fleet}, {FleetSafeStatus.EXISTING}
+        )
+
+        manifest_path = self.tmp_path / "manifest.jsonl"
+        write_fleet_manifest(manifest_path, fleet)
+        manifest = [json.loads(line) for line in manifest_path.read_text().splitlines()]
+        self.assertEqual(len(manifest), len(fleet))
+        self.assertEqual(manifest[1]["address"], fleet[1].address)
+        self.assertEqual(manifest[1]["status"], "existing")
+
+    @mock.patch("safe_cli.safe_fleet.batch_is_contract")
+    @mock.patch.object(FleetTxPipeline, "_broadcast")
+    def test_deploy_fleet_not_mined(
+        self, broadcast_mock: MagicMock, batch_is_contract_mock: MagicMock
+    ):
+        predictor = SafeAddressPredictor(
+            self.proxy_factory.address,
+            self.proxy_factory.get_proxy_creation_code(),
+            self.safe_contract_V1_4_1.address,
+            self.compatibility_fallback_handler_V1_4_1.address,
+        )
+        ethereum_client = MagicMock()
+        ethereum_client.get_nonce_for_account.return_value = 3
+        ethereum_client.w3.eth.gas_price = 10
+        ethereum_client.get_transaction_receipts.side_effect = lambda tx_hashes: (
+            [None] * len(tx_hashes)
+        )
+        batch_is_contract_mock.side_effect = lambda _, addresses: (
+            [False] * len(addresses)
+        )
+        broadcast_mock.side_effect = lambda pipelined_tx: HexBytes(
+            broadcast_mock.call_count.to_bytes(32, "big")
+        )
+        owners = [Account.create().address for _ in range(3)]
+        fleet = [FleetSafe(owners, 1, salt_nonce) for salt_nonce in range(3)]
+
+        deploy_fleet(
+            ethereum_client,
+            self.ethereum_test_account,
+            predictor,
+            fleet,
+            max_in_flight=2,
+            stuck_timeout=0,
+            max_replacements=1,
+        )
+        # Oldest transaction is replaced instead of sending a new nonce
+        self.assertEqual(
+            [call.args[0].nonce for call in broadcast_mock.call_args_list], [3, 4, 3]
+        )
+        self.assertEqual(
+            {fleet_safe.status for fleet_safe in fleet}, {FleetSafeStatus.PENDING}
+        )
+        self.assertEqual(fleet[0].tx_hash, "0x" + "03".rjust(64, "0"))
+        self.assertEqual(fleet[1].tx_hash, "0x" + "02".rjust(64, "0"))
+        self.assertIsNone(fleet[2].tx_hash)
+        self.assertEqual(fleet[2].error, "Previous transaction was not mined")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,12 @@
+import dataclasses
 import json
+import time
 import unittest
 from unittest import mock
 from unittest.mock import MagicMock, PropertyMock
 
+import requests
+from eth_abi import encode as encode_abi
 from eth_account import Account
 from eth_typing import ChecksumAddress
 from ledgerblue.Dongle import Dongle
@@ -10,9 +14,10 @@ from ledgereth.objects import LedgerAccount
 from safe_eth.eth import EthereumClient
 from safe_eth.eth.eip712 import eip712_encode
 from safe_eth.safe import Safe
-from safe_eth.safe.multi_send import MultiSend
+from safe_eth.safe.multi_send import MultiSend, MultiSendOperation, MultiSendTx
 from safe_eth.util.util import to_0x_hex_str
 from web3 import Web3
+from web3.exceptions import Web3RPCError
 from web3.types import Wei
 
 from safe_cli.contracts import safe_to_l2_migration
@@ -38,7 +43,12 @@ from safe_cli.operators.exceptions import (
     SameModuleGuardException,
     SenderRequiredException,
 )
-from safe_cli.operators.safe_operator import SafeOperator
+from safe_cli.operators.safe_operator import (
+    MULTISEND_TX_BASE_GAS,
+    MULTISEND_TX_DEFAULT_GAS,
+    SAFE_TX_BASE_GAS,
+    SafeOperator,
+)
 from safe_cli.utils import get_erc_20_list
 from tests.utils import generate_transfers_erc20
 
@@ -69,6 +79,155 @@ class TestSafeOperator(SafeCliTestCaseMixin, unittest.TestCase):
             safe = Safe(safe_operator.address, self.ethereum_client)
             self.assertEqual(len(safe.retrieve_owners()), number_owners)
 
+    def test_batch_startup(self):
+        safe_operator = self.setup_operator(number_owners=2)
+        expected_safe_cli_info = safe_operator.get_safe_cli_info()
+        post = requests.Session.post
+        with mock.patch.object(
+            requests.Session, "post", autospec=True, side_effect=post
+        ) as post_mock:
+            safe_operator = SafeOperator(safe_operator.address, self.ethereum_node_url)
+            self.assertEqual(safe_operator.safe_cli_info, expected_safe_cli_info)
+            self.assertEqual(safe_operator.network, self.ethereum_client.get_network())
+            self.assertEqual(safe_operator.safe.get_version(), "1.4.1")
+            self.assertEqual(post_mock.call_count, 1)
+        self.assertEqual(
+            safe_operator.safe_event_watcher.last_block,
+            self.ethereum_client.current_block_number,
+        )
+
+        with mock.patch.object(
+            requests.Session, "post", autospec=True, side_effect=post
+        ) as post_mock:
+            safe_operator = SafeOperator(
+                safe_operator.address, self.ethereum_node_url, batch_startup=False
+            )
+            self.assertEqual(safe_operator.safe_cli_info, expected_safe_cli_info)
+            self.assertGreater(post_mock.call_count, 1)
+
+        # Node not supporting batch requests
+        with mock.patch(
+            "safe_cli.operators.safe_operator.batch_rpc_request",
+            side_effect=ValueError,
+        ):
+            safe_operator = SafeOperator(safe_operator.address, self.ethereum_node_url)
+            self.assertIsNone(safe_operator._safe_cli_info)
+            self.assertEqual(safe_operator.safe_cli_info, expected_safe_cli_info)
+
+    def test_get_safe_cli_info(self):
+        for version in ("1.1.1", "1.4.1", "1.5.0"):
+            with self.subTest(version=version):
+                safe_operator = self.setup_operator(version=version)
+                with mock.patch.object(
+                    EthereumClient, "multicall", new_callable=PropertyMock
+                ) as multicall_mock:
+                    multicall_mock.return_value = None
+                    expected_safe_cli_info = safe_operator.get_safe_cli_info()
+                self.assertEqual(expected_safe_cli_info.version, version)
+
+                post = requests.Session.post
+                with mock.patch.object(
+                    requests.Session, "post", autospec=True, side_effect=post
+                ) as post_mock:
+                    self.assertEqual(
+                        safe_operator.get_safe_cli_info(), expected_safe_cli_info
+                    )
+                    if version != "1.1.1":
+                        self.assertEqual(post_mock.call_count, 1)
+                    else:  # `getStorageAt` is not supported, so slots are read apart
+                        self.assertGreater(post_mock.call_count, 1)
+
+        # Refresh after mutations
+        new_owner = Account.create().address
+        safe_operator.add_owner(new_owner, threshold=2)
+        self.assertEqual(safe_operator.safe_cli_info.owners[0], new_owner)
+        self.assertEqual(safe_operator.safe_cli_info.threshold, 2)
+        self.assertEqual(safe_operator.safe_cli_info.nonce, 1)
+
+    def test_update_safe_cli_info(self):
+        for version in ("1.3.0", "1.4.1"):
+            with self.subTest(version=version):
+                safe_operator = self.setup_operator(number_owners=2, version=version)
+                # Safe is changed by another cli
+                other_safe_operator = SafeOperator(
+                    safe_operator.address, self.ethereum_node_url
+                )
+                other_safe_operator.accounts = safe_operator.accounts
+                other_safe_operator.default_sender = safe_operator.default_sender
+                new_owner = Account.create().address
+                other_safe_operator.add_owner(new_owner, threshold=2)
+                other_safe_operator.remove_owner(new_owner)
+                other_safe_operator.add_owner(new_owner)
+                other_safe_operator.change_threshold(1)
+                self.ethereum_client.send_eth_to(
+                    self.ethereum_test_account.key,
+                    safe_operator.address,
+                    self.ethereum_client.w3.eth.gas_price,
+                    Web3.to_wei(1, "ether"),
+                )
+
+                self.assertNotEqual(
+                    safe_operator.safe_cli_info, safe_operator.get_safe_cli_info()
+                )
+                with mock.patch.object(
+                    SafeOperator, "get_safe_cli_info", autospec=True
+                ) as get_safe_cli_info_mock:
+                    safe_cli_info = safe_operator.update_safe_cli_info()
+                get_safe_cli_info_mock.assert_not_called()
+                # Balance is only retrieved again after an execution
+                self.assertEqual(
+                    dataclasses.replace(safe_cli_info, balance_ether=0),
+                    dataclasses.replace(
+                        safe_operator.get_safe_cli_info(), balance_ether=0
+                    ),
+                )
+
+                # Background watcher
+                safe_operator.safe_event_watcher.poll_interval = 0.01
+                safe_operator.start_safe_cli_info_watcher()
+                try:
+                    other_safe_operator.remove_owner(new_owner)
+                    for _ in range(500):
+                        if new_owner not in safe_operator.safe_cli_info.owners:
+                            break
+                        time.sleep(0.01)
+                    self.assertEqual(
+                        safe_operator.safe_cli_info, safe_operator.get_safe_cli_info()
+                    )
+                finally:
+                    safe_operator.stop_safe_cli_info_watcher()
+
+                # `swapOwner` keeps the position of the removed owner
+                owners = other_safe_operator.safe.retrieve_owners()
+                swapped_owner = Account.create().address
+                other_safe_operator.execute_safe_internal_transaction(
+                    other_safe_operator.safe_contract.functions.swapOwner(
+                        owners[0], owners[1], swapped_owner
+                    ).build_transaction(
+                        {"from": safe_operator.address, "gas": 0, "gasPrice": 0}
+                    )["data"]
+                )
+                self.assertEqual(
+                    safe_operator.update_safe_cli_info().owners,
+                    [owners[0], swapped_owner, *owners[2:]],
+                )
+
+                # Watcher thread survives unexpected errors
+                safe_operator.safe_event_watcher.poll_interval = 0.01
+                with mock.patch.object(
+                    SafeOperator, "_apply_watched_events", side_effect=KeyError
+                ) as apply_watched_events_mock:
+                    safe_operator.start_safe_cli_info_watcher()
+                    try:
+                        for _ in range(500):
+                            if apply_watched_events_mock.call_count > 1:
+                                break
+                            time.sleep(0.01)
+                        self.assertGreater(apply_watched_events_mock.call_count, 1)
+                        self.assertTrue(safe_operator.safe_event_watcher.is_running)
+                    finally:
+                        safe_operator.stop_safe_cli_info_watcher()
+
     @mock.patch(
         "safe_eth.safe.Safe.contract", new_callable=mock.PropertyMock, return_value=None
     )
@@ -100,6 +259,35 @@ class TestSafeOperator(SafeCliTestCaseMixin, unittest.TestCase):
         self.assertEqual(len(safe_operator.accounts), number_of_accounts - 1)
         self.assertFalse(safe_operator.default_sender)
 
+    def test_load_cli_owners_from_words(self):
+        words = (
+            "loan satoshi action taste party limit cat elder powder dress link decline"
+        )
+        Account.enable_unaudited_hdwallet_features()
+        owners = [
+            "0x09A512D5ecfF9492Cb0f50AFF853dFD8B4ec3EB1",  # Index 1
+            "0x38DF5615C090Ca80930986295B9bbFCc36a0Ae7B",  # Index 4
+            # Ledger Live derivation path
+            Account.from_mnemonic(words, account_path="m/44'/60'/3'/0/0").address,
+        ]
+        safe_address = self.deploy_test_safe(owners=owners).address
+        safe_operator = SafeOperator(safe_address, self.ethereum_node_url)
+
+        safe_operator.load_cli_owners_from_words(words.split(" "), gap_limit=2)
+        self.assertEqual(
+            {account.address for account in safe_operator.accounts}, {owners[0]}
+        )
+        safe_operator.load_cli_owners_from_words(words.split(" "))
+        self.assertEqual(
+            {account.address for account in safe_operator.accounts}, set(owners[:2])
+        )
+        safe_operator.load_cli_owners_from_words(
+            words.split(" "), gap_limit=5, all_derivation_paths=True
+        )
+        self.assertEqual(
+            {account.address for account in safe_operator.accounts}, set(owners)
+        )
+
     @mock.patch(
         "safe_cli.operators.hw_wallets.ledger_wallet.init_dongle",
         return_value=Dongle(),
@@ -476,6 +664,141 @@ class TestSafeOperator(SafeCliTestCaseMixin, unittest.TestCase):
                 safe_contract_l2_130_address,
             )
 
+    def test_get_balances(self):
+        safe_operator = self.setup_operator()
+        token_address = Account.create().address
+        token_results = [
+            encode_abi(["uint256"], [10**18]),
+            encode_abi(["uint8"], [18]),
+            encode_abi(["string"], ["DAI"]),
+            encode_abi(["string"], ["Dai Stablecoin"]),
+        ]
+        with (
+            mock.patch(
+                "safe_cli.operators.safe_operator.get_safe_tokens",
+                return_value={token_address},
+            ),
+            mock.patch(
+                "safe_cli.token_balances.multicall3_aggregate3",
+                return_value=token_results,
+            ),
+        ):
+            self.assertEqual(
+                safe_operator.get_balances(),
+                [
+                    ["ETHER", "0.00000", "Ξ", 18, ""],
+                    ["Dai Stablecoin", "1.00000", "DAI", 18, token_address],
+                ],
+            )
+
+        for error in (
+            ValueError("Batch request not supported by the node"),
+            Web3RPCError("execution reverted"),  # Not a `ValueError` on web3 7
+        ):
+            with (
+                self.subTest(error=error),
+                mock.patch(
+                    "safe_cli.operators.safe_operator.get_safe_tokens",
+                    return_value={token_address},
+                ),
+                mock.patch(
+                    "safe_cli.token_balances._call_many", side_effect=error
+                ) as call_many_mock,
+                mock.patch(
+                    "safe_cli.operators.safe_operator.print_formatted_text"
+                ) as print_formatted_text_mock,
+            ):
+                self.assertEqual(safe_operator.get_balances(), [])
+                self.assertIn(
+                    "Cannot retrieve token balances",
+                    str(print_formatted_text_mock.call_args.args[0]),
+                )
+                self.assertIsNone(safe_operator.drain(Account.create().address))
+                # One token chunk is not retried
+                self.assertEqual(call_many_mock.call_count, 2)
+
+    def test_batch_safe_txs(self):
+        safe_operator = self.setup_operator()
+        self.send_ether(safe_operator.address, 3)
+        accounts = [Account.create() for _ in range(3)]
+        safe_txs = [
+            safe_operator.prepare_safe_transaction(account.address, 1, b"")
+            for account in accounts
+        ]
+        safe_nonce = safe_operator.safe.retrieve_nonce()
+
+        with mock.patch.object(
+            MultiSend,
+            "MULTISEND_CALL_ONLY_ADDRESSES",
+            [self.multi_send_contract.address],
+        ):
+            batched_txs = safe_operator.batch_safe_txs(safe_nonce, safe_txs)
+            self.assertEqual(len(batched_txs), 1)
+            self.assertEqual(batched_txs[0].to, self.multi_send_contract.address)
+
+            # Only one transaction fits on every chunk
+            batched_txs = safe_operator.batch_safe_txs(
+                safe_nonce, safe_txs, gas_limit=150_000
+            )
+        self.assertEqual(len(batched_txs), 3)
+        for i, (batched_tx, account) in enumerate(
+            zip(batched_txs, accounts, strict=True)
+        ):
+            self.assertEqual(batched_tx.safe_nonce, safe_nonce + i)
+            self.assertEqual(batched_tx.to, account.address)
+            self.assertTrue(batched_tx.signatures)
+            self.assertTrue(safe_operator.execute_safe_transaction(batched_tx))
+            self.assertEqual(self.ethereum_client.get_balance(account.address), 1)
+
+    def test_execute_safe_transactions(self):
+        safe_operator = self.setup_operator()
+        self.send_ether(safe_operator.address, 3)
+        accounts = [Account.create() for _ in range(3)]
+        safe_nonce = safe_operator.safe.retrieve_nonce()
+        safe_txs = [
+            safe_operator.prepare_safe_transaction(
+                account.address, 1, b"", safe_nonce=safe_nonce + i
+            )
+            for i, account in enumerate(accounts)
+        ]
+        self.assertTrue(safe_operator.execute_safe_transactions(safe_txs))
+        self.assertEqual(safe_operator.safe.retrieve_nonce(), safe_nonce + 3)
+        self.assertEqual(safe_operator.safe_cli_info.nonce, safe_nonce + 3)
+        self.assertEqual(len(safe_operator.executed_transactions), 3)
+        for account in accounts:
+            self.assertEqual(self.ethereum_client.get_balance(account.address), 1)
+
+    def test_plan_multisend_chunks(self):
+        safe_operator = self.setup_operator()
+        multisend_txs = [
+            MultiSendTx(MultiSendOperation.CALL, Account.create().address, i, b"")
+            for i in range(6)
+        ]
+        with mock.patch.object(
+            safe_operator,
+            "estimate_multisend_txs_gas",
+            return_value=[100, 200, 700, 1_500, 300, 300],
+        ):
+            chunks = safe_operator.plan_multisend_chunks(
+                multisend_txs, SAFE_TX_BASE_GAS + 1_000
+            )
+        self.assertEqual(
+            chunks,
+            [multisend_txs[:3], multisend_txs[3:4], multisend_txs[4:]],
+        )
+
+        with mock.patch(
+            "safe_cli.operators.safe_operator.batch_rpc_request",
+            return_value=[hex(21_000 + 5_000), None],
+        ):
+            self.assertEqual(
+                safe_operator.estimate_multisend_txs_gas(multisend_txs[:2]),
+                [
+                    5_000 + MULTISEND_TX_BASE_GAS + 16 * 85,
+                    MULTISEND_TX_DEFAULT_GAS + MULTISEND_TX_BASE_GAS + 16 * 85,
+                ],
+            )
+
     def test_drain(self):
         safe_operator = self.setup_operator()
         account = Account.create()
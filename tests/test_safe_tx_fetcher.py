@@ -0,0 +1,57 @@
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from hexbytes import HexBytes
+from safe_eth.safe.api import SafeAPIException
+
+from safe_cli.safe_tx_fetcher import SafeTxFetchException, fetch_safe_transactions
+
+
+class TestSafeTxFetcher(unittest.TestCase):
+    def test_fetch_safe_transactions(self):
+        safe_tx_hashes = [HexBytes(i.to_bytes(32, "big")) for i in range(20)]
+        in_flight = 0
+        max_in_flight = 0
+        lock = threading.Lock()
+
+        def get_safe_transaction(safe_tx_hash):
+            nonlocal in_flight, max_in_flight
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+            # Latest requests finish first
+            time.sleep(0.001 * (len(safe_tx_hashes) - int.from_bytes(safe_tx_hash)))
+            with lock:
+                in_flight -= 1
+            if int.from_bytes(safe_tx_hash) in (3, 11):
+                raise SafeAPIException("Not found")
+            return safe_tx_hash, None
+
+        safe_tx_service = MagicMock()
+        safe_tx_service.get_safe_transaction.side_effect = get_safe_transaction
+
+        results = fetch_safe_transactions(
+            safe_tx_service, safe_tx_hashes[4:11], max_workers=4
+        )
+        self.assertEqual(
+            results, [(safe_tx_hash, None) for safe_tx_hash in safe_tx_hashes[4:11]]
+        )
+        self.assertLessEqual(max_in_flight, 4)
+        self.assertGreater(max_in_flight, 1)
+
+        with self.assertRaises(SafeTxFetchException) as context:
+            fetch_safe_transactions(safe_tx_service, safe_tx_hashes)
+        self.assertEqual(
+            list(context.exception.errors), [safe_tx_hashes[3], safe_tx_hashes[11]]
+        )
+        self.assertIn("Cannot get 2 transactions", str(context.exception))
+        # Every transaction was requested, errors do not stop the others
+        self.assertEqual(safe_tx_service.get_safe_transaction.call_count, 27)
+
+        self.assertEqual(fetch_safe_transactions(safe_tx_service, []), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,14 @@
+import json
+import tempfile
 import unittest
+from pathlib import Path
 from unittest import mock
 from unittest.mock import MagicMock
 
 from eth_account import Account
 from hexbytes import HexBytes
 from ledgereth.objects import LedgerAccount
+from requests import RequestException
 from safe_eth.eth import EthereumClient
 from safe_eth.safe import SafeTx
 from safe_eth.safe.api import SafeAPIException, TransactionServiceApi
@@ -12,7 +16,10 @@ from safe_eth.util.util import to_0x_hex_str
 from web3 import Web3
 
 from safe_cli.operators import SafeOperatorMode, SafeTxServiceOperator
+from safe_cli.operators.hw_wallets.hw_wallet_manager import HwWalletManager
+from safe_cli.tx_service_mirror import TxServiceMirror
 
+from .fake_hw_wallet import FakeHwWallet
 from .mocks.balances_mock import balances_mock
 from .mocks.data_decoded_mock import data_decoded_mock
 from .mocks.multisig_tx_mock import GetMultisigTxRequestMock
@@ -119,6 +126,57 @@ class TestSafeTxServiceOperator(SafeCliTestCaseMixin, unittest.TestCase):
             safe_address=safe_operator.address,
         )
 
+    @mock.patch.object(TransactionServiceApi, "remove_delegate", return_value=None)
+    @mock.patch.object(TransactionServiceApi, "add_delegate", return_value=None)
+    @mock.patch.object(TransactionServiceApi, "get_delegates", return_value=[])
+    def test_get_permitted_signers_cached_delegates(
+        self,
+        get_delegates_mock: MagicMock,
+        add_delegate_mock: MagicMock,
+        remove_delegate_mock: MagicMock,
+    ):
+        safe_operator = self.setup_operator(
+            number_owners=1, mode=SafeOperatorMode.TX_SERVICE
+        )
+        owners = set(safe_operator.safe_cli_info.owners)
+        signer = list(safe_operator.accounts)[0]
+        delegate_address = Account.create().address
+
+        self.assertEqual(safe_operator.get_permitted_signers(), owners)
+        self.assertEqual(safe_operator.get_permitted_signers(), owners)
+        get_delegates_mock.assert_called_once_with(safe_operator.address)
+
+        # Cache is updated in place
+        safe_operator.add_delegate(delegate_address, "Test", signer.address)
+        self.assertEqual(
+            safe_operator.get_permitted_signers(), owners | {delegate_address}
+        )
+        safe_operator.remove_delegate(delegate_address, signer.address)
+        self.assertEqual(safe_operator.get_permitted_signers(), owners)
+        get_delegates_mock.assert_called_once()
+
+        # `get_delegates` command refreshes the cache
+        get_delegates_mock.return_value = [
+            {
+                "safe": safe_operator.address,
+                "delegate": delegate_address,
+                "delegator": signer.address,
+                "label": "Test",
+            }
+        ]
+        safe_operator.get_delegates()
+        self.assertEqual(
+            safe_operator.get_permitted_signers(), owners | {delegate_address}
+        )
+        self.assertEqual(get_delegates_mock.call_count, 2)
+
+        # Expired
+        safe_operator.tx_service_cache.ttl = 0
+        safe_operator.tx_service_cache.invalidate()
+        safe_operator.get_permitted_signers()
+        safe_operator.get_permitted_signers()
+        self.assertEqual(get_delegates_mock.call_count, 4)
+
     @mock.patch.object(TransactionServiceApi, "delete_transaction", return_value=None)
     @mock.patch.object(TransactionServiceApi, "get_safe_transaction")
     @mock.patch(
@@ -205,6 +263,66 @@ class TestSafeTxServiceOperator(SafeCliTestCaseMixin, unittest.TestCase):
             }
             self.assertTrue(safe_operator.submit_signatures(safe_tx_hash))
 
+    @mock.patch.object(
+        SafeTx, "safe_version", return_value="1.4.1", new_callable=mock.PropertyMock
+    )
+    @mock.patch.object(TransactionServiceApi, "post_signatures", return_value=None)
+    @mock.patch.object(TransactionServiceApi, "_get_request")
+    def test_submit_signatures_batch(
+        self,
+        get_safe_transaction_mock: MagicMock,
+        post_signatures_mock: MagicMock,
+        safe_version_mock: mock.PropertyMock,
+    ):
+        get_safe_transaction_mock.side_effect = [
+            GetMultisigTxRequestMock(executed=False),
+            GetMultisigTxRequestMock(executed=True),
+            GetMultisigTxRequestMock(executed=False),
+        ]
+        safe_tx_hashes = [
+            HexBytes(
+                "0xae1c18dd9fca652b83743fc0b0ac2d396c68d523b49f4d41af5b00dc2f995bf6"
+            )
+        ] * 3
+        safe_operator = self.setup_operator(
+            number_owners=1, mode=SafeOperatorMode.TX_SERVICE
+        )
+        safe_operator.hw_wallet_manager = HwWalletManager()
+        with mock.patch.object(
+            safe_operator.hw_wallet_manager,
+            "sign_safe_txs",
+            wraps=safe_operator.hw_wallet_manager.sign_safe_txs,
+        ) as sign_safe_txs_mock:
+            safe_operator.hw_wallet_manager.wallets.add(FakeHwWallet("44'/60'/0'/0/0"))
+            safe_operator.safe_cli_info.threshold = 2
+            with mock.patch.object(
+                SafeTxServiceOperator,
+                "get_permitted_signers",
+                return_value={
+                    list(safe_operator.accounts)[0].address,
+                    list(safe_operator.hw_wallet_manager.wallets)[0].address,
+                },
+            ):
+                # Executed transaction is skipped
+                self.assertFalse(safe_operator.submit_signatures_batch(safe_tx_hashes))
+            # Hardware wallets sign every transaction in one call
+            sign_safe_txs_mock.assert_called_once()
+            self.assertEqual(len(sign_safe_txs_mock.call_args.args[0]), 2)
+
+        self.assertEqual(post_signatures_mock.call_count, 2)
+        for call in post_signatures_mock.call_args_list:
+            self.assertEqual(len(call.args[1]), 65 * 2)
+
+        # No suitable signers
+        get_safe_transaction_mock.side_effect = None
+        get_safe_transaction_mock.return_value = GetMultisigTxRequestMock(
+            executed=False
+        )
+        with mock.patch.object(
+            SafeTxServiceOperator, "get_permitted_signers", return_value=set()
+        ):
+            self.assertFalse(safe_operator.submit_signatures_batch(safe_tx_hashes))
+
     @mock.patch.object(TransactionServiceApi, "post_transaction", return_value=True)
     @mock.patch.object(
         SafeTx, "safe_version", return_value="1.4.1", new_callable=mock.PropertyMock
@@ -385,14 +503,28 @@ class TestSafeTxServiceOperator(SafeCliTestCaseMixin, unittest.TestCase):
         ]
         self.assertEqual(safe_operator.get_balances(), expected)
 
-    @mock.patch.object(TransactionServiceApi, "get_transactions", return_value=txs_mock)
-    def test_get_transaction_history(
-        self,
-        get_transactions_mock: MagicMock,
-    ):
+    def test_get_transaction_history(self):
         safe_operator = self.setup_operator(
             number_owners=1, mode=SafeOperatorMode.TX_SERVICE
         )
+        # One transaction per page
+        next_url = "https://tx-service/multisig-transactions/?cursor=2"
+
+        def get(url, **kwargs):
+            response = MagicMock(ok=True)
+            if url == next_url:
+                response.json.return_value = {"next": None, "results": txs_mock[1:]}
+            else:
+                response.json.return_value = {
+                    "next": next_url,
+                    "results": txs_mock[:1],
+                }
+            return response
+
+        http_session_get_mock = MagicMock(side_effect=get)
+        safe_operator.safe_tx_service.http_session = MagicMock(
+            get=http_session_get_mock
+        )
         expected = [
             ["ETHER", "0.17100", "Ξ", 18, ""],
             [
@@ -553,7 +685,118 @@ class TestSafeTxServiceOperator(SafeCliTestCaseMixin, unittest.TestCase):
                 "transfer: 0xc6b82bA149CFA113f8f48d5E3b1F78e933e16DfD,1000000000000000000",
             ],
         ]
-        self.assertEqual(safe_operator.get_transaction_history(), expected)
+        self.assertEqual(list(safe_operator.iter_transaction_history_rows()), expected)
+        self.assertEqual(http_session_get_mock.call_count, 2)
+
+        with mock.patch("builtins.print") as print_mock:
+            self.assertEqual(safe_operator.get_transaction_history(), 2)
+            print_mock.assert_called_once()  # Both pages fit in one table
+
+            print_mock.reset_mock()
+            self.assertEqual(
+                safe_operator.get_transaction_history(output_format="jsonl"), 2
+            )
+            self.assertEqual(
+                [json.loads(call.args[0]) for call in print_mock.call_args_list],
+                txs_mock,
+            )
+
+        # Next page is not requested if limit is reached
+        http_session_get_mock.reset_mock()
+        self.assertEqual(
+            list(safe_operator.iter_transaction_history(limit=1, since_nonce=200)),
+            txs_mock[:1],
+        )
+        http_session_get_mock.assert_called_once()
+        self.assertIn("limit=1", http_session_get_mock.call_args.args[0])
+        self.assertIn("nonce__gte=200", http_session_get_mock.call_args.args[0])
+
+        http_session_get_mock.side_effect = None
+        http_session_get_mock.return_value = MagicMock(ok=False, content=b"Error")
+        with self.assertRaisesRegex(SafeAPIException, "Cannot get .*multisig"):
+            safe_operator.get_transaction_history()
+
+    @mock.patch.object(
+        SafeTx, "safe_version", return_value="1.4.1", new_callable=mock.PropertyMock
+    )
+    def test_sync_tx_service(self, safe_version_mock: mock.PropertyMock):
+        safe_operator = self.setup_operator(
+            number_owners=1, mode=SafeOperatorMode.TX_SERVICE
+        )
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        safe_operator.tx_service_mirror = TxServiceMirror(
+            Path(cache_dir.name) / "mirror.sqlite3"
+        )
+        self.addCleanup(safe_operator.tx_service_mirror.close)
+        multisig_tx = GetMultisigTxRequestMock(executed=False).json()
+        delegate = {
+            "safe": safe_operator.address,
+            "delegate": Account.create().address,
+            "delegator": Account.create().address,
+            "label": "Test",
+        }
+
+        def get(url, **kwargs):
+            response = MagicMock(ok=True)
+            if "multisig-transactions" in url:
+                results = [*txs_mock, multisig_tx]
+            elif "delegates" in url:
+                results = [delegate]
+            else:
+                results = []
+            response.json.return_value = {"next": None, "results": results}
+            return response
+
+        http_session_get_mock = MagicMock(side_effect=get)
+        safe_operator.safe_tx_service.http_session = MagicMock(
+            get=http_session_get_mock
+        )
+        self.assertFalse(safe_operator.is_tx_service_mirror_synced())
+        self.assertTrue(safe_operator.sync_tx_service())
+        self.assertTrue(safe_operator.is_tx_service_mirror_synced())
+
+        # Read-only commands are served from the mirror
+        http_session_get_mock.reset_mock()
+        self.assertEqual(
+            [tx["nonce"] for tx in safe_operator.iter_transaction_history()],
+            [213, 212, 6],
+        )
+        self.assertEqual(safe_operator.get_delegates()[0][0], delegate["delegate"])
+        http_session_get_mock.assert_not_called()
+
+        # Transactions to sign or execute are always retrieved from the tx service
+        with mock.patch.object(
+            TransactionServiceApi,
+            "get_safe_transaction",
+            return_value=("safe_tx", None),
+        ) as get_safe_transaction_mock:
+            safe_operator.get_safe_transactions([HexBytes(multisig_tx["safeTxHash"])])
+            get_safe_transaction_mock.assert_called_once_with(
+                HexBytes(multisig_tx["safeTxHash"])
+            )
+
+        # Expired mirror is synced before reading
+        safe_operator.tx_service_mirror.expire(
+            safe_operator.safe_tx_service.network.value, safe_operator.address
+        )
+        list(safe_operator.iter_transaction_history())
+        self.assertIn("modified__gte", http_session_get_mock.call_args_list[0].args[0])
+
+        # Stored data is used if tx service cannot be reached
+        http_session_get_mock.reset_mock()
+        http_session_get_mock.side_effect = RequestException
+        with mock.patch.object(
+            safe_operator.tx_service_mirror, "get_synced_at", return_value=1.0
+        ):
+            self.assertEqual(len(list(safe_operator.iter_transaction_history())), 3)
+        http_session_get_mock.assert_called_once()
+        http_session_get_mock.side_effect = get
+
+        # Sync failures are reported
+        http_session_get_mock.side_effect = None
+        http_session_get_mock.return_value = MagicMock(ok=False, content=b"Error")
+        self.assertFalse(safe_operator.sync_tx_service())
 
     def test_data_decoded_to_text(self):
         safe_operator = self.setup_operator(
@@ -662,7 +905,7 @@ class TestSafeTxServiceOperator(SafeCliTestCaseMixin, unittest.TestCase):
 
         safe_tx_mock = MagicMock()
         safe_tx_mock.safe_nonce = 0
-        batch_safe_txs_mock = MagicMock(return_value=None)
+        batch_safe_txs_mock = MagicMock(return_value=[])
 
         with (
             mock.patch.object(
@@ -0,0 +1,128 @@
+import unittest
+from unittest import mock
+
+from eth_abi import encode as encode_abi
+from eth_account import Account
+from web3.exceptions import Web3RPCError
+
+from safe_cli import token_balances
+from safe_cli.rpc_batch import MulticallNotDeployed
+from safe_cli.token_balances import TokenBalance, get_token_balances
+
+from .safe_cli_test_case_mixin import SafeCliTestCaseMixin
+
+
+class TestTokenBalances(SafeCliTestCaseMixin, unittest.TestCase):
+    def test_get_token_balances(self):
+        address = Account.create().address
+        token_addresses = [Account.create().address for _ in range(5)]
+        token_results = [
+            encode_abi(["uint256"], [10**18]),
+            encode_abi(["uint8"], [18]),
+            encode_abi(["string"], ["DAI"]),
+            encode_abi(["string"], ["Dai Stablecoin"]),
+        ]
+
+        def aggregate3(ethereum_client, multicall_address, calls, block_identifier):
+            # Tokens like MKR return `bytes32` for `symbol` and `name`
+            results = token_results[:2] + [b"MKR".ljust(32, b"\0"), None]
+            return results * (len(calls) // len(token_results))
+
+        with mock.patch.object(
+            token_balances, "multicall3_aggregate3", side_effect=aggregate3
+        ) as aggregate3_mock:
+            balances = get_token_balances(
+                self.ethereum_client, address, token_addresses, chunk_size=2
+            )
+        # Tokens are retrieved in chunks
+        self.assertEqual(aggregate3_mock.call_count, 3)
+        self.assertEqual(len(aggregate3_mock.call_args_list[0].args[2]), 8)
+        self.assertEqual(balances[0], TokenBalance(None, 0, 18, "Ξ", "ETHER"))
+        self.assertEqual(
+            balances[1:],
+            [
+                TokenBalance(token_address, 10**18, 18, "MKR", None)
+                for token_address in token_addresses
+            ],
+        )
+
+        # JSON-RPC batch is used if Multicall3 is not available
+        with (
+            mock.patch.object(
+                token_balances,
+                "multicall3_aggregate3",
+                side_effect=MulticallNotDeployed("Multicall3 not deployed"),
+            ),
+            mock.patch.object(
+                token_balances,
+                "batch_rpc_request",
+                return_value=["0x" + result.hex() for result in token_results],
+            ) as batch_rpc_request_mock,
+        ):
+            self.assertEqual(
+                get_token_balances(
+                    self.ethereum_client,
+                    address,
+                    token_addresses[:1],
+                    include_native_balance=False,
+                ),
+                [TokenBalance(token_addresses[0], 10**18, 18, "DAI", "Dai Stablecoin")],
+            )
+            batch_rpc_request_mock.assert_called_once()
+
+        # Other Multicall3 errors are not retried with a JSON-RPC batch
+        with (
+            mock.patch.object(
+                token_balances,
+                "multicall3_aggregate3",
+                side_effect=ValueError("Response too big"),
+            ),
+            mock.patch.object(token_balances, "batch_rpc_request") as batch_mock,
+        ):
+            with self.assertRaisesRegex(ValueError, "Response too big"):
+                token_balances._call_many(
+                    self.ethereum_client, [(token_addresses[0], "0x")], "latest"
+                )
+            batch_mock.assert_not_called()
+
+        # Chunk is halved if the node rejects the request
+        def call_many(ethereum_client, calls, block_identifier):
+            if len(calls) > 2 * len(token_results):
+                raise ValueError("Response too big")
+            return token_results * (len(calls) // len(token_results))
+
+        with mock.patch.object(
+            token_balances, "_call_many", side_effect=call_many
+        ) as call_many_mock:
+            balances = get_token_balances(
+                self.ethereum_client,
+                address,
+                token_addresses,
+                include_native_balance=False,
+                chunk_size=4,
+            )
+            self.assertEqual(
+                [balance.token_address for balance in balances], token_addresses
+            )
+            self.assertEqual(
+                [len(call.args[1]) for call in call_many_mock.call_args_list],
+                [16, 8, 8, 4],
+            )
+
+        with mock.patch.object(
+            token_balances, "_call_many", side_effect=ValueError("Response too big")
+        ):
+            with self.assertRaises(ValueError):
+                get_token_balances(self.ethereum_client, address, token_addresses)
+
+        # Node errors not subclassing `ValueError` are raised for a one token chunk
+        with mock.patch.object(
+            token_balances, "_call_many", side_effect=Web3RPCError("execution reverted")
+        ) as call_many_mock:
+            with self.assertRaises(Web3RPCError):
+                get_token_balances(self.ethereum_client, address, token_addresses[:1])
+            call_many_mock.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from eth_account import Account
+
+from safe_cli import chain_cache, token_index
+from safe_cli.token_index import (
+    TOKEN_INDEX_REORG_BLOCKS,
+    TokenIndex,
+    get_safe_tokens,
+    get_token_index,
+)
+
+from .safe_cli_test_case_mixin import SafeCliTestCaseMixin
+
+
+@mock.patch.object(chain_cache, "NOT_CACHED_CHAIN_IDS", frozenset())
+class TestTokenIndex(SafeCliTestCaseMixin, unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.environ_patch = mock.patch.dict(
+            os.environ, {"SAFE_CLI_CACHE_DIR": self.cache_dir.name}
+        )
+        self.environ_patch.start()
+        get_token_index.cache_clear()
+
+    def tearDown(self) -> None:
+        super().tearDown()
+        get_token_index.cache_clear()
+        self.environ_patch.stop()
+        self.cache_dir.cleanup()
+
+    def test_token_index(self):
+        index = get_token_index()
+        safe_address = Account.create().address
+        tokens = {Account.create().address for _ in range(2)}
+        self.assertEqual(index.get_tokens(1, safe_address), (set(), None))
+        index.set_tokens(1, safe_address, tokens, 100)
+        index.set_tokens(100, safe_address, tokens, 200)
+
+        # Persisted
+        index = TokenIndex(index.path)
+        self.assertEqual(index.get_tokens(1, safe_address), (tokens, 100))
+        index.invalidate(1)
+        self.assertEqual(index.get_tokens(1, safe_address), (set(), None))
+        self.assertEqual(index.get_tokens(100, safe_address), (tokens, 200))
+        index.invalidate()
+        self.assertEqual(
+            TokenIndex(index.path).get_tokens(100, safe_address), (set(), None)
+        )
+
+    def test_get_safe_tokens(self):
+        safe_address = Account.create().address
+        token_addresses = [Account.create().address for _ in range(2)]
+        with (
+            mock.patch.object(token_index, "get_deployment_block", return_value=50),
+            mock.patch.object(
+                token_index, "get_erc_20_list", return_value={token_addresses[0]}
+            ) as get_erc_20_list_mock,
+            mock.patch.object(
+                token_index, "get_erc_20_received_list", return_value=set()
+            ) as get_erc_20_received_list_mock,
+        ):
+            self.assertEqual(
+                get_safe_tokens(self.ethereum_client, safe_address, to_block=1_000),
+                {token_addresses[0]},
+            )
+            get_erc_20_list_mock.assert_called_once_with(
+                self.ethereum_client, safe_address, 50, 1_000
+            )
+            # Tokens sent to the counterfactual address before deployment
+            get_erc_20_received_list_mock.assert_called_once_with(
+                self.ethereum_client, safe_address, 0, 49
+            )
+
+            # Only new blocks are scanned, tokens found before are kept
+            get_erc_20_list_mock.reset_mock()
+            get_erc_20_list_mock.return_value = {token_addresses[1]}
+            self.assertEqual(
+                get_safe_tokens(self.ethereum_client, safe_address, to_block=2_000),
+                set(token_addresses),
+            )
+            get_erc_20_list_mock.assert_called_once_with(
+                self.ethereum_client,
+                safe_address,
+                1_000 - TOKEN_INDEX_REORG_BLOCKS + 1,
+                2_000,
+            )
+            get_erc_20_received_list_mock.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+from unittest import mock
+
+from safe_cli.ttl_cache import TtlCache
+
+
+class TestTtlCache(unittest.TestCase):
+    def test_ttl_cache(self):
+        ttl_cache = TtlCache(ttl=10)
+        fetch = mock.MagicMock(return_value=[1])
+        with mock.patch("safe_cli.ttl_cache.time.monotonic", return_value=100):
+            self.assertEqual(ttl_cache.get_or_set("key", fetch), [1])
+            self.assertEqual(ttl_cache.get_or_set("key", fetch), [1])
+            fetch.assert_called_once()
+            self.assertIn("key", ttl_cache)
+            self.assertTrue(ttl_cache.update("key", lambda value: [*value, 2]))
+            self.assertFalse(ttl_cache.update("missing", lambda value: value))
+            self.assertEqual(ttl_cache.get("key"), [1, 2])
+
+        # Update keeps the expiration
+        with mock.patch("safe_cli.ttl_cache.time.monotonic", return_value=110):
+            self.assertNotIn("key", ttl_cache)
+            self.assertIsNone(ttl_cache.get("key"))
+            self.assertEqual(ttl_cache.get_or_set("key", fetch), [1])
+            self.assertEqual(fetch.call_count, 2)
+
+            ttl_cache.set("other", 1)
+            ttl_cache.invalidate("key")
+            self.assertNotIn("key", ttl_cache)
+            self.assertIn("other", ttl_cache)
+            ttl_cache.invalidate()
+            self.assertNotIn("other", ttl_cache)
+
+
+if __name__ == "__main__":
+    unittest.main()
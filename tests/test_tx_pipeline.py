@@ -0,0 +1,110 @@
+import unittest
+from unittest import mock
+from unittest.mock import MagicMock
+
+from eth_account import Account
+from hexbytes import HexBytes
+
+from safe_cli.tx_pipeline import SafeTxPipeline
+
+from .safe_cli_test_case_mixin import SafeCliTestCaseMixin
+
+
+class TestSafeTxPipeline(SafeCliTestCaseMixin, unittest.TestCase):
+    def send_safe_tx(self, safe_tx, gas, gas_price, nonce) -> HexBytes:
+        tx_hash, _ = safe_tx.execute(
+            self.ethereum_test_account.key,
+            tx_gas=gas,
+            tx_gas_price=gas_price,
+            tx_nonce=nonce,
+        )
+        return tx_hash
+
+    def test_execute(self):
+        safe_operator = self.setup_operator()
+        self.send_ether(safe_operator.address, 3)
+        safe_nonce = safe_operator.safe.retrieve_nonce()
+        accounts = [Account.create() for _ in range(3)]
+        safe_txs = [
+            safe_operator.prepare_safe_transaction(
+                account.address, 1, b"", safe_nonce=safe_nonce + i
+            )
+            for i, account in enumerate(accounts)
+        ]
+        sender_nonce = self.ethereum_client.get_nonce_for_account(
+            self.ethereum_test_account.address
+        )
+        updates = []
+        pipelined_txs = SafeTxPipeline(
+            self.ethereum_client,
+            self.ethereum_test_account.address,
+            self.send_safe_tx,
+            poll_interval=0,
+        ).execute(safe_txs, on_update=updates.append)
+
+        for i, pipelined_tx in enumerate(pipelined_txs):
+            self.assertTrue(pipelined_tx.succeeded)
+            self.assertEqual(pipelined_tx.nonce, sender_nonce + i)
+            self.assertEqual(len(pipelined_tx.tx_hashes), 1)
+        self.assertEqual(len(updates), 6)  # Sent and mined
+        self.assertEqual(safe_operator.safe.retrieve_nonce(), safe_nonce + 3)
+        for account in accounts:
+            self.assertEqual(self.ethereum_client.get_balance(account.address), 1)
+
+    @mock.patch("safe_cli.tx_pipeline.estimate_safe_tx_gas", return_value=100_000)
+    def test_replace_stuck_transactions(self, estimate_safe_tx_gas_mock: MagicMock):
+        ethereum_client = MagicMock()
+        ethereum_client.get_nonce_for_account.return_value = 7
+        ethereum_client.w3.eth.gas_price = 10
+        sent = []
+
+        def send_safe_tx(safe_tx, gas, gas_price, nonce) -> HexBytes:
+            sent.append((gas_price, nonce))
+            return HexBytes(len(sent).to_bytes(32, "big"))
+
+        # Nothing mined on first poll, then only first replacement and second tx
+        def get_transaction_receipts(tx_hashes):
+            if len(sent) < 3:
+                return [None] * len(tx_hashes)
+            return [
+                {"transactionHash": tx_hash, "blockNumber": 1, "status": 1}
+                if tx_hash in (sent_hash(2), sent_hash(3))
+                else None
+                for tx_hash in tx_hashes
+            ]
+
+        def sent_hash(position: int) -> HexBytes:
+            return HexBytes(position.to_bytes(32, "big"))
+
+        ethereum_client.get_transaction_receipts.side_effect = get_transaction_receipts
+        pipeline = SafeTxPipeline(
+            ethereum_client, Account.create().address, send_safe_tx, 0, 0
+        )
+        first, second = pipeline.execute([MagicMock(), MagicMock()])
+        self.assertEqual(sent, [(10, 7), (10, 8), (12, 7)])
+        self.assertTrue(first.succeeded)
+        self.assertEqual(first.tx_hashes, [sent_hash(1), sent_hash(3)])
+        self.assertEqual(first.tx_hash, sent_hash(3))
+        self.assertTrue(second.succeeded)
+
+        # Never mined
+        sent.clear()
+        ethereum_client.get_transaction_receipts.side_effect = lambda tx_hashes: (
+            [None] * len(tx_hashes)
+        )
+        pipeline.max_replacements = 1
+        first, second = pipeline.execute([MagicMock(), MagicMock()])
+        self.assertEqual(sent, [(10, 7), (10, 8), (12, 7)])
+        self.assertIn("not mined after 1 replacements", first.error)
+        self.assertEqual(second.error, "Previous transaction was not mined")
+
+        # Cannot be sent
+        pipeline.send_safe_tx = MagicMock(side_effect=ValueError("Nonce too low"))
+        first, second = pipeline.execute([MagicMock(), MagicMock()])
+        self.assertEqual(first.error, "Nonce too low")
+        self.assertEqual(second.error, "Previous transaction was not sent")
+        pipeline.send_safe_tx.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
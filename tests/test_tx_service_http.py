@@ -0,0 +1,63 @@
+import unittest
+from unittest import mock
+from unittest.mock import MagicMock
+
+from safe_eth.eth import EthereumNetwork
+from safe_eth.safe import SafeTx
+from safe_eth.safe.api import SafeAPIException, TransactionServiceApi
+
+from safe_cli.tx_service_http import (
+    build_safe_tx,
+    get_tx_service_headers,
+    tx_service_get,
+)
+
+from .mocks.multisig_tx_mock import GetMultisigTxRequestMock
+
+
+class TestTxServiceHttp(unittest.TestCase):
+    def test_tx_service_get(self):
+        safe_tx_service = TransactionServiceApi(EthereumNetwork.SEPOLIA)
+        self.assertEqual(get_tx_service_headers(safe_tx_service), {})
+        safe_tx_service.api_key = "api-key"
+        self.assertEqual(
+            get_tx_service_headers(safe_tx_service),
+            {"Authorization": "Bearer api-key"},
+        )
+
+        safe_tx_service.http_session = MagicMock()
+        tx_service_get(safe_tx_service, "/api/v1/about/")
+        tx_service_get(safe_tx_service, "https://example.com/api/v1/about/?cursor=2")
+        self.assertEqual(
+            [call.args[0] for call in safe_tx_service.http_session.get.call_args_list],
+            [
+                f"{safe_tx_service.base_url.rstrip('/')}/api/v1/about/",
+                "https://example.com/api/v1/about/?cursor=2",
+            ],
+        )
+        self.assertEqual(
+            safe_tx_service.http_session.get.call_args.kwargs,
+            {
+                "headers": {"Authorization": "Bearer api-key"},
+                "timeout": safe_tx_service.request_timeout,
+            },
+        )
+
+    @mock.patch.object(SafeTx, "safe_version", "1.3.0")
+    def test_build_safe_tx(self):
+        tx_raw = GetMultisigTxRequestMock(executed=True).json()
+        safe_tx = build_safe_tx(
+            None, EthereumNetwork.SEPOLIA.value, tx_raw["safeTxHash"], tx_raw
+        )
+        self.assertEqual(safe_tx.safe_tx_hash.to_0x_hex(), tx_raw["safeTxHash"])
+        self.assertEqual(safe_tx.safe_nonce, int(tx_raw["nonce"]))
+        self.assertTrue(safe_tx.signatures)
+
+        with self.assertRaisesRegex(SafeAPIException, "doesn't match"):
+            build_safe_tx(
+                None, EthereumNetwork.MAINNET.value, tx_raw["safeTxHash"], tx_raw
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,233 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+from urllib.parse import parse_qs, urlparse
+
+from eth_account import Account
+from hexbytes import HexBytes
+from safe_eth.eth import EthereumNetwork
+from safe_eth.util.util import to_0x_hex_str
+
+from safe_cli.tx_service_mirror import TxServiceMirror
+
+
+def build_tx(nonce: int, modified: str, owners: list[str]) -> dict:
+    return {
+        "safeTxHash": "0x" + (nonce + 1).to_bytes(32, "big").hex().upper(),
+        "nonce": nonce,
+        "modified": modified,
+        "transactionHash": None,
+        "confirmations": [
+            {"owner": owner, "signature": "0x12", "signatureType": "EOA"}
+            for owner in owners
+        ],
+    }
+
+
+class TestTxServiceMirror(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.mirror = TxServiceMirror(Path(self.cache_dir.name) / "mirror.sqlite3")
+        self.safe_address = Account.create().address
+        self.chain_id = EthereumNetwork.SEPOLIA.value
+        self.pages: dict[str, list[dict]] = {}
+        self.requested_urls = []
+
+        def get(url, **kwargs):
+            self.requested_urls.append(url)
+            parsed_url = urlparse(url)
+            results = self.pages.get(parsed_url.path, [])
+            # Paginate two items per page
+            offset = int(parse_qs(parsed_url.query).get("offset", ["0"])[0])
+            response = MagicMock(ok=True)
+            response.json.return_value = {
+                "next": (
+                    f"{url.split('&offset=')[0]}&offset={offset + 2}"
+                    if offset + 2 < len(results)
+                    else None
+                ),
+                "results": results[offset : offset + 2],
+            }
+            return response
+
+        self.safe_tx_service = MagicMock(
+            base_url="https://tx-service",
+            network=EthereumNetwork.SEPOLIA,
+            api_key=None,
+            request_timeout=10,
+        )
+        self.safe_tx_service.http_session.get.side_effect = get
+
+    def tearDown(self):
+        self.mirror.close()
+        self.cache_dir.cleanup()
+
+    def test_sync(self):
+        owner = Account.create().address
+        transactions_path = f"/api/v2/safes/{self.safe_address}/multisig-transactions/"
+
+        # Reads do not create the database
+        self.assertIsNone(self.mirror.get_synced_at(self.chain_id, self.safe_address))
+        self.assertEqual(
+            list(
+                self.mirror.iter_multisig_transactions(self.chain_id, self.safe_address)
+            ),
+            [],
+        )
+        self.assertFalse(self.mirror.path.exists())
+
+        self.pages = {
+            transactions_path: [
+                build_tx(0, "2024-01-01T00:00:00Z", [owner]),
+                build_tx(1, "2024-01-02T00:00:00Z", []),
+                build_tx(2, "2024-01-03T00:00:00Z", []),
+            ],
+            f"/api/v1/safes/{self.safe_address}/messages/": [
+                {"messageHash": "0x" + "AB" * 32, "message": "hello"}
+            ],
+            "/api/v2/delegates/": [
+                {"delegate": owner, "delegator": owner, "label": "test"}
+            ],
+        }
+        result = self.mirror.sync(self.safe_tx_service, self.safe_address)
+        self.assertEqual(
+            (result.transactions, result.messages, result.delegates), (3, 1, 1)
+        )
+        self.assertIsNotNone(
+            self.mirror.get_synced_at(self.chain_id, self.safe_address)
+        )
+        self.assertNotIn("modified__gte", self.requested_urls[0])
+        self.assertEqual(
+            [
+                tx["nonce"]
+                for tx in self.mirror.iter_multisig_transactions(
+                    self.chain_id, self.safe_address
+                )
+            ],
+            [2, 1, 0],
+        )
+        self.assertEqual(
+            [
+                tx["nonce"]
+                for tx in self.mirror.iter_multisig_transactions(
+                    self.chain_id, self.safe_address, since_nonce=1, limit=1
+                )
+            ],
+            [2],
+        )
+        safe_tx_hash = HexBytes(build_tx(0, "", [])["safeTxHash"])
+        self.assertEqual(
+            list(
+                self.mirror.get_multisig_transactions(
+                    self.chain_id, [safe_tx_hash, HexBytes(32)]
+                )
+            ),
+            [safe_tx_hash],
+        )
+        self.assertEqual(
+            [
+                confirmation["owner"]
+                for confirmation in self.mirror.get_confirmations(
+                    self.chain_id, safe_tx_hash
+                )
+            ],
+            [owner],
+        )
+        self.assertEqual(
+            self.mirror.get_message(self.chain_id, HexBytes("0x" + "ab" * 32))[
+                "message"
+            ],
+            "hello",
+        )
+        self.assertEqual(
+            self.mirror.get_delegates(self.chain_id, self.safe_address)[0]["label"],
+            "test",
+        )
+
+        # Only changes since the last sync are requested
+        self.requested_urls.clear()
+        self.pages[transactions_path] = [
+            build_tx(0, "2024-01-04T00:00:00Z", [owner, Account.create().address]),
+            build_tx(3, "2024-01-05T00:00:00Z", []),
+        ]
+        self.pages["/api/v2/delegates/"] = []
+        result = self.mirror.sync(self.safe_tx_service, self.safe_address)
+        self.assertEqual(
+            (result.transactions, result.messages, result.delegates), (2, 1, 0)
+        )
+        self.assertEqual(
+            parse_qs(urlparse(self.requested_urls[0]).query)["modified__gte"],
+            ["2024-01-03T00:00:00Z"],
+        )
+        self.assertEqual(
+            len(self.mirror.get_confirmations(self.chain_id, safe_tx_hash)), 2
+        )
+        self.assertEqual(
+            len(
+                list(
+                    self.mirror.iter_multisig_transactions(
+                        self.chain_id, self.safe_address
+                    )
+                )
+            ),
+            4,
+        )
+        self.assertEqual(
+            self.mirror.get_delegates(self.chain_id, self.safe_address), []
+        )
+
+        # Writes of the cli update the affected rows
+        response = MagicMock(ok=True)
+        response.json.return_value = build_tx(0, "2024-01-06T00:00:00Z", [])
+        self.safe_tx_service.http_session.get.side_effect = None
+        self.safe_tx_service.http_session.get.return_value = response
+        self.mirror.refresh_multisig_transaction(
+            self.safe_tx_service, self.safe_address, safe_tx_hash
+        )
+        self.assertEqual(
+            self.safe_tx_service.http_session.get.call_args.args[0],
+            "https://tx-service/api/v2/multisig-transactions/"
+            f"{to_0x_hex_str(HexBytes(safe_tx_hash))}/",
+        )
+        self.assertEqual(self.mirror.get_confirmations(self.chain_id, safe_tx_hash), [])
+        self.mirror.store_delegate(
+            self.chain_id,
+            self.safe_address,
+            {"delegate": owner, "delegator": owner, "label": "new"},
+        )
+        self.assertEqual(
+            self.mirror.get_delegates(self.chain_id, self.safe_address)[0]["label"],
+            "new",
+        )
+        self.mirror.delete_delegate(self.chain_id, self.safe_address, owner, owner)
+        self.assertEqual(
+            self.mirror.get_delegates(self.chain_id, self.safe_address), []
+        )
+        self.mirror.delete_message(self.chain_id, "0x" + "ab" * 32)
+        self.assertIsNone(self.mirror.get_message(self.chain_id, "0x" + "ab" * 32))
+        self.mirror.expire(self.chain_id, self.safe_address)
+        self.assertEqual(self.mirror.get_synced_at(self.chain_id, self.safe_address), 1)
+
+        self.mirror.delete_multisig_transaction(self.chain_id, safe_tx_hash)
+        self.assertEqual(
+            self.mirror.get_multisig_transactions(self.chain_id, [safe_tx_hash]), {}
+        )
+        self.assertEqual(self.mirror.get_confirmations(self.chain_id, safe_tx_hash), [])
+
+        self.mirror.invalidate(self.chain_id + 1)
+        self.assertIsNotNone(
+            self.mirror.get_synced_at(self.chain_id, self.safe_address)
+        )
+        self.mirror.invalidate(self.chain_id, self.safe_address)
+        self.assertIsNone(self.mirror.get_synced_at(self.chain_id, self.safe_address))
+        self.assertEqual(
+            list(
+                self.mirror.iter_multisig_transactions(self.chain_id, self.safe_address)
+            ),
+            [],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
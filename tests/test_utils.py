@@ -4,8 +4,19 @@ from unittest import mock
 from unittest.mock import MagicMock
 
 from eth_account import Account
+from requests import RequestException
+from safe_eth.eth.contracts import get_example_erc20_contract
+from web3.exceptions import Web3RPCError
 
-from safe_cli.utils import choose_option_from_list, yes_or_no_question
+from safe_cli.utils import (
+    choose_option_from_list,
+    get_deployment_block,
+    get_erc_20_received_list,
+    scan_block_range,
+    yes_or_no_question,
+)
+
+from .safe_cli_test_case_mixin import SafeCliTestCaseMixin
 
 
 class TestUtils(unittest.TestCase):
@@ -54,6 +65,82 @@ class TestUtils(unittest.TestCase):
 
         os.environ["PYTEST_CURRENT_TEST"] = pytest_current_test
 
+    def test_scan_block_range(self):
+        event_blocks = [5, 6, 7, 8, 9, 10, 950_000, 1_999_999]
+        requested_ranges = []
+
+        def fetch_logs(from_block: int, to_block: int) -> list[int]:
+            requested_ranges.append((from_block, to_block))
+            logs = [block for block in event_blocks if from_block <= block <= to_block]
+            if len(logs) > 2:
+                raise Web3RPCError("query returned more than 2 results")
+            return logs
+
+        self.assertEqual(
+            scan_block_range(fetch_logs, 0, 1_999_999, block_step=100_000),
+            event_blocks,
+        )
+        self.assertEqual(scan_block_range(fetch_logs, 10, 9), [])
+        # Windows grow on sparse ranges, so much less than 100 requests are needed
+        requested_ranges.clear()
+        self.assertEqual(
+            scan_block_range(
+                fetch_logs, 1_000_000, 1_999_999, block_step=10_000, max_workers=1
+            ),
+            [1_999_999],
+        )
+        self.assertLess(len(requested_ranges), 10)
+
+        event_blocks = [1, 1, 1]  # Too many results for a single block
+        with self.assertRaises(Web3RPCError):
+            scan_block_range(fetch_logs, 0, 100)
+
+        # Connection errors are not retried with smaller windows
+        fetch_logs_mock = MagicMock(side_effect=RequestException("Connection refused"))
+        with self.assertRaises(RequestException):
+            scan_block_range(fetch_logs_mock, 0, 100)
+        fetch_logs_mock.assert_called_once_with(0, 100)
+
+
+class TestUtilsEthereum(SafeCliTestCaseMixin, unittest.TestCase):
+    def test_get_deployment_block(self):
+        safe = self.deploy_test_safe()
+        last_block = self.ethereum_client.current_block_number
+        deployment_block = get_deployment_block(
+            self.ethereum_client, safe.address, last_block
+        )
+        self.assertTrue(self.w3.eth.get_code(safe.address, deployment_block))
+        self.assertFalse(self.w3.eth.get_code(safe.address, deployment_block - 1))
+
+    def test_get_erc_20_received_list(self):
+        sender = self.ethereum_test_account
+        tx_params = {"from": sender.address, "gasPrice": self.w3.eth.gas_price}
+        tx_hash = self.send_tx(
+            get_example_erc20_contract(self.w3)
+            .constructor("Token", "TKN", 18, sender.address, 10)
+            .build_transaction(tx_params),
+            sender,
+        )
+        erc20 = get_example_erc20_contract(
+            self.w3, self.w3.eth.get_transaction_receipt(tx_hash)["contractAddress"]
+        )
+        receiver = Account.create().address
+        self.send_tx(
+            erc20.functions.transfer(receiver, 1).build_transaction(tx_params), sender
+        )
+        last_block = self.ethereum_client.current_block_number
+        self.assertEqual(
+            get_erc_20_received_list(self.ethereum_client, receiver, 0, last_block),
+            {erc20.address},
+        )
+        # Tokens sent are not included
+        self.assertEqual(
+            get_erc_20_received_list(
+                self.ethereum_client, Account.create().address, 0, last_block
+            ),
+            set(),
+        )
+
 
 if __name__ == "__main__":
     unittest.main()